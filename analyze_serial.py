@@ -1,11 +1,35 @@
 #!/usr/bin/env python3
 """分析序列埠資料以找出封包格式"""
 
+import numpy as np
 import serial
 import time
+from serial.threaded import Protocol, ReaderThread
 
 PORT = '/dev/cu.usbserial-0001'
 BAUDRATE = 9600
+HEADER = b'\xd2\xd2\xd2'  # WL-EMG 已知封包標頭
+
+
+def find_header_positions(buffer, header=HEADER):
+    """以 bytes.find（C 實作）找出所有標頭位置"""
+    positions = []
+    i = buffer.find(header)
+    while i != -1:
+        positions.append(i)
+        i = buffer.find(header, i + 1)
+    return positions
+
+
+class Collector(Protocol):
+    """ReaderThread 在收到資料時回呼，累積所有 bytes"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+
 
 def analyze_data(duration=5):
     """收集並分析資料"""
@@ -14,39 +38,41 @@ def analyze_data(duration=5):
     ser = serial.Serial(
         port=PORT,
         baudrate=BAUDRATE,
-        timeout=1.0
+        timeout=0.05  # 讓 ReaderThread 結束時能及時跳出 read()
     )
     
-    buffer = bytearray()
-    start_time = time.time()
-    
-    while time.time() - start_time < duration:
-        if ser.in_waiting > 0:
-            data = ser.read(ser.in_waiting)
-            buffer.extend(data)
-        time.sleep(0.1)
-    
-    ser.close()
+    # 由背景執行緒阻塞讀取並回呼 data_received，主執行緒只需等待
+    with ReaderThread(ser, Collector) as collector:
+        time.sleep(duration)
+    buffer = collector.buffer
     
     print(f"\n收集到 {len(buffer)} bytes")
     print("\n前 200 bytes (hex):")
-    print(' '.join(f'{b:02x}' for b in buffer[:200]))
+    print(buffer[:200].hex(' '))
     
     print("\n\n尋找重複模式...")
     
+    header_positions = find_header_positions(buffer)
+    print(f"\n已知標頭 {HEADER.hex()} 出現 {len(header_positions)} 次")
+    
     # 尋找可能的標頭（3-byte 重複模式）
-    header_candidates = {}
-    for i in range(len(buffer) - 28):
-        pattern = bytes(buffer[i:i+3])
-        if pattern not in header_candidates:
-            header_candidates[pattern] = []
-        header_candidates[pattern].append(i)
+    # 以 NumPy 一次算出每個位置的 24-bit 滑動鍵值，再用 np.unique 統計次數
+    n = len(buffer) - 28
+    if n <= 0:
+        return
+    b = np.frombuffer(buffer, dtype=np.uint8).astype(np.uint32)
+    keys = (b[:n] << 16) | (b[1:n + 1] << 8) | b[2:n + 2]
+    patterns, counts = np.unique(keys, return_counts=True)
+    top = np.argsort(counts, kind='stable')[::-1][:10]
     
     # 找出出現次數最多且間隔約 29 bytes 的模式
     print("\n最常見的 3-byte 模式（可能是標頭）：")
-    sorted_patterns = sorted(header_candidates.items(), key=lambda x: len(x[1]), reverse=True)
+    sorted_patterns = [
+        (int(patterns[i]).to_bytes(3, 'big'), np.flatnonzero(keys == patterns[i]).tolist())
+        for i in top
+    ]
     
-    for pattern, positions in sorted_patterns[:10]:
+    for pattern, positions in sorted_patterns:
         if len(positions) < 3:
             continue
         
@@ -1,32 +1,43 @@
 #!/usr/bin/env python3
 """檢查程式執行時的 CPU 使用率"""
 
-import subprocess
 import time
 import sys
 
+import psutil
+
+_process = None  # 快取目標進程，避免每次都重新列舉
+
+
+def _find_main_process():
+    """找出執行 main.py 的 Python 進程"""
+    for proc in psutil.process_iter(['cmdline']):
+        cmdline = proc.info['cmdline']
+        if not cmdline:
+            continue
+        joined = ' '.join(cmdline)
+        if 'python' in joined and 'main.py' in joined:
+            return proc
+    return None
+
+
 def get_python_process_cpu():
-    """獲取所有 Python 進程的 CPU 使用率"""
+    """獲取 main.py 進程的 CPU 與記憶體使用率（psutil 直接讀取，不再 fork ps）"""
+    global _process
     try:
-        # 使用 ps 命令獲取 Python 進程資訊
-        cmd = "ps aux | grep '[p]ython.*main.py'"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        if result.returncode == 0 and result.stdout:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 3:
-                    cpu_percent = parts[2]  # CPU%
-                    mem_percent = parts[3]  # MEM%
-                    pid = parts[1]
-                    return {
-                        'pid': pid,
-                        'cpu': float(cpu_percent),
-                        'mem': float(mem_percent)
-                    }
-    except Exception as e:
+        if _process is None or not _process.is_running():
+            _process = _find_main_process()
+            if _process is None:
+                return None
+            _process.cpu_percent(interval=None)  # 第一次呼叫只建立計算基準
+        return {
+            'pid': _process.pid,
+            'cpu': _process.cpu_percent(interval=None),
+            'mem': _process.memory_percent(),
+        }
+    except psutil.Error as e:
         print(f"錯誤: {e}")
+        _process = None
     
     return None
 
@@ -46,6 +57,10 @@ def monitor_performance(duration=10, interval=1):
     cpu_samples = []
     mem_samples = []
     
+    # 先呼叫一次建立 CPU 計算基準（psutil 的第一次 cpu_percent 固定為 0）
+    if get_python_process_cpu():
+        time.sleep(interval)
+    
     for i in range(duration):
         info = get_python_process_cpu()
         
@@ -15,15 +15,15 @@ def capture_data(duration=5, description=""):
     print(f"{'='*60}")
     
     try:
-        ser = serial.Serial(port=PORT, baudrate=BAUDRATE, timeout=1.0)
+        # read() 最多阻塞 50ms，有資料就立即返回
+        ser = serial.Serial(port=PORT, baudrate=BAUDRATE, timeout=0.05)
         buffer = bytearray()
         start_time = time.time()
         
         while time.time() - start_time < duration:
-            if ser.in_waiting > 0:
-                data = ser.read(ser.in_waiting)
+            data = ser.read(4096)
+            if data:
                 buffer.extend(data)
-            time.sleep(0.01)
         
         ser.close()
         
@@ -32,16 +32,18 @@ def capture_data(duration=5, description=""):
         if len(buffer) > 0:
             # 顯示前 200 bytes
             print(f"\n前 200 bytes (hex):")
-            hex_str = ' '.join(f'{b:02x}' for b in buffer[:200])
+            hex_str = buffer[:200].hex(' ')
             for i in range(0, len(hex_str), 80):
                 print(hex_str[i:i+80])
             
             # 尋找 D2 D2 D2 標頭
             header = b'\xd2\xd2\xd2'
+            # bytes.find 以 C 搜尋，避免逐 byte 切片比較
             positions = []
-            for i in range(len(buffer) - 2):
-                if buffer[i:i+3] == header:
-                    positions.append(i)
+            i = buffer.find(header)
+            while i != -1:
+                positions.append(i)
+                i = buffer.find(header, i + 1)
             
             print(f"\n找到 {len(positions)} 個 D2 D2 D2 標頭")
             if len(positions) > 0:
@@ -51,8 +53,8 @@ def capture_data(duration=5, description=""):
                 if positions[0] + 29 <= len(buffer):
                     packet = buffer[positions[0]:positions[0]+29]
                     print(f"\n第一個封包 (29 bytes):")
-                    print(' '.join(f'{b:02x}' for b in packet))
-                    print(f"  標頭: {packet[0]:02x} {packet[1]:02x} {packet[2]:02x}")
+                    print(packet.hex(' '))
+                    print(f"  標頭: {packet[:3].hex(' ')}")
                     print(f"  類型: 0x{packet[3]:02x} ({'AA=EMG' if packet[3]==0xAA else 'BB=IMU' if packet[3]==0xBB else '未知'})")
                     print(f"  序號: {packet[4]}")
                 
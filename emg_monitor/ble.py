@@ -67,12 +67,16 @@ class BleController:
 
 T = TypeVar("T")
 
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
 
 def run_coroutine(coro: Coroutine[None, None, T]) -> T:
-    """Run an asyncio coroutine from sync code."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    """Run an asyncio coroutine from sync code.
+
+    A single event loop is created lazily and reused across calls so BLE
+    clients and transports can outlive one coroutine."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP.run_until_complete(coro)
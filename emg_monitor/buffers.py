@@ -6,33 +6,96 @@ import numpy as np
 
 
 class EmgRingBuffer:
-    """Maintain a fixed-size rolling buffer of EMG channels."""
+    """Maintain a fixed-size rolling buffer of EMG channels.
+
+    The backing store holds two copies of the ring ("ghost region"): every
+    write lands at ``idx`` and ``idx + capacity``, so the newest ``capacity``
+    samples are always contiguous and ``snapshot`` never has to copy.
+    """
 
     def __init__(self, channels: int, capacity: int) -> None:
         self.channels = channels
         self.capacity = capacity
-        self._data = np.zeros((channels, capacity), dtype=np.float32)
+        self._data = np.zeros((channels, 2 * capacity), dtype=np.float32)
         self._index = 0
         self._filled = False
+        # Monotonic count of writes; readers compare it to skip stale redraws.
+        self._write_seq = 0
+
+    @property
+    def write_seq(self) -> int:
+        return self._write_seq
 
-    def append(self, values: list[float]) -> None:
-        if len(values) != self.channels:
-            raise ValueError(f"Expected {self.channels} values, got {len(values)}")
-        self._data[:, self._index] = values
-        self._index = (self._index + 1) % self.capacity
+    def append(self, values: np.ndarray) -> None:
+        """Store one sample given as a ``(channels,)`` array."""
+        if values.shape != (self.channels,):
+            raise ValueError(
+                f"Expected {self.channels} values, got {values.shape}"
+            )
+        idx = self._index
+        self._data[:, idx] = values
+        self._data[:, idx + self.capacity] = values
+        self._index = (idx + 1) % self.capacity
         if self._index == 0:
             self._filled = True
+        self._write_seq += 1
+
+    def append_batch(self, values_2d: np.ndarray) -> None:
+        """Store several samples given as a ``(channels, n)`` array."""
+        n = values_2d.shape[1]
+        if n == 0:
+            return
+        self._write_seq += n
+        capacity = self.capacity
+        if n >= capacity:
+            # Only the newest `capacity` samples survive anyway.
+            newest = values_2d[:, n - capacity :]
+            self._data[:, :capacity] = newest
+            self._data[:, capacity:] = newest
+            self._index = 0
+            self._filled = True
+            return
+        idx = self._index
+        end = idx + n
+        # Samples are contiguous in the doubled store; mirror them into the
+        # other half so both copies stay identical.
+        self._data[:, idx:end] = values_2d
+        if end <= capacity:
+            self._data[:, idx + capacity : end + capacity] = values_2d
+        else:
+            split = capacity - idx
+            self._data[:, idx + capacity :] = values_2d[:, :split]
+            self._data[:, : end - capacity] = values_2d[:, split:]
+        self._filled |= end >= capacity
+        self._index = end % capacity
+
+    def append_block(self, samples: np.ndarray) -> None:
+        """Store several samples given sample-major as an ``(n, channels)``
+        array, the layout produced by packet decoding."""
+        if samples.ndim != 2 or samples.shape[1] != self.channels:
+            raise ValueError(
+                f"Expected (n, {self.channels}) samples, got {samples.shape}"
+            )
+        self.append_batch(samples.T)
 
     def snapshot(self) -> np.ndarray:
-        """Return data ordered from oldest to newest."""
+        """Return data ordered from oldest to newest.
+
+        The result is a view into the ring, valid until the next append."""
         if not self._filled:
             return self._data[:, : self._index]
         idx = self._index
-        return np.concatenate(
-            (self._data[:, idx:], self._data[:, :idx]), axis=1
-        )
+        return self._data[:, idx : idx + self.capacity]
+
+    def snapshot_if_new(self, last_seen_seq: int) -> tuple[int, np.ndarray] | None:
+        """Return ``(write_seq, snapshot)``, or None if nothing was written
+        since ``last_seen_seq``."""
+        if self._write_seq == last_seen_seq:
+            return None
+        return self._write_seq, self.snapshot()
 
     def clear(self) -> None:
         self._data.fill(0)
         self._index = 0
         self._filled = False
+        self._write_seq += 1  # Readers must redraw the now-empty buffer
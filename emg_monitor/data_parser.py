@@ -2,78 +2,141 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from typing import List, Sequence, Tuple, Union
+from typing import Optional, Sequence, Union
+
+import numpy as np
 
 
 HEADER = bytes([0xD2, 0xD2, 0xD2])
 PAYLOAD_LENGTH = 29
+EMG_CHANNELS = 8
+IMU_VALUES = 12
+
+# Header bytes, packet type and sequence number, decoded in one C call.
+_PACKET_HEADER = struct.Struct(">3sBB")
+# Bit shifts that fold each big-endian 3-byte channel into a 24-bit value.
+_EMG_SHIFTS = np.array([16, 8, 0], dtype=np.int32)
+# Byte positions within a packet, added to start offsets to gather packets.
+_PACKET_COLUMNS = np.arange(PAYLOAD_LENGTH, dtype=np.intp)
+# Raw IMU counts to rad/s and m/s^2.
+_GYRO_SCALE = np.float32(0.0012)
+_ACCEL_SCALE = np.float32(0.0005978)
+
+# Anything exposing the buffer protocol; parsing reads it in place.
+RawPacket = Union[bytes, bytearray, memoryview]
 
 
-@dataclass
+@dataclass(slots=True)
 class EmgSample:
     """Represents one timestamped sample across all EMG channels."""
 
     sequence: int
-    channels_uv: List[float]
+    channels_uv: np.ndarray  # shape: (8,), float32
+
+
+@dataclass(slots=True)
+class EmgBatch:
+    """Consecutive EMG samples stored column-wise, one row per sample."""
+
+    sequence: np.ndarray  # shape: (n,), uint8
+    channels_uv: np.ndarray  # shape: (n, 8), float32
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[EmgSample]) -> EmgBatch:
+        """Stack per-sample ``EmgSample`` objects into one batch."""
+        return cls(
+            sequence=np.array([s.sequence for s in samples], dtype=np.uint8),
+            channels_uv=np.stack([s.channels_uv for s in samples]),
+        )
+
+    def to_samples(self) -> list[EmgSample]:
+        """Split into per-sample ``EmgSample`` objects sharing this storage."""
+        return [
+            EmgSample(sequence=sequence, channels_uv=row)
+            for sequence, row in zip(self.sequence.tolist(), self.channels_uv)
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImuSample:
     """Represents one IMU sample for gyroscope and accelerometer axes."""
 
     sequence: int
-    gyro_rads: List[float]
-    accel_mss: List[float]
-    remainder: List[int]
+    gyro_rads: np.ndarray  # shape: (3,), float32
+    accel_mss: np.ndarray  # shape: (3,), float32
+    remainder: np.ndarray  # shape: (6,), int32
 
 
 class PacketError(Exception):
     """Signals that an incoming packet cannot be decoded."""
 
 
-def _combine_signed(bytes_seq: Sequence[int], bits: int) -> int:
-    """Combine big-endian bytes into a signed integer."""
-    value = 0
-    for byte in bytes_seq:
-        value = (value << 8) | byte
-    sign_bit = 1 << (bits - 1)
-    return value - (1 << bits) if value & sign_bit else value
+def gather_packets(buf: RawPacket, offsets: np.ndarray) -> np.ndarray:
+    """Return the packets starting at ``offsets`` in ``buf`` as one
+    ``(n, 29)`` uint8 array, e.g. the offsets found by ``framing.drain``.
 
+    Back-to-back packets (the usual case) come back as a view into ``buf``
+    without copying, so decode the result before ``buf`` is overwritten."""
+    n = len(offsets)
+    if n and offsets[-1] - offsets[0] == (n - 1) * PAYLOAD_LENGTH:
+        return np.frombuffer(
+            buf, dtype=np.uint8, count=n * PAYLOAD_LENGTH, offset=int(offsets[0])
+        ).reshape(n, PAYLOAD_LENGTH)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    return data[offsets[:, None] + _PACKET_COLUMNS]
 
-def parse_packet(raw: bytes) -> Union[EmgSample, ImuSample]:
+
+def decode_emg_block(packets: np.ndarray) -> np.ndarray:
+    """Return the 8 EMG channels of ``(n, 29)`` packets as ``(n, 8)`` int32.
+
+    Headers and packet types are not checked; select the EMG rows first."""
+    arr = packets[:, 5:].reshape(-1, EMG_CHANNELS, 3).astype(np.int32)
+    values = (arr << _EMG_SHIFTS).sum(axis=2, dtype=np.int32)
+    values -= (values & 0x800000) << 1  # Sign-extend 24-bit two's complement
+    return values
+
+
+def _decode_emg(raw: RawPacket) -> np.ndarray:
+    """Return the 8 signed 24-bit EMG channels of a packet as int32.
+
+    Goes through ``decode_emg_block`` so both paths share one decoder."""
+    packet = np.frombuffer(raw, dtype=np.uint8, count=PAYLOAD_LENGTH)
+    return decode_emg_block(packet[None, :])[0]
+
+
+def parse_packet(
+    raw: RawPacket, *, parse_imu: bool = True
+) -> Optional[Union[EmgSample, ImuSample]]:
     """Parse a 29-byte packet into an EMG or IMU sample.
 
-    Raises PacketError when the packet format is invalid."""
+    ``raw`` may be a memoryview slice so callers can decode without copying;
+    the returned sample never references it. With ``parse_imu=False`` IMU
+    packets are validated but not decoded and None is returned. Raises
+    PacketError when the packet format is invalid."""
     if len(raw) != PAYLOAD_LENGTH:
         raise PacketError(f"Expected {PAYLOAD_LENGTH} bytes, got {len(raw)}")
-    if not raw.startswith(HEADER):
+    header, packet_type, sequence = _PACKET_HEADER.unpack_from(raw)
+    if header != HEADER:
         raise PacketError(f"Packet missing header {HEADER!r}")
 
-    packet_type = raw[3]
-    sequence = raw[4]
-    payload = raw[5:]
-
     if packet_type == 0xAA:
-        channels: List[float] = []
-        for offset in range(0, len(payload), 3):
-            chunk = payload[offset : offset + 3]
-            if len(chunk) < 3:
-                break
-            value = float(_combine_signed(chunk, 24))
-            channels.append(value)  # Already expressed in microvolts per spec
-        return EmgSample(sequence=sequence, channels_uv=channels)
+        # Already expressed in microvolts per spec
+        return EmgSample(
+            sequence=sequence, channels_uv=_decode_emg(raw).astype(np.float32)
+        )
 
     if packet_type == 0xBB:
-        decoded: List[int] = []
-        for offset in range(0, len(payload), 2):
-            chunk = payload[offset : offset + 2]
-            if len(chunk) < 2:
-                break
-            decoded.append(_combine_signed(chunk, 16))
-        gyro_rads = [val * 0.0012 for val in decoded[:3]]
-        accel_mss = [val * 0.0005978 for val in decoded[3:6]]
-        remainder = decoded[6:]
+        if not parse_imu:
+            return None
+        decoded = np.frombuffer(raw, dtype=">i2", offset=5, count=IMU_VALUES)
+        gyro_rads = decoded[:3] * _GYRO_SCALE
+        accel_mss = decoded[3:6] * _ACCEL_SCALE
+        remainder = decoded[6:].astype(np.int32)
         return ImuSample(
             sequence=sequence,
             gyro_rads=gyro_rads,
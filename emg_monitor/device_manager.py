@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Awaitable, Callable, Optional
 
@@ -16,6 +17,10 @@ logger = logging.getLogger(__name__)
 
 
 PacketCallback = Callable[[data_parser.EmgSample | data_parser.ImuSample], None]
+PacketBatchCallback = Callable[
+    [list[data_parser.EmgSample | data_parser.ImuSample]], None
+]
+EmgBatchCallback = Callable[[data_parser.EmgBatch], None]
 StatusCallback = Callable[[str], None]
 
 
@@ -26,10 +31,22 @@ class DeviceManager:
     notification_uuid: str
     on_packet: PacketCallback
     on_status: StatusCallback = lambda msg: None
+    # When set, receives each drained batch of packets in a single call.
+    on_packet_batch: Optional[PacketBatchCallback] = None
+    # When set, receives the EMG samples of each drained batch as one EmgBatch;
+    # the remaining packets still go to on_packet_batch / on_packet.
+    on_emg_batch: Optional[EmgBatchCallback] = None
     controller: BleController = field(default_factory=BleController)
+    # Disable when nothing consumes ImuSample to skip decoding IMU packets.
+    parse_imu: bool = True
 
     _client: Optional[BleakClient] = field(init=False, default=None)
     _listen_task: Optional[asyncio.Task[None]] = field(init=False, default=None)
+    # Raw notifications waiting for the parse task; oldest are dropped on overflow.
+    _raw_q: deque[bytearray] = field(
+        init=False, default_factory=lambda: deque(maxlen=1024)
+    )
+    _raw_ready: Optional[asyncio.Event] = field(init=False, default=None)
 
     async def scan(self, timeout: float = 5.0) -> list[BleDeviceInfo]:
         self.on_status("Scanning for devices...")
@@ -44,7 +61,16 @@ class DeviceManager:
         if not client or not client.is_connected:
             raise RuntimeError("Failed to connect to device")
         self._client = client
-        await client.start_notify(self.notification_uuid, self._handle_notification)
+        self._raw_q.clear()
+        self._raw_ready = asyncio.Event()
+        self._listen_task = asyncio.create_task(self._parse_loop())
+        try:
+            await client.start_notify(
+                self.notification_uuid, self._handle_notification
+            )
+        except BaseException:
+            await self._stop_listen_task()
+            raise
         self.on_status("Connected")
 
     async def disconnect(self) -> None:
@@ -54,17 +80,99 @@ class DeviceManager:
                 await self._client.stop_notify(self.notification_uuid)
             except Exception:  # noqa: BLE stop may fail if not started
                 logger.debug("stop_notify failed", exc_info=True)
+        await self._stop_listen_task()
         await self.controller.disconnect()
         self._client = None
         self.on_status("Disconnected")
 
+    async def _stop_listen_task(self) -> None:
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
     def _handle_disconnect(self) -> None:
         self.on_status("Device disconnected")
 
     def _handle_notification(self, _: int, data: bytearray) -> None:
-        try:
-            packet = data_parser.parse_packet(bytes(data))
-        except data_parser.PacketError:
-            logger.debug("Failed to parse packet", exc_info=True)
+        # Runs inside bleak's dispatcher: only enqueue, parsing happens in
+        # _parse_loop so BLE delivery never waits on decode.
+        # bleak hands over a fresh bytearray per notification, so keep it as-is.
+        self._raw_q.append(data)
+        if self._raw_ready is not None:
+            self._raw_ready.set()
+
+    async def _parse_loop(self) -> None:
+        # Parsing a batch is a few hundred bytes of GIL-bound work, so it runs
+        # inline here; an executor hop would only add latency.
+        assert self._raw_ready is not None
+        while True:
+            await self._raw_ready.wait()
+            self._raw_ready.clear()
+            raws = [self._raw_q.popleft() for _ in range(len(self._raw_q))]
+            if not raws:
+                continue
+            try:
+                packets = self._parse_raws(raws)
+            except Exception:
+                logger.exception("Packet parsing failed")
+                continue
+            self._dispatch(packets)
+
+    def _parse_raws(
+        self, raws: list[bytearray]
+    ) -> list[data_parser.EmgSample | data_parser.ImuSample]:
+        parse_imu = self.parse_imu
+        return [
+            packet
+            for raw in raws
+            for packet in self._parse_notification(raw, parse_imu=parse_imu)
+        ]
+
+    def _dispatch(
+        self, packets: list[data_parser.EmgSample | data_parser.ImuSample]
+    ) -> None:
+        if self.on_emg_batch is not None:
+            emg = [p for p in packets if isinstance(p, data_parser.EmgSample)]
+            if emg:
+                self.on_emg_batch(data_parser.EmgBatch.from_samples(emg))
+            packets = [p for p in packets if not isinstance(p, data_parser.EmgSample)]
+        if not packets:
+            return
+        if self.on_packet_batch is not None:
+            self.on_packet_batch(packets)
             return
-        self.on_packet(packet)
+        for packet in packets:
+            self.on_packet(packet)
+
+    @staticmethod
+    def _parse_notification(
+        raw: bytes | bytearray, *, parse_imu: bool = True
+    ) -> list[data_parser.EmgSample | data_parser.ImuSample]:
+        """Decode every complete packet in one notification.
+
+        GATT may coalesce several 29-byte packets into a single notification,
+        so scan for each header instead of assuming exactly one packet."""
+        length = data_parser.PAYLOAD_LENGTH
+        header = data_parser.HEADER
+        packets: list[data_parser.EmgSample | data_parser.ImuSample] = []
+        view = memoryview(raw)
+        pos = raw.find(header)
+        if pos == -1:
+            logger.debug("Notification without packet header: %s", raw.hex())
+        while pos != -1 and pos + length <= len(raw):
+            try:
+                packet = data_parser.parse_packet(
+                    view[pos : pos + length], parse_imu=parse_imu
+                )
+            except data_parser.PacketError:
+                logger.debug("Failed to parse packet", exc_info=True)
+                pos = raw.find(header, pos + 1)
+                continue
+            if packet is not None:
+                packets.append(packet)
+            pos = raw.find(header, pos + length)
+        return packets
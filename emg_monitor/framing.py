@@ -0,0 +1,62 @@
+"""Locate WL-EMG packets in a raw byte stream."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .data_parser import HEADER, PAYLOAD_LENGTH, decode_emg_block, gather_packets
+
+# Header as the low 24 bits of a little-endian uint32 loaded at a packet start.
+_HEADER_WORD = int.from_bytes(HEADER, "little")
+_NO_OFFSETS = np.empty(0, dtype=np.intp)
+
+
+def drain(buf: bytearray, head: int, tail: int) -> tuple[int, np.ndarray]:
+    """Find every complete packet in ``buf[head:tail]``.
+
+    Returns ``(new_head, offsets)`` where ``offsets`` are the start indices of
+    the packets found, in stream order, and ``new_head`` is where framing
+    should resume once more bytes arrive. Runs of back-to-back packets are
+    validated in one vectorized pass; ``bytearray.find`` is used only to
+    resynchronize after garbage bytes.
+    """
+    runs = []
+    pos = head
+    while tail - pos >= PAYLOAD_LENGTH:
+        if not buf.startswith(HEADER, pos, tail):
+            header_pos = buf.find(HEADER, pos + 1, tail)
+            if header_pos == -1:
+                # Keep the tail in case a header straddles the next read
+                pos = max(pos, tail - (PAYLOAD_LENGTH - 1))
+                break
+            pos = header_pos
+            if tail - pos < PAYLOAD_LENGTH:
+                break
+
+        count = (tail - pos) // PAYLOAD_LENGTH
+        # One unaligned 32-bit load per packet start; mask off the type byte
+        # and compare the header in a single operation.
+        words = np.ndarray(
+            (count,), dtype="<u4", buffer=buf, offset=pos, strides=(PAYLOAD_LENGTH,)
+        )
+        aligned = (words & 0xFFFFFF) == _HEADER_WORD
+        # Length of the leading run of packets that start with a header; the
+        # first one always does, so the run is never empty.
+        run = count if aligned.all() else int(aligned.argmin())
+        runs.append(pos + PAYLOAD_LENGTH * np.arange(run, dtype=np.intp))
+        pos += run * PAYLOAD_LENGTH
+
+    if not runs:
+        return pos, _NO_OFFSETS
+    return pos, runs[0] if len(runs) == 1 else np.concatenate(runs)
+
+
+def warm_up() -> None:
+    """Run framing and EMG block decoding once on a synthetic packet.
+
+    The first pass through these NumPy calls costs several times a steady
+    one; reader threads call this before the first real read."""
+    packet = bytearray(PAYLOAD_LENGTH)
+    packet[:4] = HEADER + b"\xaa"  # Header and EMG packet type
+    _, offsets = drain(packet, 0, len(packet))
+    decode_emg_block(gather_packets(packet, offsets))
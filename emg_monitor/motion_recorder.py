@@ -11,11 +11,18 @@
 
 from __future__ import annotations
 
+import gc
+import os
+import platform
+import queue
+import shutil
+import tempfile
 import time
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Sequence, TYPE_CHECKING
 
 import cv2
 import numpy as np
@@ -25,6 +32,8 @@ import numpy as np
 if TYPE_CHECKING:
     import mediapipe as mp
 
+_IS_DARWIN = platform.system() == 'Darwin'  # macOS
+
 MEDIAPIPE_AVAILABLE = False
 _mp_module = None
 _mp_loading = False  # 標記是否正在載入
@@ -43,6 +52,8 @@ def _lazy_import_mediapipe():
             import mediapipe as mp
             _mp_module = mp
             MEDIAPIPE_AVAILABLE = True
+            # MediaPipe 帶入大量常駐物件，移出 GC 追蹤範圍，之後的回收不必再掃描
+            gc.freeze()
             print("✅ MediaPipe 載入完成")
         except ImportError:
             print("⚠️ MediaPipe 未安裝，手部追蹤功能將不可用")
@@ -92,6 +103,8 @@ async def _async_import_mediapipe():
     _mp_loading = False
     
     if success:
+        # MediaPipe 帶入大量常駐物件，移出 GC 追蹤範圍，之後的回收不必再掃描
+        gc.freeze()
         print("✅ MediaPipe 背景載入完成！現在可以開始錄影")
     else:
         print("⚠️ MediaPipe 未安裝，手部追蹤功能將不可用")
@@ -100,6 +113,57 @@ async def _async_import_mediapipe():
     return success
 
 
+def _landmarks_to_array(landmarks) -> np.ndarray:
+    """將 MediaPipe 手部關鍵點（具 x/y/z 的序列）一次轉為 (21, 3) float32 陣列
+    
+    以 np.fromiter 直接填入，避免建立 21 個暫存 list
+    """
+    return np.fromiter(
+        (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+        dtype=np.float32,
+        count=len(landmarks) * 3,
+    ).reshape(-1, 3)
+
+
+# MediaPipe Tasks 手部模型（存在時改用 HandLandmarker，XNNPACK 加速；否則使用舊版 solutions API）
+# 下載：https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/hand_landmarker.task
+HAND_LANDMARKER_MODEL = Path(__file__).resolve().parent.parent / "models" / "hand_landmarker.task"
+
+
+# 手部骨架折線（關鍵點索引）：大拇指、食指、中指、無名指、小指、手掌
+_HAND_CHAINS = [
+    np.array([0, 1, 2, 3, 4]),
+    np.array([0, 5, 6, 7, 8]),
+    np.array([0, 9, 10, 11, 12]),
+    np.array([0, 13, 14, 15, 16]),
+    np.array([0, 17, 18, 19, 20]),
+    np.array([5, 9, 13, 17]),
+]
+
+
+# 影片寫入器的硬體加速參數（舊版 OpenCV 沒有這些常數時為 None）
+try:
+    _VIDEOWRITER_HW_PARAMS: Optional[List[int]] = [
+        cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY
+    ]
+except AttributeError:
+    _VIDEOWRITER_HW_PARAMS = None
+
+
+def _open_video_writer(path: str, fps: float, size: tuple[int, int]) -> cv2.VideoWriter:
+    """開啟影片寫入器：優先使用硬體加速 H.264（macOS VideoToolbox / Linux VAAPI），
+    無法開啟時退回軟體 mp4v 編碼"""
+    if _VIDEOWRITER_HW_PARAMS is not None:
+        writer = cv2.VideoWriter(
+            path, cv2.CAP_ANY, cv2.VideoWriter_fourcc(*'avc1'), fps, size,
+            _VIDEOWRITER_HW_PARAMS
+        )
+        if writer.isOpened():
+            return writer
+        writer.release()
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+
+
 def is_mediapipe_ready() -> bool:
     """檢查 MediaPipe 是否已準備好使用"""
     return MEDIAPIPE_AVAILABLE and _mp_module is not None
@@ -110,36 +174,83 @@ def is_mediapipe_loading() -> bool:
     return _mp_loading
 
 
-@dataclass
-class MotionFrame:
-    """單一動作幀資料
-    
-    Attributes:
-        timestamp: 時間戳（秒，相對於記錄開始）
-        emg_data: 8 通道 EMG 訊號（μV）
-        hand_landmarks: 21 個手部關鍵點 3D 座標（歸一化 0-1），若未偵測到則為 None
-        frame_image: 攝影機影像（BGR 格式），若停用攝影機則為 None
-    """
-    timestamp: float
-    emg_data: np.ndarray  # shape: (8,)
-    hand_landmarks: Optional[np.ndarray] = None  # shape: (21, 3)
-    frame_image: Optional[np.ndarray] = None
+# 記錄會話初始容量：約 1 分鐘的 EMG 樣本（200 Hz），不足時倍增
+_INITIAL_SESSION_CAPACITY = 200 * 60
+
+
+def _grow_array(arr: np.ndarray, capacity: int) -> np.ndarray:
+    """配置容量更大的陣列並複製既有內容（新增部分填零）"""
+    grown = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+    grown[:len(arr)] = arr
+    return grown
 
 
 @dataclass
 class RecordingSession:
     """記錄會話資料
     
+    各欄位分別存成預先配置的陣列（Structure of Arrays），第 i 個樣本
+    分散在各陣列的第 i 列；新增樣本只需寫入索引位置，不必建立物件。
+    
     Attributes:
-        frames: 所有記錄的幀
+        timestamps: 時間戳（秒，相對於記錄開始）
+        emg_data: 8 通道 EMG 訊號（μV），shape: (capacity, 8)
+        landmarks: 21 個手部關鍵點 3D 座標（歸一化 0-1），未偵測到則為零
+        landmarks_valid: 該樣本是否有有效的手部偵測
+        num_samples: 已寫入的樣本數
         metadata: 會話元資料
-        start_time: 開始時間（Unix timestamp）
+        start_time: 開始時間（Unix timestamp，僅供記錄）
+        start_monotonic: 開始時的 time.monotonic()，相對時間戳以此為基準
         gesture_label: 手勢標籤（如 "fist", "open" 等）
     """
-    frames: List[MotionFrame] = field(default_factory=list)
+    timestamps: np.ndarray = field(
+        default_factory=lambda: np.empty(_INITIAL_SESSION_CAPACITY, dtype=np.float64)
+    )
+    emg_data: np.ndarray = field(
+        default_factory=lambda: np.empty((_INITIAL_SESSION_CAPACITY, 8), dtype=np.float32)
+    )
+    landmarks: np.ndarray = field(
+        default_factory=lambda: np.zeros((_INITIAL_SESSION_CAPACITY, 21, 3), dtype=np.float32)
+    )
+    landmarks_valid: np.ndarray = field(
+        default_factory=lambda: np.zeros(_INITIAL_SESSION_CAPACITY, dtype=bool)
+    )
+    num_samples: int = 0
     metadata: dict = field(default_factory=dict)
     start_time: float = 0.0
+    start_monotonic: float = 0.0
     gesture_label: str = ""
+    
+    def __len__(self) -> int:
+        return self.num_samples
+    
+    def extend(
+        self,
+        timestamps: Sequence[float],
+        emg: Sequence[np.ndarray],
+        landmarks: Sequence[Optional[np.ndarray]]
+    ) -> None:
+        """一次寫入 k 個樣本（k 筆 (8,) EMG 直接堆疊進 float32 陣列，不經暫存陣列）"""
+        start = self.num_samples
+        end = start + len(timestamps)
+        capacity = len(self.timestamps)
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            self._grow(capacity)
+        self.timestamps[start:end] = timestamps
+        np.stack(emg, out=self.emg_data[start:end])
+        for i, lm in enumerate(landmarks, start):
+            if lm is not None:
+                self.landmarks[i] = lm
+                self.landmarks_valid[i] = True
+        self.num_samples = end
+    
+    def _grow(self, capacity: int) -> None:
+        self.timestamps = _grow_array(self.timestamps, capacity)
+        self.emg_data = _grow_array(self.emg_data, capacity)
+        self.landmarks = _grow_array(self.landmarks, capacity)
+        self.landmarks_valid = _grow_array(self.landmarks_valid, capacity)
 
 
 class MotionRecorder:
@@ -157,8 +268,10 @@ class MotionRecorder:
         recorder.stop_recording("recordings/fist_001.npz")
     """
     
-    # 記憶體管理：最多保留多少幀的完整影像（其餘只保留 landmarks）
-    MAX_FULL_IMAGE_FRAMES = 100  # 約 0.5 秒的影像（200Hz EMG）
+    # 錄影時編碼佇列的容量（幀）；編碼跟不上時丟棄新幀，不阻塞捕捉
+    VIDEO_QUEUE_SIZE = 30
+    # 停止錄影時等待編碼線程寫完剩餘幀的上限（秒）
+    VIDEO_STOP_TIMEOUT = 5.0
     
     def __init__(
         self, 
@@ -183,22 +296,46 @@ class MotionRecorder:
         self.camera_id = camera_id
         self.cap: Optional[cv2.VideoCapture] = None
         self.mp_hands = None
-        self.hands = None
+        self.hands = None  # solutions.Hands 或 tasks HandLandmarker
+        self._use_tasks_api = False
+        self._last_detect_ms = 0  # HandLandmarker VIDEO 模式要求時間戳遞增
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
         
         # 快取最新幀以避免重複讀取攝影機
+        # 雙緩衝：捕捉線程寫入後緩衝區，完成後在鎖內交換；
+        # _cached_frame 永遠指向前緩衝區，讀取端視為唯讀
+        self._frame_bufs: List[Optional[np.ndarray]] = [None, None]
+        self._read_idx: int = 0
         self._cached_frame: Optional[np.ndarray] = None
         self._cached_landmarks: Optional[np.ndarray] = None
-        self._cached_has_hand: bool = False
         self._frame_counter: int = 0
         self._process_every_n_frames: int = 3  # 每 3 幀才做一次 MediaPipe 處理（降低 CPU）
+        # 影像寬高（像素），用於把歸一化的 landmarks 一次轉為像素座標
+        self._frame_wh = np.array([320, 240], dtype=np.float32)
         
         # 攝影機線程（背景讀取，避免阻塞主線程）
+        # 捕捉線程只負責讀取影像；MediaPipe 在另一條線程處理，
+        # 兩者以 maxlen=1 的 deque 銜接（新幀自動擠掉舊幀），慢的推論不會拖住捕捉
         self._camera_thread: Optional[threading.Thread] = None
-        self._camera_thread_running = False
+        self._hand_thread: Optional[threading.Thread] = None
+        self._camera_stop = threading.Event()
+        self._cap_ready = threading.Event()  # 攝影機已開啟時設定
+        self._hand_frames: deque = deque(maxlen=1)  # 待處理的 RGB 幀
+        self._hand_ready = threading.Event()
         self._camera_lock = threading.Lock()
         
+        # EMG 回調只把樣本放進待寫入佇列；寫入線程每 50ms 批次轉成陣列寫入 session
+        self._pending: deque = deque()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
+        
+        # 錄影期間由編碼線程即時寫入影片，影像不必留在記憶體中
+        self._video_queue: Optional[queue.Queue] = None
+        self._video_thread: Optional[threading.Thread] = None
+        self._video_temp_path: Optional[str] = None
+        self._video_frames_written: int = 0
+        
         if not is_mediapipe_ready():
             print("⚠️ MediaPipe 尚未載入完成，攝影機功能已停用")
             self.enable_camera = False
@@ -213,8 +350,7 @@ class MotionRecorder:
             return True  # 已經開啟
         
         # macOS: 使用 AVFoundation 後端以獲得硬體加速
-        import platform
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_DARWIN:
             self.cap = cv2.VideoCapture(self.camera_id, cv2.CAP_AVFOUNDATION)
             print("🍎 使用 AVFoundation (硬體加速)")
         else:
@@ -229,46 +365,68 @@ class MotionRecorder:
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)  # 從 360 降至 240
         self.cap.set(cv2.CAP_PROP_FPS, 15)            # 維持 15 FPS
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)      # 減少緩衝區，降低延遲
+        if _IS_DARWIN:
+            # 要求攝影機輸出 MJPG（較低 USB 頻寬，由硬體解碼）
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self._frame_bufs = [np.empty((240, 320, 3), dtype=np.uint8) for _ in range(2)]
+        # 以攝影機實際接受的解析度為準
+        width = self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 320
+        height = self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 240
+        self._frame_wh = np.array([width, height], dtype=np.float32)
         
         # macOS 優化：啟用硬體解碼
-        if platform.system() == 'Darwin':
+        if _IS_DARWIN:
             self.cap.set(cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY)
         
         print(f"✅ 攝影機 {self.camera_id} 已開啟 (320x240 @ 15fps)")
         
         # 啟動攝影機捕捉線程
+        self._cap_ready.set()
         self._start_camera_thread()
         
         return True
     
     def _start_camera_thread(self) -> None:
-        """啟動攝影機背景線程"""
+        """啟動攝影機捕捉線程與 MediaPipe 處理線程"""
         if self._camera_thread is not None and self._camera_thread.is_alive():
             return  # 已經在運行
         
-        self._camera_thread_running = True
+        self._camera_stop.clear()
         self._camera_thread = threading.Thread(
             target=self._camera_capture_loop,
             daemon=True,  # 守護線程，主程式結束時自動停止
             name="CameraCapture"
         )
+        self._hand_thread = threading.Thread(
+            target=self._hand_tracking_loop,
+            daemon=True,
+            name="HandTracking"
+        )
         self._camera_thread.start()
+        self._hand_thread.start()
     
     def _stop_camera_thread(self) -> None:
         """停止攝影機背景線程"""
         if self._camera_thread is None:
             return
         
-        self._camera_thread_running = False
-        if self._camera_thread.is_alive():
-            self._camera_thread.join(timeout=2.0)  # 等待最多 2 秒
+        self._camera_stop.set()
+        for thread in (self._camera_thread, self._hand_thread):
+            if thread is not None and thread.is_alive():
+                thread.join(timeout=2.0)  # 等待最多 2 秒
         self._camera_thread = None
+        self._hand_thread = None
+        
+        # 清掉尚未處理的幀
+        self._hand_frames.clear()
+        self._hand_ready.clear()
     
     def _close_camera(self) -> None:
         """關閉攝影機，釋放資源"""
         self._stop_camera_thread()  # 先停止線程
         
         if self.cap is not None:
+            self._cap_ready.clear()
             self.cap.release()
             self.cap = None
             print("✅ 攝影機已關閉")
@@ -286,7 +444,31 @@ class MotionRecorder:
         if mp is None:
             return False
         
-        self.mp_hands = mp.solutions.hands
+        self.mp_hands = mp.solutions.hands  # HAND_CONNECTIONS 用於繪製
+        
+        if HAND_LANDMARKER_MODEL.exists():
+            try:
+                from mediapipe.tasks import python as mp_tasks
+                from mediapipe.tasks.python import vision
+                
+                # Tasks API 以 XNNPACK（CPU SIMD）執行推論；已有專用處理線程，使用同步的 VIDEO 模式
+                options = vision.HandLandmarkerOptions(
+                    base_options=mp_tasks.BaseOptions(
+                        model_asset_path=str(HAND_LANDMARKER_MODEL)
+                    ),
+                    running_mode=vision.RunningMode.VIDEO,
+                    num_hands=1,  # 只追蹤一隻手
+                    min_hand_detection_confidence=self.min_detection_confidence,
+                    min_tracking_confidence=self.min_tracking_confidence
+                )
+                self.hands = vision.HandLandmarker.create_from_options(options)
+                self._use_tasks_api = True
+                self._last_detect_ms = 0
+                print("✅ MediaPipe HandLandmarker 已初始化（Tasks API）")
+                return True
+            except Exception as e:
+                print(f"⚠️ HandLandmarker 初始化失敗，改用 solutions API: {e}")
+        
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,  # 只追蹤一隻手
@@ -294,76 +476,129 @@ class MotionRecorder:
             min_detection_confidence=self.min_detection_confidence,
             min_tracking_confidence=self.min_tracking_confidence
         )
+        self._use_tasks_api = False
         print("✅ MediaPipe 手部追蹤已初始化（輕量級模型）")
         return True
     
+    def _process_hands(self, frame_rgb: np.ndarray) -> Optional[np.ndarray]:
+        """將 RGB 幀交給 MediaPipe 處理，回傳 (21, 3) landmarks（未偵測到則為 None）
+        
+        處理期間設為唯讀，讓 MediaPipe 可直接引用而不必複製
+        """
+        frame_rgb.flags.writeable = False
+        try:
+            if self._use_tasks_api:
+                mp_image = _mp_module.Image(
+                    image_format=_mp_module.ImageFormat.SRGB, data=frame_rgb
+                )
+                timestamp_ms = max(int(time.monotonic() * 1000), self._last_detect_ms + 1)
+                self._last_detect_ms = timestamp_ms
+                result = self.hands.detect_for_video(mp_image, timestamp_ms)
+                hands = result.hand_landmarks
+                return _landmarks_to_array(hands[0]) if hands else None
+            
+            results = self.hands.process(frame_rgb)
+            if results.multi_hand_landmarks:
+                return _landmarks_to_array(results.multi_hand_landmarks[0].landmark)
+            return None
+        finally:
+            frame_rgb.flags.writeable = True
+    
     def _camera_capture_loop(self) -> None:
-        """攝影機捕捉線程（背景運行，避免阻塞主線程）"""
+        """攝影機捕捉線程（背景運行，避免阻塞主線程）
+        
+        cap.grab() 會以攝影機原生幀率阻塞，因此不再額外 sleep
+        """
         print("🎬 攝影機線程已啟動")
         
-        while self._camera_thread_running:
-            if self.cap is None or not self.cap.isOpened():
-                time.sleep(0.01)
+        frame_interval = 1.0 / 15.0  # 與 _init_camera 設定的幀率一致
+        last_frame_time = 0.0
+        
+        while not self._camera_stop.is_set():
+            # 攝影機未開啟時阻塞等待（逾時只為檢查停止旗標），不做輪詢
+            if not self._cap_ready.wait(timeout=0.5):
                 continue
+            cap = self.cap
+            if cap is None:
+                continue
+            
+            # 直接讀入後緩衝區（尺寸不符時 OpenCV 會重新配置）
+            # 緩衝區保持感測器方向，不在每幀做水平翻轉；
+            # 鏡像只在預覽與影片輸出時處理，landmarks 則翻轉 x 座標
+            back_idx = 1 - self._read_idx
             
-            ret, frame = self.cap.read()
+            # 上一輪落後超過兩個幀間隔時，驅動緩衝區裡的是舊幀：多 grab 一次丟棄（不解碼）
+            if time.monotonic() - last_frame_time > 2 * frame_interval:
+                cap.grab()
+            if not cap.grab():
+                time.sleep(0.01)
+                continue
+            ret, frame = cap.retrieve(self._frame_bufs[back_idx])
             if not ret:
                 time.sleep(0.01)
                 continue
+            last_frame_time = time.monotonic()
+            self._frame_bufs[back_idx] = frame
             
-            # 水平翻轉影像（修正鏡像問題）
-            frame = cv2.flip(frame, 1)
+            with self._camera_lock:
+                # 交換前後緩衝區（不需複製整幀）
+                self._read_idx = back_idx
+                self._cached_frame = frame
+            landmarks = self._cached_landmarks
+            
+            # 錄影中：把這一幀交給編碼線程（佇列滿時丟棄，不阻塞捕捉）
+            video_queue = self._video_queue
+            if video_queue is not None:
+                try:
+                    # flip 同時產生獨立副本（影片維持鏡像方向）
+                    video_queue.put_nowait((cv2.flip(frame, 1), landmarks))
+                except queue.Full:
+                    pass
             
             self._frame_counter += 1
             
             # 只在特定幀才做 MediaPipe 處理
-            should_process = (self._frame_counter % self._process_every_n_frames == 0)
-            
-            with self._camera_lock:
-                # 釋放舊幀（防止記憶體洩漏）
-                if self._cached_frame is not None:
-                    del self._cached_frame
-                
-                self._cached_frame = frame.copy()
-                
-                if should_process and self.hands is not None:
-                    try:
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        results = self.hands.process(frame_rgb)
-                        
-                        # 釋放 RGB 幀（已處理完畢）
-                        del frame_rgb
-                        
-                        if results.multi_hand_landmarks:
-                            hand = results.multi_hand_landmarks[0]
-                            
-                            # 釋放舊 landmarks
-                            if self._cached_landmarks is not None:
-                                del self._cached_landmarks
-                            
-                            self._cached_landmarks = np.array([
-                                [lm.x, lm.y, lm.z] 
-                                for lm in hand.landmark
-                            ])
-                            self._cached_has_hand = True
-                        else:
-                            self._cached_landmarks = None
-                            self._cached_has_hand = False
-                    except Exception as e:
-                        print(f"⚠️ MediaPipe 處理錯誤: {e}")
+            if self._frame_counter % self._process_every_n_frames == 0:
+                # 雙緩衝會被覆寫，交給處理線程的必須是獨立副本；
+                # 直接轉成 RGB 產生副本，省去 copy 後再轉換的一次走訪
+                self._offer_hand_frame(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
             
-            # 釋放原始幀（已複製到快取）
-            del frame
-            
-            # 控制幀率（約 15fps）
-            time.sleep(1.0 / 15.0)
+            del cap, frame
         
         print("🎬 攝影機線程已停止")
     
-    def __del__(self):
-        """解構函數：確保攝影機被正確關閉"""
-        self._stop_camera_thread()
-        self._close_camera()
+    def _offer_hand_frame(self, frame: np.ndarray) -> None:
+        """放入待處理幀；尚未處理的舊幀由 deque 自動丟棄"""
+        self._hand_frames.append(frame)
+        self._hand_ready.set()
+    
+    def _hand_tracking_loop(self) -> None:
+        """MediaPipe 處理線程：取最新的幀做手部追蹤並發布 landmarks"""
+        while not self._camera_stop.is_set():
+            if not self._hand_ready.wait(timeout=0.1):
+                continue
+            self._hand_ready.clear()
+            try:
+                frame = self._hand_frames.pop()
+            except IndexError:
+                continue  # 已在 clear 前取走
+            
+            if self.hands is None:
+                continue
+            
+            try:
+                # 每次產生新陣列，發布後不再修改
+                landmarks = self._process_hands(frame)
+            except Exception as e:
+                print(f"⚠️ MediaPipe 處理錯誤: {e}")
+                continue
+            
+            if landmarks is not None:
+                # 輸入為感測器方向，翻轉 x 使座標對應鏡像後的畫面（與儲存格式一致）
+                landmarks[:, 0] = 1.0 - landmarks[:, 0]
+            
+            # 單一參考賦值即可發布（None 表示未偵測到手部），不需持鎖
+            self._cached_landmarks = landmarks
     
     def start_recording(self, gesture_label: str = "") -> bool:
         """開始記錄
@@ -390,6 +625,7 @@ class MotionRecorder:
         self.recording = True
         self.session = RecordingSession(
             start_time=time.time(),
+            start_monotonic=time.monotonic(),
             gesture_label=gesture_label
         )
         
@@ -398,20 +634,33 @@ class MotionRecorder:
             'gesture_label': gesture_label,
             'sample_rate': 200,  # EMG 採樣率
             'camera_enabled': self.enable_camera,
-            'camera_fps': 30 if self.enable_camera else 0,
+            'camera_fps': 15 if self.enable_camera else 0,  # 與 _init_camera 設定一致
             'start_time': time.strftime("%Y-%m-%d %H:%M:%S"),
         }
         
+        self._pending.clear()
+        if self.enable_camera:
+            self._start_video_writer(self.session.metadata['camera_fps'])
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            daemon=True,
+            name="RecordingFlush"
+        )
+        self._flush_thread.start()
+        
         print(f"✅ 開始記錄: {gesture_label if gesture_label else '未標記'}")
         return True
     
-    def add_emg_sample(self, emg_channels: List[float]) -> bool:
+    def add_emg_sample(self, emg_channels: np.ndarray) -> bool:
         """新增 EMG 樣本（由主程式的資料回調函數呼叫）
         
-        此函數現在只從快取讀取，不會阻塞（攝影機在背景線程處理）
+        此函數現在只從快取讀取，不會阻塞（攝影機在背景線程處理）；
+        樣本先放入佇列，由寫入線程批次轉換後寫入 session
         
         Args:
-            emg_channels: 8 通道 EMG 資料（μV）
+            emg_channels: 8 通道 EMG 資料（μV），shape: (8,) float32；
+                直接存入佇列不複製，呼叫端之後不可再修改
             
         Returns:
             是否成功新增
@@ -420,61 +669,58 @@ class MotionRecorder:
             return False
         
         # 計算相對時間戳
-        timestamp = time.time() - self.session.start_time
+        # 使用單調時鐘：系統校時（NTP）不會讓時間戳倒退
+        timestamp = time.monotonic() - self.session.start_monotonic
         
-        # 從快取讀取最新幀和關鍵點（不阻塞）
-        frame_image = None
-        landmarks = None
+        # 從快取讀取最新關鍵點（不阻塞）；影像由編碼線程直接寫入影片
+        # landmarks 發布後不會被修改，可直接共用
+        landmarks = self._cached_landmarks if self.enable_camera else None
         
-        if self.enable_camera:
-            with self._camera_lock:
-                if self._cached_frame is not None:
-                    frame_image = self._cached_frame.copy()
-                if self._cached_landmarks is not None:
-                    landmarks = self._cached_landmarks.copy()
-        
-        # 建立幀資料
-        motion_frame = MotionFrame(
-            timestamp=timestamp,
-            emg_data=np.array(emg_channels, dtype=np.float32),
-            hand_landmarks=landmarks,
-            frame_image=frame_image
-        )
-        
-        self.session.frames.append(motion_frame)
-        
-        # 記憶體管理：定期清理舊幀的影像（保留最新的 MAX_FULL_IMAGE_FRAMES 幀）
-        if len(self.session.frames) > self.MAX_FULL_IMAGE_FRAMES:
-            # 清理舊幀的影像，只保留 landmarks 和 EMG
-            old_frame = self.session.frames[len(self.session.frames) - self.MAX_FULL_IMAGE_FRAMES - 1]
-            if old_frame.frame_image is not None:
-                del old_frame.frame_image
-                old_frame.frame_image = None
+        # 只入列，轉換與寫入交給寫入線程
+        self._pending.append((timestamp, emg_channels, landmarks))
         
         return True
     
+    def _flush_loop(self) -> None:
+        """寫入線程：每 50ms 把待寫入樣本批次寫入 session"""
+        while not self._flush_stop.wait(0.05):
+            self._flush_pending()
+    
+    def _flush_pending(self) -> None:
+        """取出目前所有待寫入樣本，一次寫入 session"""
+        n = len(self._pending)
+        if n == 0 or self.session is None:
+            return
+        batch = [self._pending.popleft() for _ in range(n)]
+        timestamps, emg, landmarks = zip(*batch)
+        self.session.extend(timestamps, emg, landmarks)
+    
     def get_current_frame(self) -> tuple[Optional[np.ndarray], bool]:
         """獲取當前攝影機幀（用於預覽視窗）
         
-        使用快取的幀，避免重複讀取攝影機和 MediaPipe 處理
+        使用快取的幀，避免重複讀取攝影機和 MediaPipe 處理。
+        前緩衝區兩幀後會被捕捉線程覆寫，因此在鎖內以 flip 產生鏡像副本，
+        回傳的影像由呼叫端獨佔。
         
         Returns:
             (frame, has_hand): 影像幀和是否偵測到手部
         """
-        if not self.enable_camera or self._cached_frame is None:
+        if not self.enable_camera:
             return None, False
         
-        frame = self._cached_frame.copy()
-        has_hand = self._cached_has_hand
-        
-        # 如果有偵測到手部，繪製關鍵點
-        if has_hand and self._cached_landmarks is not None:
+        with self._camera_lock:
+            # 持鎖期間捕捉線程無法交換緩衝區，只會寫入另一個緩衝區
+            frame = self._cached_frame
+            if frame is None:
+                return None, False
+            frame = cv2.flip(frame, 1)  # 水平鏡像，同時產生獨立副本
+        landmarks = self._cached_landmarks
+        has_hand = landmarks is not None
+        
+        # 如果有偵測到手部，在副本上繪製關鍵點
+        if has_hand:
             # 將歸一化座標轉為像素座標
-            h, w = frame.shape[:2]
-            landmarks_2d = np.array([
-                [int(lm[0] * w), int(lm[1] * h)]
-                for lm in self._cached_landmarks
-            ])
+            landmarks_2d = (landmarks[:, :2] * self._frame_wh).astype(np.int32)
             frame = self._draw_landmarks_on_frame(frame, landmarks_2d)
         
         return frame, has_hand
@@ -493,31 +739,16 @@ class MotionRecorder:
         Returns:
             繪製後的影像
         """
-        # 繪製關鍵點
-        for point in landmarks_2d:
-            cv2.circle(frame, tuple(point), 3, (0, 255, 0), -1)
-        
-        # 繪製連線（手指骨架）
-        connections = [
-            # 大拇指
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # 食指
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # 中指
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # 無名指
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # 小指
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # 手掌
-            (5, 9), (9, 13), (13, 17)
-        ]
-        
-        for start_idx, end_idx in connections:
-            if start_idx < len(landmarks_2d) and end_idx < len(landmarks_2d):
-                start_point = tuple(landmarks_2d[start_idx])
-                end_point = tuple(landmarks_2d[end_idx])
-                cv2.line(frame, start_point, end_point, (255, 0, 0), 2)
+        # polylines 只接受 int32 座標
+        landmarks_2d = landmarks_2d.astype(np.int32, copy=False)
+        
+        # 繪製關鍵點：每點是一段零長度粗線（圓端），一次 polylines 畫完 21 點
+        points = landmarks_2d.reshape(-1, 1, 1, 2)
+        cv2.polylines(frame, list(np.repeat(points, 2, axis=1)), False, (0, 255, 0), 6)
+        
+        # 繪製連線（手指骨架），每根手指一條折線
+        chains = [landmarks_2d[idx].reshape(-1, 1, 2) for idx in _HAND_CHAINS]
+        cv2.polylines(frame, chains, False, (255, 0, 0), 2)
         
         return frame
     
@@ -536,13 +767,24 @@ class MotionRecorder:
         
         self.recording = False
         
-        if len(self.session.frames) == 0:
+        # 停止寫入線程，並寫入剩餘的樣本
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self._flush_pending()
+        
+        # 結束影片編碼（寫完佇列中剩餘的幀）
+        self._stop_video_writer()
+        
+        if len(self.session) == 0:
+            self._discard_video()
             print("⚠️ 沒有記錄到任何資料")
             return False
         
         # 更新元資料
-        self.session.metadata['duration'] = time.time() - self.session.start_time
-        self.session.metadata['num_frames'] = len(self.session.frames)
+        self.session.metadata['duration'] = time.monotonic() - self.session.start_monotonic
+        self.session.metadata['num_frames'] = len(self.session)
         
         # 儲存資訊（在重置 session 前）
         duration = self.session.metadata['duration']
@@ -552,21 +794,15 @@ class MotionRecorder:
         success = self._save_data(save_path)
         
         # 儲存影片（如果有攝影機資料）
-        if self.enable_camera and self.session.frames[0].frame_image is not None:
-            video_path = save_path.replace('.npz', '.mp4')
-            self._save_video(video_path)
+        self._save_video(save_path.replace('.npz', '.mp4'))
         
         # 關閉攝影機，釋放資源
         self._close_camera()
         
         # 清理快取（防止記憶體洩漏）
         self._cached_frame = None
+        self._frame_bufs = [None, None]
         self._cached_landmarks = None
-        self._cached_has_hand = False
-        
-        # 強制垃圾回收
-        import gc
-        gc.collect()
         
         # 重置會話
         self.session = None
@@ -584,25 +820,13 @@ class MotionRecorder:
             # 建立目錄
             Path(path).parent.mkdir(parents=True, exist_ok=True)
             
-            # 準備資料
-            timestamps = np.array([f.timestamp for f in self.session.frames])
-            emg_data = np.array([f.emg_data for f in self.session.frames])
-            
-            # 手部關鍵點（可能有 None）
-            landmarks_list = []
-            for f in self.session.frames:
-                if f.hand_landmarks is not None:
-                    landmarks_list.append(f.hand_landmarks)
-                else:
-                    landmarks_list.append(np.zeros((21, 3)))  # 填充零
-            
-            landmarks = np.array(landmarks_list)
-            
-            # 標記哪些幀有有效的手部偵測
-            landmarks_valid = np.array([
-                f.hand_landmarks is not None 
-                for f in self.session.frames
-            ])
+            # 各欄位已是連續陣列，只取已寫入的部分（切片不複製）
+            session = self.session
+            n = len(session)
+            timestamps = session.timestamps[:n]
+            emg_data = session.emg_data[:n]
+            landmarks = session.landmarks[:n]  # 未偵測到手部時為零
+            landmarks_valid = session.landmarks_valid[:n]  # 標記哪些幀有有效的手部偵測
             
             # 儲存
             np.savez(
@@ -620,38 +844,110 @@ class MotionRecorder:
             print(f"❌ 儲存資料失敗: {e}")
             return False
     
+    def _start_video_writer(self, fps: float) -> None:
+        """開啟影片寫入器並啟動編碼線程（先寫入暫存檔，停止時再移到儲存路徑）
+        
+        寫入器無法開啟時不建立佇列，捕捉線程就不會送入任何幀
+        """
+        fd, self._video_temp_path = tempfile.mkstemp(suffix='.mp4')
+        os.close(fd)
+        self._video_frames_written = 0
+        width, height = (int(v) for v in self._frame_wh)
+        writer = _open_video_writer(self._video_temp_path, fps, (width, height))
+        if not writer.isOpened():
+            writer.release()
+            self._discard_video()
+            print("⚠️ 無法開啟影片寫入器，本次只記錄 EMG 與關鍵點")
+            return
+        self._video_queue = queue.Queue(maxsize=self.VIDEO_QUEUE_SIZE)
+        self._video_thread = threading.Thread(
+            target=self._video_encode_loop,
+            args=(self._video_queue, writer, (width, height)),
+            daemon=True,
+            name="VideoEncode"
+        )
+        self._video_thread.start()
+    
+    def _video_encode_loop(
+        self,
+        video_queue: queue.Queue,
+        writer: cv2.VideoWriter,
+        size: tuple[int, int]
+    ) -> None:
+        """編碼線程：從佇列取出幀，繪製關鍵點後寫入影片；收到 None 時結束
+        
+        寫入失敗時提前結束；無論如何都由本線程釋放寫入器，讓已寫入的部分成為完整檔案
+        """
+        try:
+            while True:
+                item = video_queue.get()
+                if item is None:
+                    break
+                img, landmarks = item
+                if (img.shape[1], img.shape[0]) != size:
+                    # 攝影機實際輸出與回報的解析度不同時，縮放到寫入器的尺寸
+                    img = cv2.resize(img, size)
+                # 可選：在影像上繪製手部關鍵點
+                if landmarks is not None:
+                    img = self._draw_landmarks(img, landmarks)
+                writer.write(img)
+                self._video_frames_written += 1
+        except Exception as e:
+            print(f"❌ 影片編碼失敗: {e}")
+        finally:
+            writer.release()
+    
+    def _stop_video_writer(self) -> None:
+        """停止編碼線程（寫完佇列中剩餘的幀）
+        
+        只在編碼線程仍存活時送出結束標記並限時等待：
+        線程已因錯誤結束時佇列可能是滿的，阻塞的 put 會讓 GUI 線程永遠卡住
+        """
+        video_queue = self._video_queue
+        if video_queue is None:
+            return
+        self._video_queue = None  # 捕捉線程不再送入新幀
+        thread = self._video_thread
+        self._video_thread = None
+        if thread is None:
+            return
+        deadline = time.monotonic() + self.VIDEO_STOP_TIMEOUT
+        while thread.is_alive() and time.monotonic() < deadline:
+            try:
+                video_queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print("⚠️ 影片編碼未在時限內結束，影片可能不完整")
+    
+    def _discard_video(self) -> None:
+        """刪除未使用的影片暫存檔"""
+        if self._video_temp_path is not None:
+            try:
+                os.remove(self._video_temp_path)
+            except OSError:
+                pass
+            self._video_temp_path = None
+    
     def _save_video(self, path: str) -> bool:
-        """儲存影片"""
+        """將錄影期間編碼好的影片移到儲存路徑"""
         try:
-            if not self.session.frames or self.session.frames[0].frame_image is None:
+            if self._video_temp_path is None or self._video_frames_written == 0:
+                self._discard_video()
                 return False
             
             # 建立目錄
             Path(path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # 取得影像尺寸
-            height, width = self.session.frames[0].frame_image.shape[:2]
-            
-            # 建立影片寫入器
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            fps = self.session.metadata.get('camera_fps', 30)
-            out = cv2.VideoWriter(path, fourcc, fps, (width, height))
-            
-            # 寫入每一幀
-            for frame in self.session.frames:
-                if frame.frame_image is not None:
-                    # 可選：在影像上繪製手部關鍵點
-                    img = frame.frame_image.copy()
-                    if frame.hand_landmarks is not None:
-                        img = self._draw_landmarks(img, frame.hand_landmarks)
-                    out.write(img)
-            
-            out.release()
+            shutil.move(self._video_temp_path, path)
+            self._video_temp_path = None
             print(f"✅ 影片已儲存: {path}")
             return True
             
         except Exception as e:
             print(f"❌ 儲存影片失敗: {e}")
+            self._discard_video()
             return False
     
     def _draw_landmarks(
@@ -668,11 +964,11 @@ class MotionRecorder:
         Returns:
             繪製後的影像
         """
-        height, width = image.shape[:2]
+        # 一次向量化轉為像素座標
+        points = (landmarks[:, :2] * self._frame_wh).astype(np.int32).tolist()
         
         # 繪製關鍵點
-        for i, (x, y, z) in enumerate(landmarks):
-            cx, cy = int(x * width), int(y * height)
+        for i, (cx, cy) in enumerate(points):
             cv2.circle(image, (cx, cy), 5, (0, 255, 0), -1)
             cv2.putText(
                 image, str(i), (cx + 5, cy - 5),
@@ -682,49 +978,24 @@ class MotionRecorder:
         # 繪製連接線（手部骨架）
         if self.mp_hands is not None:
             connections = self.mp_hands.HAND_CONNECTIONS
-            for connection in connections:
-                start_idx, end_idx = connection
-                start = landmarks[start_idx]
-                end = landmarks[end_idx]
-                
-                start_pt = (int(start[0] * width), int(start[1] * height))
-                end_pt = (int(end[0] * width), int(end[1] * height))
-                
-                cv2.line(image, start_pt, end_pt, (0, 255, 0), 2)
+            for start_idx, end_idx in connections:
+                cv2.line(
+                    image, tuple(points[start_idx]), tuple(points[end_idx]),
+                    (0, 255, 0), 2
+                )
         
         return image
     
-    def get_preview_frame(self) -> Optional[np.ndarray]:
-        """取得當前的攝影機預覽幀（用於 UI 顯示）
+    def release(self) -> None:
+        """釋放資源
         
-        Returns:
-            當前幀影像（BGR），若攝影機未啟用則返回 None
+        先停止捕捉線程（設定停止旗標並等待結束），再釋放攝影機，
+        避免線程仍在使用 self.cap 時被釋放
         """
-        if not self.enable_camera or self.cap is None:
-            return None
-        
-        ret, frame = self.cap.read()
-        if not ret:
-            return None
-        
-        # 處理手部追蹤
-        if self.hands is not None:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(frame_rgb)
-            
-            if results.multi_hand_landmarks:
-                hand = results.multi_hand_landmarks[0]
-                landmarks = np.array([
-                    [lm.x, lm.y, lm.z] 
-                    for lm in hand.landmark
-                ])
-                frame = self._draw_landmarks(frame, landmarks)
+        self._stop_camera_thread()
         
-        return frame
-    
-    def release(self) -> None:
-        """釋放資源"""
         if self.cap is not None:
+            self._cap_ready.clear()
             self.cap.release()
             self.cap = None
         
@@ -737,7 +1008,7 @@ class MotionRecorder:
             self.hands = None
     
     def __del__(self):
-        """解構函數"""
+        """解構函數：停止線程並釋放攝影機與 MediaPipe"""
         try:
             self.release()
         except Exception:
@@ -768,10 +1039,10 @@ def test_motion_recorder():
     recorder.start_recording("test_gesture")
     
     # 模擬 EMG 資料
-    import random
+    rng = np.random.default_rng()
     print("📊 正在記錄模擬 EMG 資料...")
     for i in range(200):  # 1 秒（@ 200 Hz）
-        emg_data = [random.uniform(-1000, 1000) for _ in range(8)]
+        emg_data = rng.uniform(-1000, 1000, 8).astype(np.float32)
         recorder.add_emg_sample(emg_data)
         time.sleep(0.005)  # 5ms
         
@@ -3,33 +3,70 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
+import os
+import select
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Callable, Optional
 
+import numpy as np
 import serial
 import serial.tools.list_ports
 
-from . import data_parser
+from . import data_parser, framing
 
 logger = logging.getLogger(__name__)
 
 
 PacketCallback = Callable[[data_parser.EmgSample | data_parser.ImuSample], None]
+PacketBatchCallback = Callable[
+    [list[data_parser.EmgSample | data_parser.ImuSample]], None
+]
+EmgBatchCallback = Callable[[data_parser.EmgBatch], None]
 StatusCallback = Callable[[str], None]
 
+_EXPECTED_HEADER = data_parser.HEADER
+# Receive buffer size; holds well over a second of data at 921600 baud.
+_RX_CAPACITY = 64 * 1024
+# Largest single read; one wakeup takes whatever the driver has buffered.
+_READ_CHUNK = 8192
+# How long a blocking pyserial read waits before the reader thread rechecks
+# _running. The POSIX path instead sleeps until data or a wakeup byte arrives.
+_READ_TIMEOUT_S = 0.1
 
-@dataclass
+
+@dataclass(slots=True)
 class SerialDeviceManager:
     """Manage serial port communication with USB Bluetooth receiver."""
 
     on_packet: PacketCallback
     on_status: StatusCallback = lambda msg: None
     baud_rate: int = 921600  # WL-EMG 使用 921600 鮑率（根據官方文檔）
+    # When set, receives each read's packets in a single call.
+    on_packet_batch: Optional[PacketBatchCallback] = None
+    # When set, receives each read's EMG samples as one EmgBatch; the packet
+    # callbacks then only see the remaining (IMU) packets.
+    on_emg_batch: Optional[EmgBatchCallback] = None
 
     _serial: Optional[serial.Serial] = field(init=False, default=None)
-    _listen_task: Optional[asyncio.Task[None]] = field(init=False, default=None)
+    _reader_thread: Optional[threading.Thread] = field(init=False, default=None)
+    # Loop that owns the callbacks; the reader thread posts results to it.
+    _loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None)
     _running: bool = field(init=False, default=False)
+    # Fixed receive buffer; unparsed bytes live in _rx[_head:_tail].
+    _rx: bytearray = field(init=False, default_factory=lambda: bytearray(_RX_CAPACITY))
+    _head: int = field(init=False, default=0)
+    _tail: int = field(init=False, default=0)
+    # Unbuffered view of the port fd so reads land directly in _rx (POSIX).
+    _rx_file: Optional[io.FileIO] = field(init=False, default=None)
+    # Self-pipe written by disconnect() to wake a reader blocked in select().
+    _wake_fds: Optional[tuple[int, int]] = field(init=False, default=None)
+    _bytes_received: int = field(init=False, default=0)
+    _packets_found: int = field(init=False, default=0)
+    _last_log_time: float = field(init=False, default=0.0)
 
     @staticmethod
     def list_ports() -> list[str]:
@@ -64,7 +101,7 @@ class SerialDeviceManager:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1.0
+                timeout=_READ_TIMEOUT_S
             )
             
             if not self._serial.is_open:
@@ -72,9 +109,9 @@ class SerialDeviceManager:
             
             self.on_status(f"已連接到 {port}")
             
-            # 啟動監聽任務
+            # 開始監聽資料
             self._running = True
-            self._listen_task = asyncio.create_task(self._read_loop())
+            self._start_reading()
             
         except serial.SerialException as e:
             raise RuntimeError(f"序列埠連接失敗: {e}")
@@ -82,14 +119,20 @@ class SerialDeviceManager:
     async def disconnect(self) -> None:
         """斷開序列埠連接"""
         self._running = False
+        if self._wake_fds is not None:
+            os.write(self._wake_fds[1], b"\0")
         
-        if self._listen_task:
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
-            self._listen_task = None
+        if self._reader_thread:
+            # 讀取執行緒會立即被喚醒，或最多等待一次讀取逾時就會結束
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._reader_thread.join
+            )
+            self._reader_thread = None
+            self._rx_file = None
+        if self._wake_fds is not None:
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
         
         if self._serial and self._serial.is_open:
             self._serial.close()
@@ -97,88 +140,173 @@ class SerialDeviceManager:
         
         self.on_status("已斷開連接")
 
-    async def _read_loop(self) -> None:
-        """持續讀取序列埠資料"""
-        buffer = bytearray()
-        PACKET_LENGTH = 29  # 根據 data_parser.py 的 PAYLOAD_LENGTH
-        EXPECTED_HEADER = b'\xd2\xd2\xd2'  # data_parser.py 中定義的標頭
-        bytes_received = 0
-        last_log_time = 0
-        packets_found = 0
-        
+    def _start_reading(self) -> None:
+        """Start the reader thread that owns the port from here on.
+
+        Blocking reads release the GIL, and framing and parsing run on the
+        thread too, so the event loop only receives finished packets."""
+        self._head = self._tail = 0
+        self._bytes_received = 0
+        self._packets_found = 0
+        self._last_log_time = 0.0
         self.on_status("等待資料中...")
         logger.info("開始監聽序列埠資料...")
-        logger.info(f"尋找標頭: {EXPECTED_HEADER.hex()}")
-        
-        while self._running and self._serial and self._serial.is_open:
+        logger.info(f"尋找標頭: {_EXPECTED_HEADER.hex()}")
+
+        self._loop = asyncio.get_running_loop()
+        try:
+            self._rx_file = io.FileIO(self._serial.fileno(), "rb", closefd=False)
+            self._wake_fds = os.pipe()
+        except OSError:
+            self._rx_file = None  # No fd (Windows, URL ports); use pyserial reads
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop, name="SerialReader", daemon=True
+        )
+        self._reader_thread.start()
+
+    def _reader_loop(self) -> None:
+        """持續讀取序列埠資料（在讀取執行緒中執行）"""
+        # 迴圈中會用到的屬性與方法先綁定為區域變數
+        ser = self._serial
+        rx_file = self._rx_file
+        wait_for = [rx_file, self._wake_fds[0]] if rx_file is not None else []
+        wait = select.select
+        fill = self._fill
+        process = self._process_incoming
+        framing.warm_up()
+        while self._running:
             try:
-                # 非阻塞讀取
-                if self._serial.in_waiting > 0:
-                    data = self._serial.read(self._serial.in_waiting)
-                    bytes_received += len(data)
-                    buffer.extend(data)
-                    
-                    # 每秒記錄一次接收狀態
-                    import time
-                    current_time = time.time()
-                    if current_time - last_log_time > 1.0:
-                        logger.info(f"已接收 {bytes_received} bytes, 緩衝區: {len(buffer)} bytes, 已解析: {packets_found} 封包")
-                        self.on_status(f"已接收 {bytes_received} bytes")
-                        last_log_time = current_time
-                    
-                    # 除錯：顯示前 100 個位元組以尋找模式
-                    if bytes_received <= 200:
-                        logger.info(f"原始資料 ({len(data)} bytes): {data.hex()}")
-                        # 搜尋可能的標頭模式
-                        if bytes_received == 200:
-                            logger.info(f"前 200 bytes 完整資料: {buffer[:200].hex()}")
-                            logger.info("分析資料模式中...")
-                    
-                    # 嘗試尋找封包標頭並解析
-                    while len(buffer) >= PACKET_LENGTH:
-                        # 尋找標頭位置
-                        header_pos = buffer.find(EXPECTED_HEADER)
-                        
-                        if header_pos == -1:
-                            # 沒找到標頭，清除舊資料（保留最後幾個位元組以防標頭跨越）
-                            if len(buffer) > PACKET_LENGTH:
-                                buffer = buffer[-(PACKET_LENGTH-1):]
-                            break
-                        
-                        # 移除標頭前的垃圾資料
-                        if header_pos > 0:
-                            buffer = buffer[header_pos:]
-                        
-                        # 檢查是否有完整封包
-                        if len(buffer) < PACKET_LENGTH:
-                            break
-                        
-                        # 提取完整封包
-                        packet_data = bytes(buffer[:PACKET_LENGTH])
-                        buffer = buffer[PACKET_LENGTH:]
-                        
-                        try:
-                            # 解析封包
-                            packet = data_parser.parse_packet(packet_data)
-                            self.on_packet(packet)
-                            packets_found += 1
-                        except data_parser.PacketError as e:
-                            logger.warning(f"封包解析錯誤: {e}")
-                            if packets_found == 0:
-                                logger.warning(f"問題封包 hex: {packet_data.hex()}")
-                            # 繼續處理下一個封包
-                
-                # 短暫休眠，避免 CPU 過度使用
-                await asyncio.sleep(0.01)
-                
-            except serial.SerialException as e:
-                logger.error(f"序列埠讀取錯誤: {e}")
-                self.on_status(f"序列埠錯誤: {e}")
+                if rx_file is not None:
+                    # 閒置時不設逾時，直到資料到達或 disconnect() 喚醒為止
+                    ready, _, _ = wait(wait_for, (), ())
+                    if rx_file not in ready:
+                        continue  # 喚醒用的位元組；迴圈條件會檢查 _running
+                    # pyserial 的 fd 為非阻塞模式
+                    # 非阻塞讀取會直接取回驅動程式中所有資料，不需查詢 in_waiting
+                    received = fill(_READ_CHUNK)
+                    if received == 0:
+                        # 可讀但沒有資料代表裝置已移除
+                        raise serial.SerialException("裝置回報可讀但沒有資料（可能已移除）")
+                else:
+                    # 阻塞讀取，至少一個位元組或逾時；固定大小的讀取會等滿逾時，
+                    # 所以這裡仍依 in_waiting 決定大小
+                    received = fill(ser.in_waiting or 1)
+                if received:
+                    process(received)
+            except OSError as e:
+                if self._running:
+                    logger.error(f"序列埠讀取錯誤: {e}")
+                    self._post(self.on_status, f"序列埠錯誤: {e}")
                 break
             except Exception as e:
-                logger.error(f"資料處理錯誤: {e}")
+                logger.error("資料處理錯誤: %s", e)
                 # 繼續嘗試讀取
 
+    def _post(self, callback: Callable[..., None], *args: object) -> None:
+        """Run ``callback`` on the event loop thread."""
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+    def _dispatch(
+        self, packets: list[data_parser.EmgSample | data_parser.ImuSample]
+    ) -> None:
+        if self.on_packet_batch is not None:
+            self.on_packet_batch(packets)
+            return
+        for packet in packets:
+            self.on_packet(packet)
+
+    def _process_incoming(self, received: int) -> None:
+        """Dispatch every complete packet after ``received`` new bytes."""
+        rx = self._rx
+        self._bytes_received += received
+        
+        # 每秒記錄一次接收狀態
+        current_time = time.monotonic()
+        if current_time - self._last_log_time > 1.0:
+            logger.info(
+                "已接收 %d bytes, 緩衝區: %d bytes, 已解析: %d 封包",
+                self._bytes_received, self._tail - self._head, self._packets_found,
+            )
+            self._post(self.on_status, f"已接收 {self._bytes_received} bytes")
+            self._last_log_time = current_time
+        
+        # 除錯：顯示前 200 個位元組以尋找模式（僅在 DEBUG 層級）
+        if self._bytes_received <= 200 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "原始資料 (%d bytes): %s", received, rx[self._tail - received:self._tail].hex()
+            )
+            # 搜尋可能的標頭模式
+            if self._bytes_received == 200:
+                logger.debug("前 200 bytes 完整資料: %s", rx[:200].hex())
+                logger.debug("分析資料模式中...")
+        
+        # 一次找出緩衝區內所有完整封包，EMG 整批解碼
+        self._head, offsets = framing.drain(rx, self._head, self._tail)
+        if not offsets.size:
+            return
+        block = data_parser.gather_packets(rx, offsets)
+        is_emg = block[:, 3] == 0xAA
+        emg = data_parser.EmgBatch(
+            sequence=block[is_emg, 4],
+            channels_uv=data_parser.decode_emg_block(block[is_emg]).astype(np.float32),
+        )
+        self._packets_found += len(emg)
+        packets = []
+        if self.on_emg_batch is not None:
+            # EMG 整批送出，其餘封包（IMU）照常逐一解析
+            if len(emg):
+                self._post(self.on_emg_batch, emg)
+            for row in block[~is_emg]:
+                self._parse_other(row, packets)
+        else:
+            # 依原始順序交錯 EMG 與其他封包
+            emg_samples = iter(emg.to_samples())
+            for row, is_emg_row in zip(block, is_emg.tolist()):
+                if is_emg_row:
+                    packets.append(next(emg_samples))
+                else:
+                    self._parse_other(row, packets)
+        
+        # 整批交給事件迴圈執行緒，回呼不會在讀取執行緒中執行
+        if packets:
+            self._post(self._dispatch, packets)
+
+    def _parse_other(self, row: np.ndarray, packets: list) -> None:
+        """解析非 EMG 封包（IMU 等），成功時加入 ``packets``"""
+        try:
+            packets.append(data_parser.parse_packet(row))
+            self._packets_found += 1
+        except data_parser.PacketError as e:
+            logger.warning("封包解析錯誤: %s", e)
+            if self._packets_found == 0:
+                logger.warning("問題封包 hex: %s", row.tobytes().hex())
+
+    def _fill(self, count: int) -> Optional[int]:
+        """Read up to ``count`` bytes from the port straight into ``_rx``.
+
+        Only indices move while framing; the leftover partial packet is moved
+        back to the front when the buffer runs out of room at the end. Returns
+        the number of bytes read (0 on timeout), or None if a non-blocking read
+        found none."""
+        rx = self._rx
+        if self._tail + count > len(rx):
+            pending = self._tail - self._head
+            rx[:pending] = rx[self._head:self._tail]
+            self._head, self._tail = 0, pending
+            # 剩下的資料留在驅動程式中，下一次讀取時再處理
+            count = min(count, len(rx) - pending)
+        with memoryview(rx)[self._tail:self._tail + count] as view:
+            if self._rx_file is not None:
+                received = self._rx_file.readinto(view)
+            else:
+                received = self._serial.readinto(view)
+        if received:
+            self._tail += received
+        return received
+
     @property
     def is_connected(self) -> bool:
         """檢查是否已連接"""
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Callable, Optional
 
 from . import config
-from .data_parser import EmgSample, ImuSample
+from .data_parser import EmgBatch, EmgSample, ImuSample
 from .simulator import emg_waveform_generator, imu_waveform_generator
 
+# Samples gathered per wakeup when a batch callback is set (20 ms at 200 Hz).
+_BATCH_SAMPLES = 4
+
 
 class SimulatedDeviceManager:
     """Mimic the DeviceManager API using synthetic signals."""
@@ -17,9 +21,17 @@ class SimulatedDeviceManager:
         self,
         on_packet: Callable[[EmgSample | ImuSample], None],
         on_status: Callable[[str], None] = lambda msg: None,
+        on_packet_batch: Optional[
+            Callable[[list[EmgSample | ImuSample]], None]
+        ] = None,
+        on_emg_batch: Optional[Callable[[EmgBatch], None]] = None,
     ) -> None:
         self._on_packet = on_packet
         self._on_status = on_status
+        # When set, receives all packets due at each wakeup in a single call.
+        self._on_packet_batch = on_packet_batch
+        # When set, receives the EMG samples of each wakeup as one EmgBatch.
+        self._on_emg_batch = on_emg_batch
         self._running = False
         self._task: Optional[asyncio.Task[None]] = None
 
@@ -47,11 +59,38 @@ class SimulatedDeviceManager:
         emg_gen = emg_waveform_generator()
         imu_gen = imu_waveform_generator()
         period = 1.0 / config.SAMPLE_RATE_HZ
+        # Batch consumers are woken once per several samples.
+        lead = 0.0
+        if self._on_packet_batch is not None or self._on_emg_batch is not None:
+            lead = (_BATCH_SAMPLES - 1) * period
         imu_counter = 0
+        next_tick = time.perf_counter()
         while self._running:
-            sample = next(emg_gen)
-            self._on_packet(sample)
-            imu_counter = (imu_counter + 1) % 20
-            if imu_counter == 0:
-                self._on_packet(next(imu_gen))
-            await asyncio.sleep(period)
+            # Emit every sample that is due, so a late wakeup (e.g. the coarse
+            # Windows timer) catches up instead of lowering the rate.
+            now = time.perf_counter()
+            if now - next_tick > 1.0:
+                next_tick = now  # Stalled; resume rather than burst
+            packets: list[EmgSample | ImuSample] = []
+            while next_tick <= now:
+                packets.append(next(emg_gen))
+                imu_counter = (imu_counter + 1) % 20
+                if imu_counter == 0:
+                    packets.append(next(imu_gen))
+                next_tick += period
+            self._dispatch(packets)
+            await asyncio.sleep(next_tick + lead - time.perf_counter())
+
+    def _dispatch(self, packets: list[EmgSample | ImuSample]) -> None:
+        if self._on_emg_batch is not None:
+            emg = [p for p in packets if isinstance(p, EmgSample)]
+            if emg:
+                self._on_emg_batch(EmgBatch.from_samples(emg))
+            packets = [p for p in packets if not isinstance(p, EmgSample)]
+        if not packets:
+            return
+        if self._on_packet_batch is not None:
+            self._on_packet_batch(packets)
+            return
+        for packet in packets:
+            self._on_packet(packet)
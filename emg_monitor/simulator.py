@@ -2,44 +2,60 @@
 
 from __future__ import annotations
 
-import math
 import os
-import random
-import time
 from typing import Iterator, Tuple
 
+import numpy as np
+
+from . import config
 from .data_parser import EmgSample, ImuSample
 
+# Samples generated per vectorized block.
+_BLOCK = 256
+_RNG = np.random.default_rng()
+
 
 def emg_waveform_generator(
     frequency_hz: float = 10.0, noise_level: float = 25.0
 ) -> Iterator[EmgSample]:
-    """Yield synthetic 8-channel EMG samples."""
+    """Yield synthetic 8-channel EMG samples.
+
+    Samples are computed ``_BLOCK`` at a time and timed by sample index at
+    ``config.SAMPLE_RATE_HZ``, which is the rate the simulator emits them.
+    The sine comes from a one-period lookup table, so ``frequency_hz`` is
+    rounded to the nearest whole number of samples per period."""
     sequence = 0
-    phase_offsets = [random.random() * math.pi for _ in range(8)]
-    start = time.monotonic()
+    period_n = max(1, round(config.SAMPLE_RATE_HZ / frequency_hz))
+    table = (np.sin(2 * np.pi * np.arange(period_n) / period_n) * 150.0).astype(
+        np.float32
+    )
+    # Per-channel phase as a table offset, up to half a period as before.
+    phase_idx = _RNG.integers(0, max(1, period_n // 2), config.EMG_CHANNELS)
+    steps = np.arange(_BLOCK)[:, None] + phase_idx
+    noise = np.empty((_BLOCK, config.EMG_CHANNELS), dtype=np.float32)
+    tick = 0
     while True:
-        t = time.monotonic() - start
-        channels = []
-        for idx, phase in enumerate(phase_offsets):
-            base = math.sin(2 * math.pi * frequency_hz * t + phase) * 150.0
-            noise = random.gauss(0, noise_level)
-            channels.append(base + noise)
-        yield EmgSample(sequence=sequence, channels_uv=channels)
-        sequence = (sequence + 1) % 256
+        _RNG.standard_normal(dtype=np.float32, out=noise)
+        block = noise * np.float32(noise_level)
+        block += table[(steps + tick) % period_n]
+        for row in block:
+            yield EmgSample(sequence=sequence, channels_uv=row)
+            sequence = (sequence + 1) % 256
+        tick = (tick + _BLOCK) % period_n
 
 
 def imu_waveform_generator() -> Iterator[ImuSample]:
     """Yield synthetic IMU samples."""
     sequence = 0
     while True:
-        gyro = [random.uniform(-1.5, 1.5) for _ in range(3)]
-        accel = [random.uniform(-0.5, 0.5) for _ in range(3)]
-        remainder = [0] * 6
-        yield ImuSample(
-            sequence=sequence,
-            gyro_rads=gyro,
-            accel_mss=accel,
-            remainder=remainder,
-        )
-        sequence = (sequence + 1) % 256
+        gyro = _RNG.uniform(-1.5, 1.5, (_BLOCK, 3)).astype(np.float32)
+        accel = _RNG.uniform(-0.5, 0.5, (_BLOCK, 3)).astype(np.float32)
+        remainder = np.zeros((_BLOCK, 6), dtype=np.int32)
+        for i in range(_BLOCK):
+            yield ImuSample(
+                sequence=sequence,
+                gyro_rads=gyro[i],
+                accel_mss=accel[i],
+                remainder=remainder[i],
+            )
+            sequence = (sequence + 1) % 256
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic, perf_counter
 from typing import Dict, Optional
 
 import numpy as np
@@ -23,7 +26,7 @@ pg.setConfigOptions(
 
 from .. import config
 from ..buffers import EmgRingBuffer
-from ..data_parser import EmgSample, ImuSample
+from ..data_parser import EmgBatch, EmgSample, ImuSample
 from ..device_manager import DeviceManager
 from ..sim_device import SimulatedDeviceManager
 from ..serial_device import SerialDeviceManager
@@ -34,6 +37,95 @@ from ..motion_recorder import (
 )
 from .. import motion_recorder as mr  # 用於呼叫 async 函數
 
+logger = logging.getLogger(__name__)
+
+# 基線自適應更新速率：接近基線 / 中等訊號 / 強訊號（極慢但不完全停止）
+_BASELINE_ALPHAS = np.array([0.02, 0.002, 0.0001])
+
+# 各通道的代表色（通道標籤與合併視圖曲線共用）
+_CHANNEL_COLORS = (
+    "#FF3B30",
+    "#FF9500",
+    "#FFCC00",
+    "#4CD964",
+    "#5AC8FA",
+    "#007AFF",
+    "#5856D6",
+    "#FF2D55",
+)
+
+# 主視窗樣式表（啟動時解析一次）；指示器以 role/state 屬性選擇樣式，
+# 狀態切換只需 _set_style_state 改屬性並重新 polish，不必重新解析 QSS
+_WINDOW_QSS = """
+QLabel[role="channelIndicator"] { font-size: 24px; color: gray; }
+QLabel[role="channelIndicator"][state="weak"] { color: #FF3B30; }
+QLabel[role="channelIndicator"][state="good"] { color: #FFCC00; }
+QLabel[role="channelIndicator"][state="strong"] { color: #4CD964; }
+QLabel[role="channelIndicator"][state="best"] { color: #5AC8FA; }
+QLabel[role="channelQuality"] { font-size: 9px; color: #666; }
+QLabel[role="channelQuality"][state="idle"] { color: #888; }
+QLabel[role="channelQuality"][state="weak"] { color: #FF3B30; }
+QLabel[role="channelQuality"][state="good"] { color: #FFCC00; font-weight: bold; }
+QLabel[role="channelQuality"][state="strong"] { color: #4CD964; font-weight: bold; }
+QLabel[role="channelQuality"][state="best"] { color: #5AC8FA; font-weight: bold; }
+QLabel[role="statusIndicator"] { font-size: 20px; color: gray; }
+QLabel[role="statusIndicator"][state="busy"] { color: #FFCC00; }
+QLabel[role="statusIndicator"][state="ok"] { color: #4CD964; }
+QLabel[role="statusIndicator"][state="error"] { color: #FF3B30; }
+QLabel[role="statusIndicator"][state="sim"] { color: #007AFF; }
+QPushButton#recordButton {
+    background-color: #FF3B30;
+    color: white;
+    font-weight: bold;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+QPushButton#recordButton:hover { background-color: #FF2D55; }
+QPushButton#recordButton[state="recording"] { background-color: #4CD964; }
+QPushButton#recordButton[state="recording"]:hover { background-color: #5AC8FA; }
+QPushButton#recordButton:disabled { background-color: #999; }
+"""
+# 狀態文字與說明標籤的固定樣式（切換時直接傳入常數，不再每次建立字串）
+_CSS_NOTE_IDLE = "color: gray; font-style: italic;"
+_CSS_NOTE_BUSY = "color: #FFCC00; font-style: italic;"
+_CSS_NOTE_ERROR = "color: #FF3B30; font-style: italic;"
+_CSS_TEXT_BUSY = "color: #FFCC00;"
+_CSS_TEXT_WARN = "color: #FFCC00; font-weight: bold;"
+_CSS_TEXT_OK = "color: #4CD964; font-weight: bold;"
+_CSS_TEXT_ERROR = "color: #FF3B30;"
+_CSS_TEXT_ALERT = "color: #FF3B30; font-weight: bold;"
+_CSS_HAND_FOUND = "QLabel { color: green; font-weight: bold; }"
+_CSS_HAND_LOST = "QLabel { color: orange; }"
+# 通道狀態的樣式名稱，依狀態索引（0=待機灰, 1=微弱紅, 2=良好黃, 3=強訊綠, 4=最佳藍）
+_CHANNEL_STATE_NAMES = ("idle", "weak", "good", "strong", "best")
+_QUALITY_TEXT = ("待機", "微弱", "良好", "強訊", "最佳")
+# 狀態圓點（USB / 藍牙 / 裝置 / 訊號接收）的樣式名稱
+_STATUS_IDLE = "idle"  # 灰：未連接 / 不使用
+_STATUS_BUSY = "busy"  # 黃：檢測中 / 連接中
+_STATUS_OK = "ok"  # 綠：正常
+_STATUS_ERROR = "error"  # 紅：失敗 / 超過 1 秒無訊號
+_STATUS_SIM = "sim"  # 藍：模擬模式
+_CHANNEL_CALIBRATING = -1  # 顯示狀態：基線校準中
+_CHANNEL_UNSTYLED = -2  # 顯示狀態：尚未套用任何狀態樣式
+# 進入狀態 1..4 所需的活動度（噪音水平的倍數）
+_STATE_RISE_FACTORS = np.array([2.0, 4.0, 7.0, 12.0])
+
+
+def _set_style_state(widget: QtWidgets.QWidget, state: str) -> None:
+    """切換元件的 state 屬性並重新套用主視窗樣式表中對應的規則（狀態未變時略過）"""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+# 繪圖最多佔用 UI 執行緒的時間比例；繪圖變慢時自動拉長計時器間隔
+_PLOT_DUTY_CYCLE = 0.5
+
+# 個別通道熱圖的固定色階（相對基線的偏離量，μV）
+_HEATMAP_LEVELS = (-1000.0, 1000.0)
+
 
 class CameraPreviewWindow(QtWidgets.QWidget):
     """攝影機預覽視窗（獨立視窗）"""
@@ -50,7 +142,6 @@ class CameraPreviewWindow(QtWidgets.QWidget):
         # 影像顯示標籤
         self.image_label = QtWidgets.QLabel()
         self.image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setScaledContents(False)
         self.image_label.setStyleSheet("QLabel { background-color: black; }")
         layout.addWidget(self.image_label)
         
@@ -58,6 +149,13 @@ class CameraPreviewWindow(QtWidgets.QWidget):
         self.status_label = QtWidgets.QLabel("正在等待攝影機...")
         self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
+        self._has_hand: Optional[bool] = None  # 目前狀態標籤顯示的結果
+        
+        # 320x240 影格共用的緩衝區與包裝它的 QImage（每幀只複製像素，不重新配置）
+        self._frame_buf = np.zeros((240, 320, 3), dtype=np.uint8)
+        self._frame_image = QtGui.QImage(
+            self._frame_buf.data, 320, 240, 320 * 3, QtGui.QImage.Format.Format_BGR888
+        )
     
     def update_frame(self, frame: np.ndarray, has_hand: bool = False) -> None:
         """更新顯示的影像幀
@@ -69,38 +167,40 @@ class CameraPreviewWindow(QtWidgets.QWidget):
         if frame is None:
             return
         
-        # 轉換為 RGB（Qt 使用 RGB 格式）
-        rgb_frame = frame[:, :, ::-1].copy()
-        
-        # 轉換為 QImage
-        height, width, channel = rgb_frame.shape
-        bytes_per_line = channel * width
-        q_image = QtGui.QImage(
-            rgb_frame.data, 
-            width, 
-            height, 
-            bytes_per_line, 
-            QtGui.QImage.Format.Format_RGB888
-        )
-        
-        # 直接設定固定大小的 pixmap（不再動態縮放）
-        pixmap = QtGui.QPixmap.fromImage(q_image)
-        # 使用快速縮放模式以提升效能
-        scaled_pixmap = pixmap.scaled(
-            320, 240,  # 從 480x360 降至 320x240
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.FastTransformation  # 改用快速模式
-        )
+        if frame.shape == self._frame_buf.shape:
+            # 攝影機已輸出 320x240：複製到共用緩衝區（鏡像視圖也在此一併寫成連續列）
+            np.copyto(self._frame_buf, frame)
+            pixmap = QtGui.QPixmap.fromImage(self._frame_image)
+        else:
+            # QImage 需要連續的列；直接以 BGR 格式建立 QImage（不需轉換為 RGB）
+            frame = np.ascontiguousarray(frame)
+            height, width, _ = frame.shape
+            q_image = QtGui.QImage(
+                frame.data, 
+                width, 
+                height, 
+                frame.strides[0], 
+                QtGui.QImage.Format.Format_BGR888
+            )
+            # 使用快速縮放模式以提升效能
+            pixmap = QtGui.QPixmap.fromImage(q_image).scaled(
+                320, 240,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.FastTransformation
+            )
         
-        self.image_label.setPixmap(scaled_pixmap)
+        self.image_label.setPixmap(pixmap)
         
-        # 更新狀態
+        # 更新狀態（只在偵測結果改變時）
+        if has_hand == self._has_hand:
+            return
+        self._has_hand = has_hand
         if has_hand:
             self.status_label.setText("✅ 偵測到手部")
-            self.status_label.setStyleSheet("QLabel { color: green; font-weight: bold; }")
+            self.status_label.setStyleSheet(_CSS_HAND_FOUND)
         else:
             self.status_label.setText("⚠️ 未偵測到手部")
-            self.status_label.setStyleSheet("QLabel { color: orange; }")
+            self.status_label.setStyleSheet(_CSS_HAND_LOST)
     
     def closeEvent(self, event):
         """視窗關閉時的處理"""
@@ -112,6 +212,7 @@ class PacketBridge(QtCore.QObject):
     """Bridge raw callbacks to Qt signals."""
 
     emg_received = QtCore.pyqtSignal(object)
+    emg_batch_received = QtCore.pyqtSignal(object)
     imu_received = QtCore.pyqtSignal(object)
     status_changed = QtCore.pyqtSignal(str)
 
@@ -121,6 +222,9 @@ class PacketBridge(QtCore.QObject):
         else:
             self.imu_received.emit(packet)
 
+    def emit_emg_batch(self, batch: EmgBatch) -> None:
+        self.emg_batch_received.emit(batch)
+
     def emit_status(self, message: str) -> None:
         self.status_changed.emit(message)
 
@@ -139,21 +243,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("WL-EMG Monitor")
         self._bridge = PacketBridge()
         self._bridge.emg_received.connect(self._handle_emg_sample)
+        self._bridge.emg_batch_received.connect(self._handle_emg_batch)
         self._bridge.imu_received.connect(self._handle_imu_sample)
         self._bridge.status_changed.connect(self._handle_status_update)
 
+        # 所有裝置的 EMG 都以整批送出：每批只發出一個 Qt 訊號，
+        # 逐一的 emit_packet 只剩 IMU 等其他封包使用
         self._real_manager = DeviceManager(
             notification_uuid=config.DEFAULT_NOTIFICATION_UUID,
             on_packet=self._bridge.emit_packet,
             on_status=self._bridge.emit_status,
+            on_emg_batch=self._bridge.emit_emg_batch,
         )
         self._serial_manager = SerialDeviceManager(
             on_packet=self._bridge.emit_packet,
             on_status=self._bridge.emit_status,
+            on_emg_batch=self._bridge.emit_emg_batch,
         )
         self._sim_manager = SimulatedDeviceManager(
             on_packet=self._bridge.emit_packet,
             on_status=self._bridge.emit_status,
+            on_emg_batch=self._bridge.emit_emg_batch,
         )
         self._active_manager: Optional[
             DeviceManager | SerialDeviceManager | SimulatedDeviceManager
@@ -165,9 +275,20 @@ class MainWindow(QtWidgets.QMainWindow):
             channels=config.EMG_CHANNELS,
             capacity=config.SAMPLE_RATE_HZ * config.BUFFER_SECONDS,
         )
-        self._display_offsets = [
-            idx * 400.0 for idx in range(config.EMG_CHANNELS)
-        ]
+        # 每個通道的顯示偏移量，形狀 (channels, 1) 以便一次加到整個快照
+        self._display_offsets = (
+            np.arange(config.EMG_CHANNELS, dtype=np.float32)[:, None] * 400.0
+        )
+        # 整個緩衝區的時間軸（秒，最新樣本為 0），繪圖時取最後 points 點的視圖
+        capacity = self._buffer.capacity
+        # 合併視圖（加上偏移量）與熱圖（減去基線）的工作區，每次繪圖重複使用
+        self._display_workspace = np.empty((config.EMG_CHANNELS, capacity), dtype=np.float32)
+        self._heatmap_workspace = np.empty((config.EMG_CHANNELS, capacity), dtype=np.float32)
+        self._plot_x = (
+            np.arange(1 - capacity, 1, dtype=np.float32) / np.float32(config.SAMPLE_RATE_HZ)
+        )
+        self._last_plot_seq = -1  # 上次繪圖時的緩衝區寫入序號（無新資料就不重繪）
+        self._pending_emg: list[np.ndarray] = []  # 尚未寫入緩衝區的 EMG 樣本，每項形狀 (n, channels)
         
         # 狀態追蹤
         self._last_packet_time = 0.0
@@ -175,26 +296,43 @@ class MainWindow(QtWidgets.QMainWindow):
         self._signal_strength = 0.0
         self._is_simulation = False
         
-        # 通道基線追蹤（用於計算變化量）
-        self._channel_baseline = [0.0] * config.EMG_CHANNELS
-        self._channel_last_values = [0.0] * config.EMG_CHANNELS
-        self._channel_current_state = [0] * config.EMG_CHANNELS  # 當前狀態（0=待機灰, 1=微弱紅, 2=良好黃, 3=強訊綠, 4=最佳藍）
-        self._channel_noise_level = [0.0] * config.EMG_CHANNELS  # 每個通道的基線噪音水平
+        # 由 _refresh_indicators 以固定頻率套用的顯示狀態（只寫入有變的部分）
+        self._pending_status: Optional[str] = None  # 尚未顯示的狀態列文字
+        self._pending_imu: Optional[ImuSample] = None  # 尚未顯示的最新 IMU 樣本（顯示時才格式化）
+        self._activity_pending = False  # _stats_deviation 是否有尚未顯示的活動度
+        self._pending_log: list[str] = []  # 尚未寫入記錄區的訊息（每次計時器觸發一次寫入）
+        # 訊號接收指示器目前顯示的狀態：True=接收中, False=超過 1 秒無訊號, None=未連接
+        self._signal_ok: Optional[bool] = None
+        # 整體訊號強度標籤目前顯示的 (μV 整數, 等級)；None = 無訊號，(-1, -1) = 未連接
+        self._strength_key: Optional[tuple[int, int]] = (-1, -1)
+        
+        # 通道基線追蹤（用於計算變化量；以向量一次更新 8 個通道）
+        # 使用 float64：基線的極慢更新（alpha=0.0001）在 float32 下會被捨入掉
+        self._channel_baseline = np.zeros(config.EMG_CHANNELS)
+        self._channel_last_values = np.zeros(config.EMG_CHANNELS)
+        self._channel_current_state = np.zeros(config.EMG_CHANNELS, dtype=np.intp)  # 當前狀態（0=待機灰, 1=微弱紅, 2=良好黃, 3=強訊綠, 4=最佳藍）
+        # 畫面上目前套用的狀態；只有與新狀態不同時才切換樣式
+        self._channel_display_state = np.full(config.EMG_CHANNELS, _CHANNEL_UNSTYLED, dtype=np.intp)
+        # 強度標籤目前顯示的文字；文字相同時不呼叫 setText
+        self._channel_strength_text = ["--"] * config.EMG_CHANNELS
+        # 每個通道判斷狀態用的噪音基準倒數（校準完成時計算一次），與換算用的暫存陣列
+        self._channel_state_inv_scale = np.full(config.EMG_CHANNELS, 1 / 100.0)
+        self._state_ratio = np.zeros(config.EMG_CHANNELS)
+        self._channel_noise_level = np.zeros(config.EMG_CHANNELS)  # 每個通道的基線噪音水平
+        # 由噪音水平導出的自適應速率閾值（校準完成時計算一次）
+        self._noise_x2 = np.zeros(config.EMG_CHANNELS)
+        self._noise_x5 = np.zeros(config.EMG_CHANNELS)
+        # 每個樣本重複使用的暫存陣列（避免每次配置新陣列）
+        self._stats_diff = np.zeros(config.EMG_CHANNELS)
+        self._stats_deviation = np.zeros(config.EMG_CHANNELS)
         self._baseline_initialized = False  # 基線是否已初始化
         self._initialization_samples = 500  # 初始化需要的樣本數（約2.5秒）
         self._last_baseline_reset = 0  # 上次基線重置時間
         
-        # 個別視圖更新計數器（降低更新頻率以提升效能）
-        self._individual_plot_update_counter = 0
-        self._individual_plot_update_interval = 25  # 每 25 次才更新個別視圖（1 FPS = 5 FPS / 5）
-        
-        # 通道輪流更新（不是每次全更新 8 個通道）
-        self._channel_update_index = 0
-        self._channels_per_update = 2  # 每次只更新 2 個通道
+        # 個別通道熱圖更新間隔（降低更新頻率以提升效能，與繪圖計時器間隔無關）
+        self._last_heatmap_time = 0.0
+        self._heatmap_period = 0.2  # 每 0.2 秒更新一次（5 FPS）
         
-        # 攝影機預覽更新控制（降低幀率以提升效能）
-        self._camera_frame_counter = 0
-        self._camera_frame_skip = 13  # 每 13 個 EMG 樣本更新一次預覽（200Hz / 13 ≈ 15fps）
 
         # 動作記錄器
         self._motion_recorder: Optional[MotionRecorder] = None
@@ -204,12 +342,41 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # 攝影機預覽視窗
         self._camera_preview: Optional[CameraPreviewWindow] = None
+        
+        # 控制項狀態：上次套用到畫面的值（見 _set_controls_enabled）
+        self._scanning = False
+        self._ui_state: Dict[str, object] = {}
 
         self._build_ui()
+        
+        # 繪圖與攝影機預覽都不超過螢幕更新率
+        screen = QtGui.QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen is not None else 60.0
+        self._frame_interval_ms = 1000 / refresh_hz
+        
+        # 繪圖計時器：以螢幕更新率為下限，依上次繪圖耗時自動調整（見 _refresh_plot）
         self._plot_timer = QtCore.QTimer(self)
-        self._plot_timer.setInterval(200)  # 5 FPS - 降低 CPU 負載（從 20 FPS 改為 5 FPS）
+        self._plot_timer.setInterval(int(self._frame_interval_ms))
         self._plot_timer.timeout.connect(self._refresh_plot)
         self._plot_timer.start()
+        
+        # 每 20ms 將累積的 EMG 樣本整批寫入緩衝區（取代每個封包各寫一次）；
+        # 只在連線期間運行，由 _on_connect_clicked / _disconnect_active 啟停
+        self._emg_flush_timer = QtCore.QTimer(self)
+        self._emg_flush_timer.setInterval(20)
+        self._emg_flush_timer.timeout.connect(self._flush_emg_samples)
+        
+        # 狀態列、訊號強度與通道指示器以固定 10 Hz 更新，與封包速率脫鉤
+        self._indicator_timer = QtCore.QTimer(self)
+        self._indicator_timer.setInterval(100)
+        self._indicator_timer.timeout.connect(self._refresh_indicators)
+        self._indicator_timer.start()
+        
+        # 攝影機預覽使用獨立計時器，與 EMG 封包到達頻率脫鉤
+        # 不超過螢幕更新率，也不超過攝影機約 15fps 的輸出
+        self._camera_timer = QtCore.QTimer(self)
+        self._camera_timer.setInterval(int(max(self._frame_interval_ms, 1000 / 15)))
+        self._camera_timer.timeout.connect(self._refresh_camera_preview)
 
         self._log("Ready.")
         
@@ -218,6 +385,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ------------------------------------------------------------------ UI --
     def _build_ui(self) -> None:
+        self.setStyleSheet(_WINDOW_QSS)
         central = QtWidgets.QWidget(self)
         layout = QtWidgets.QVBoxLayout(central)
         
@@ -236,7 +404,7 @@ class MainWindow(QtWidgets.QMainWindow):
         usb_layout.addWidget(self._usb_device_combo, stretch=1)
         
         self._usb_info_label = QtWidgets.QLabel("點擊按鈕檢測 USB 序列埠（藍牙接收器）")
-        self._usb_info_label.setStyleSheet("color: gray; font-style: italic;")
+        self._usb_info_label.setStyleSheet(_CSS_NOTE_IDLE)
         usb_layout.addWidget(self._usb_info_label)
         usb_layout.addStretch()
         
@@ -273,7 +441,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 1. USB 接收器狀態（新增）
         self._usb_status_label = QtWidgets.QLabel("🔌 USB 接收器")
         self._usb_status_indicator = QtWidgets.QLabel("●")
-        self._usb_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
+        self._usb_status_indicator.setProperty("role", "statusIndicator")
         self._usb_status_text = QtWidgets.QLabel("未檢測")
         self._usb_status_text.setStyleSheet("color: gray;")
         status_layout.addWidget(self._usb_status_label)
@@ -284,7 +452,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 2. 藍牙功能狀態
         self._bt_status_label = QtWidgets.QLabel("� 藍牙功能")
         self._bt_status_indicator = QtWidgets.QLabel("●")
-        self._bt_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
+        self._bt_status_indicator.setProperty("role", "statusIndicator")
         status_layout.addWidget(self._bt_status_label)
         status_layout.addWidget(self._bt_status_indicator)
         status_layout.addSpacing(20)
@@ -292,7 +460,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 3. 裝置連接狀態
         self._device_status_label = QtWidgets.QLabel("📱 EMG 裝置")
         self._device_status_indicator = QtWidgets.QLabel("●")
-        self._device_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
+        self._device_status_indicator.setProperty("role", "statusIndicator")
         status_layout.addWidget(self._device_status_label)
         status_layout.addWidget(self._device_status_indicator)
         status_layout.addSpacing(20)
@@ -300,7 +468,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 4. 訊號接收狀態
         self._signal_status_label = QtWidgets.QLabel("� 訊號接收")
         self._signal_status_indicator = QtWidgets.QLabel("●")
-        self._signal_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
+        self._signal_status_indicator.setProperty("role", "statusIndicator")
         status_layout.addWidget(self._signal_status_label)
         status_layout.addWidget(self._signal_status_indicator)
         status_layout.addSpacing(20)
@@ -353,32 +521,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self._record_button.clicked.connect(self._on_record_clicked)
         self._record_button.setEnabled(False)  # 初始時停用，等待 MediaPipe 載入
         self._record_button.setToolTip("正在載入 MediaPipe，請稍候...")
-        self._record_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF3B30;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #FF2D55;
-            }
-            QPushButton:disabled {
-                background-color: #999;
-            }
-        """)
+        self._record_button.setObjectName("recordButton")
         self._record_button.setEnabled(False)  # 未連接時禁用
         recording_layout.addWidget(self._record_button)
         
         # 記錄狀態指示
         self._recording_status_label = QtWidgets.QLabel("就緒")
-        self._recording_status_label.setStyleSheet("color: gray; font-style: italic;")
+        self._recording_status_label.setStyleSheet(_CSS_NOTE_IDLE)
         recording_layout.addWidget(self._recording_status_label)
         
         # 記錄時間顯示
         self._recording_time_label = QtWidgets.QLabel("")
-        self._recording_time_label.setStyleSheet("color: #FF3B30; font-weight: bold;")
+        self._recording_time_label.setStyleSheet(_CSS_TEXT_ALERT)
         recording_layout.addWidget(self._recording_time_label)
         
         recording_layout.addStretch()
@@ -401,7 +555,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._channel_strength_labels = []
         self._channel_quality_labels = []
         
-        colors = ["#FF3B30", "#FF9500", "#FFCC00", "#4CD964", "#5AC8FA", "#007AFF", "#5856D6", "#FF2D55"]
+        colors = _CHANNEL_COLORS
         
         for i in range(config.EMG_CHANNELS):
             # 每個通道的垂直佈局
@@ -415,7 +569,7 @@ class MainWindow(QtWidgets.QMainWindow):
             
             # 訊號強度指示器（圓點）
             indicator = QtWidgets.QLabel("●")
-            indicator.setStyleSheet("color: gray; font-size: 24px;")
+            indicator.setProperty("role", "channelIndicator")
             indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             self._channel_indicators.append(indicator)
             ch_layout.addWidget(indicator)
@@ -430,7 +584,7 @@ class MainWindow(QtWidgets.QMainWindow):
             # 訊號品質
             quality_label = QtWidgets.QLabel("--")
             quality_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            quality_label.setStyleSheet("font-size: 9px; color: #666;")
+            quality_label.setProperty("role", "channelQuality")
             self._channel_quality_labels.append(quality_label)
             ch_layout.addWidget(quality_label)
             
@@ -454,71 +608,51 @@ class MainWindow(QtWidgets.QMainWindow):
         self._plot_widget.setLabel("bottom", "Time (s)")
         self._plot_widget.setLimits(xMin=-config.BUFFER_SECONDS, xMax=0)
         self._plot_widget.setMinimumHeight(400)  # 確保全頻道視圖有足夠的高度
+        # 效能優化：只繪製可見範圍，點數超過像素寬度時以峰值降採樣（保留肌電尖峰）
+        self._plot_widget.setClipToView(True)
+        self._plot_widget.setDownsampling(auto=True, mode='peak')
         layout.addWidget(self._plot_widget, stretch=2)  # 給予更多的伸展空間
 
-        colors = [
-            "#FF3B30",
-            "#FF9500",
-            "#FFCC00",
-            "#4CD964",
-            "#5AC8FA",
-            "#007AFF",
-            "#5856D6",
-            "#FF2D55",
+        # 每個通道的畫筆只建立一次，曲線更新時不再重建
+        self._pens = [
+            pg.mkPen(color=_CHANNEL_COLORS[idx % len(_CHANNEL_COLORS)], width=1.5)
+            for idx in range(config.EMG_CHANNELS)
         ]
         self._curves = [
             self._plot_widget.plot(
-                pen=pg.mkPen(color=colors[idx % len(colors)], width=1.5),
+                pen=self._pens[idx],
                 skipFiniteCheck=True  # 跳過有限性檢查（提升效能）
             )
             for idx in range(config.EMG_CHANNELS)
         ]
+        # 繪圖迴圈直接呼叫的 setData 綁定方法；skipFiniteCheck 已在建立曲線時設定並保留
+        self._curve_set_data = [curve.setData for curve in self._curves]
         
-        # 8 個獨立通道視圖
-        individual_label = QtWidgets.QLabel("📈 個別通道視圖")
+        # 個別通道熱圖：每列一個通道、橫軸為時間
+        # 單一場景取代 8 個獨立示波器（各自的場景、座標軸與繪製週期）
+        individual_label = QtWidgets.QLabel("📈 個別通道熱圖（相對基線）")
         individual_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #5AC8FA;")
         layout.addWidget(individual_label)
         
-        # 建立 2x4 網格佈局來放置 8 個小示波器
-        individual_plots_layout = QtWidgets.QGridLayout()
-        individual_plots_layout.setSpacing(5)
-        
-        self._individual_plot_widgets = []
-        self._individual_curves = []
-        
-        for idx in range(config.EMG_CHANNELS):
-            # 建立小示波器
-            plot_widget = pg.PlotWidget()
-            plot_widget.setBackground("#1a1a1a")
-            plot_widget.showGrid(x=True, y=True, alpha=0.2)
-            plot_widget.setLabel("left", "μV", **{"font-size": "8pt"})
-            plot_widget.setLabel("bottom", "Time (s)", **{"font-size": "8pt"})
-            plot_widget.setLimits(xMin=-config.BUFFER_SECONDS, xMax=0)
-            plot_widget.setTitle(f"CH{idx+1}", color=colors[idx], size="10pt")
-            plot_widget.setMinimumHeight(120)  # 最小高度
-            plot_widget.setMaximumHeight(180)  # 最大高度
-            
-            # 效能優化：關閉個別視圖的一些功能
-            plot_widget.setClipToView(True)  # 只繪製可見範圍
-            plot_widget.setDownsampling(mode='peak')  # 使用降採樣
-            
-            # 建立曲線（效能優化）
-            curve = plot_widget.plot(
-                pen=pg.mkPen(color=colors[idx], width=2),
-                antialias=False,  # 關閉抗鋸齒以提升效能
-                skipFiniteCheck=True,  # 跳過有限性檢查
-                connect='finite'  # 忽略無限值
-            )
-            
-            self._individual_plot_widgets.append(plot_widget)
-            self._individual_curves.append(curve)
-            
-            # 將示波器加入網格 (2 行 x 4 列)
-            row = idx // 4
-            col = idx % 4
-            individual_plots_layout.addWidget(plot_widget, row, col)
-        
-        layout.addLayout(individual_plots_layout)
+        self._heatmap_widget = pg.PlotWidget()
+        self._heatmap_widget.setBackground("#1a1a1a")
+        self._heatmap_widget.setLabel("bottom", "Time (s)", **{"font-size": "8pt"})
+        self._heatmap_widget.setMouseEnabled(x=False, y=False)
+        self._heatmap_widget.setXRange(-config.BUFFER_SECONDS, 0, padding=0)
+        self._heatmap_widget.setYRange(0, config.EMG_CHANNELS, padding=0)
+        self._heatmap_widget.invertY(True)  # CH1 在最上方
+        self._heatmap_widget.getAxis("left").setTicks(
+            [[(idx + 0.5, f"CH{idx+1}") for idx in range(config.EMG_CHANNELS)]]
+        )
+        self._heatmap_widget.setMinimumHeight(160)
+        self._heatmap_widget.setMaximumHeight(240)
+        
+        # autoDownsample：時間點多於螢幕像素時先降採樣再繪製
+        self._heatmap = pg.ImageItem(axisOrder="row-major", autoDownsample=True)
+        self._heatmap.setColorMap(pg.colormap.get("CET-D1"))  # 發散色階：藍負、紅正
+        self._heatmap_widget.addItem(self._heatmap)
+        self._heatmap_points = 0  # 目前熱圖的時間點數（改變時重設座標範圍）
+        layout.addWidget(self._heatmap_widget)
 
         self._log_view = QtWidgets.QPlainTextEdit()
         self._log_view.setReadOnly(True)
@@ -537,39 +671,86 @@ class MainWindow(QtWidgets.QMainWindow):
             raise ValueError("No device selected")
         return entry
 
-    def _set_controls_enabled(self, scanning: bool = False) -> None:
-        self._scan_button.setEnabled(not self._connected and not scanning)
-        self._connect_button.setEnabled(not self._connected and not scanning)
-        self._disconnect_button.setEnabled(self._connected)
-        self._device_combo.setEnabled(not self._connected and not scanning)
-        self._usb_scan_button.setEnabled(not scanning)
-        
-        # 記錄按鈕只在：1) 已連接 2) 未記錄中 3) MediaPipe 已載入完成時啟用
-        can_record = (
-            self._connected 
-            and not self._recording 
-            and self._mediapipe_ready
-        )
-        self._record_button.setEnabled(can_record)
-        
-        # 更新按鈕提示
+    def _set_controls_enabled(self, scanning: Optional[bool] = None) -> None:
+        """依連線 / 掃描 / 記錄 / MediaPipe 狀態更新控制項
+
+        先算出每個控制項應有的狀態，只寫入與上次套用時不同的項目。
+        ``scanning`` 為 None 時沿用目前的掃描狀態。"""
+        if scanning is not None:
+            self._scanning = scanning
+        scanning = self._scanning
+        idle = not self._connected and not scanning
+        
+        # 記錄按鈕只在：1) 已連接 2) MediaPipe 已載入完成時啟用（記錄中用來停止）
         if not self._mediapipe_ready:
             if is_mediapipe_loading():
-                self._record_button.setToolTip("正在載入 MediaPipe，請稍候...")
+                record_tip = "正在載入 MediaPipe，請稍候..."
             else:
-                self._record_button.setToolTip("MediaPipe 載入失敗，無法使用錄影功能")
+                record_tip = "MediaPipe 載入失敗，無法使用錄影功能"
         elif not self._connected:
-            self._record_button.setToolTip("請先連接 EMG 裝置")
+            record_tip = "請先連接 EMG 裝置"
         elif self._recording:
-            self._record_button.setToolTip("正在記錄中...")
+            record_tip = "正在記錄中..."
         else:
-            self._record_button.setToolTip("開始記錄 EMG 訊號和手部動作")
-        
-        # 攝影機預覽只在已初始化記錄器時啟用
-        self._camera_preview_button.setEnabled(self._motion_recorder is not None)
+            record_tip = "開始記錄 EMG 訊號和手部動作"
+        
+        state = {
+            "scan": idle,
+            "connect": idle,
+            "device": idle,
+            "usb_scan": not scanning,
+            # 記錄中不可斷線
+            "disconnect": self._connected and not self._recording,
+            "record": self._connected and self._mediapipe_ready,
+            "record_tip": record_tip,
+            # 攝影機預覽只在已初始化記錄器時啟用
+            "camera_preview": self._motion_recorder is not None,
+        }
+        setters = {
+            "scan": self._scan_button.setEnabled,
+            "connect": self._connect_button.setEnabled,
+            "device": self._device_combo.setEnabled,
+            "usb_scan": self._usb_scan_button.setEnabled,
+            "disconnect": self._disconnect_button.setEnabled,
+            "record": self._record_button.setEnabled,
+            "record_tip": self._record_button.setToolTip,
+            "camera_preview": self._camera_preview_button.setEnabled,
+        }
+        for key, value in state.items():
+            if self._ui_state.get(key) != value:
+                setters[key](value)
+        self._ui_state = state
+
+    @staticmethod
+    def _append_combo_items(
+        combo: QtWidgets.QComboBox, items: list[tuple[str, object]]
+    ) -> None:
+        """一次加入多個 (文字, userData) 選項：單次模型插入，不逐項重新排版"""
+        if not items:
+            return
+        rows = []
+        for label, data in items:
+            row = QtGui.QStandardItem(label)
+            if data is not None:
+                row.setData(data, QtCore.Qt.ItemDataRole.UserRole)
+            rows.append(row)
+        combo.setUpdatesEnabled(False)
+        combo.model().invisibleRootItem().appendRows(rows)
+        combo.setUpdatesEnabled(True)
 
     def _log(self, message: str) -> None:
-        self._log_view.appendPlainText(message)
+        # 只排入佇列，由 _flush_log 批次寫入，掃描/連接協程不必等記錄區重繪
+        self._pending_log.append(message)
+    
+    def _log_lines(self, lines: list[str]) -> None:
+        """排入多行記錄"""
+        self._pending_log.extend(lines)
+
+    def _flush_log(self) -> None:
+        """把累積的記錄一次寫入記錄區（只觸發一次版面更新）"""
+        if self._pending_log:
+            self._log_view.appendPlainText("\n".join(self._pending_log))
+            self._pending_log.clear()
     
     # -------------------------------------------------- MediaPipe Preloading --
     async def _preload_mediapipe(self) -> None:
@@ -582,181 +763,198 @@ class MainWindow(QtWidgets.QMainWindow):
             self._mediapipe_ready = True
             self._log("✅ MediaPipe 載入完成！現在可以開始錄影")
             
-            # 啟用記錄按鈕（如果已連接裝置）
-            if self._active_manager is not None:
-                self._record_button.setEnabled(True)
-                self._record_button.setToolTip("開始記錄 EMG 訊號和手部動作")
         else:
             self._log("⚠️ MediaPipe 載入失敗，錄影功能將不可用")
-            self._record_button.setToolTip("MediaPipe 未安裝，無法使用錄影功能")
+        # 依最新狀態啟用記錄按鈕（如果已連接裝置）並更新提示
+        self._set_controls_enabled()
 
     # ------------------------------------------------------------ Callbacks --
     def _handle_emg_sample(self, sample: EmgSample) -> None:
+        # 先排入佇列，由 _flush_emg_samples 整批寫入緩衝區並更新通道狀態
+        self._pending_emg.append(sample.channels_uv[None, :])
+        
+        # 同步 EMG 資料到記錄器（立即加入以保留到達時間）
+        if self._recording and self._motion_recorder is not None:
+            self._motion_recorder.add_emg_sample(sample.channels_uv)
+            self._update_recording_time()
+
+    def _handle_emg_batch(self, batch: EmgBatch) -> None:
+        self._pending_emg.append(batch.channels_uv)
+        
+        if self._recording and self._motion_recorder is not None:
+            for channels_uv in batch.channels_uv:
+                self._motion_recorder.add_emg_sample(channels_uv)
+            self._update_recording_time()
+
+    def _update_recording_time(self) -> None:
+        """更新記錄時間顯示"""
+        elapsed = monotonic() - self._recording_start_time
+        self._recording_time_label.setText(f"{elapsed:.1f}s")
+
+    def _refresh_camera_preview(self) -> None:
+        """更新攝影機預覽視窗（由 _camera_timer 觸發）"""
+        if (not self._recording
+            or self._motion_recorder is None
+            or not self._motion_recorder.enable_camera
+            or self._camera_preview is None
+            or not self._camera_preview.isVisible()):
+            return
+        frame, has_hand = self._motion_recorder.get_current_frame()
+        if frame is not None:
+            self._camera_preview.update_frame(frame, has_hand)
+
+    def _flush_emg_samples(self) -> None:
+        """將累積的 EMG 樣本一次寫入環形緩衝區，再依序更新通道狀態"""
+        if not self._pending_emg:
+            return
+        block = np.concatenate(self._pending_emg)
+        self._pending_emg.clear()
+        # 更新訊號接收狀態（整批共用同一個時間點）
+        self._last_packet_time = monotonic()
         try:
-            self._buffer.append(sample.channels_uv)
-            
-            # 同步 EMG 資料到記錄器
-            if self._recording and self._motion_recorder is not None:
-                self._motion_recorder.add_emg_sample(sample.channels_uv)
+            self._buffer.append_block(block)
+        except ValueError as exc:
+            self._log(f"EMG buffer error: {exc}")
+            return
+        # 基線必須逐一樣本更新；通道指示器由 _refresh_indicators 依最後一個樣本更新
+        active = False
+        for channels_uv in block:
+            active = self._update_channel_stats(channels_uv)
+        self._activity_pending = active
+
+    def _update_channel_stats(self, channels_uv: np.ndarray) -> bool:
+        """以單一樣本更新基線與噪音水平
+
+        回傳是否算出了活動度（存於 ``self._stats_deviation``）；
+        校準期間回傳 False。"""
+        self._packet_count += 1
+        
+        # 初始化階段：只建立基線，不顯示訊號品質
+        if not self._baseline_initialized:
+            if self._packet_count <= self._initialization_samples:
+                # 快速建立基線並累積活動度（用於計算噪音水平）
+                ch = channels_uv.astype(np.float64)
+                alpha = 0.1  # 初始化時使用較快的更新速度
+                self._channel_baseline += alpha * (ch - self._channel_baseline)
                 
-                # 更新記錄時間顯示
-                import time
-                elapsed = time.time() - self._recording_start_time
-                self._recording_time_label.setText(f"{elapsed:.1f}s")
+                # 計算當前活動度並累積（用於計算平均噪音水平）
+                if self._packet_count > 50:  # 前50個封包讓基線穩定
+                    deviation = np.abs(ch - self._channel_baseline)
+                    change_rate = np.abs(ch - self._channel_last_values)
+                    # 累積平均噪音水平
+                    self._channel_noise_level += deviation * 0.7 + change_rate * 0.3
                 
-                # 更新攝影機預覽視窗（限制幀率為 15fps）
-                self._camera_frame_counter += 1
-                if (self._camera_frame_counter >= self._camera_frame_skip
-                    and self._camera_preview is not None 
-                    and self._camera_preview.isVisible() 
-                    and self._motion_recorder.enable_camera):
-                    
-                    self._camera_frame_counter = 0  # 重置計數器
-                    frame, has_hand = self._motion_recorder.get_current_frame()
-                    if frame is not None:
-                        self._camera_preview.update_frame(frame, has_hand)
-            
-            # 更新訊號接收狀態
-            import time
-            self._last_packet_time = time.time()
-            self._packet_count += 1
-            
-            # 初始化階段：只建立基線，不顯示訊號品質
-            if not self._baseline_initialized:
-                if self._packet_count <= self._initialization_samples:
-                    # 快速建立基線並累積活動度（用於計算噪音水平）
-                    for i, ch_value in enumerate(sample.channels_uv):
-                        alpha = 0.1  # 初始化時使用較快的更新速度
-                        self._channel_baseline[i] = alpha * ch_value + (1 - alpha) * self._channel_baseline[i]
-                        
-                        # 計算當前活動度並累積（用於計算平均噪音水平）
-                        if self._packet_count > 50:  # 前50個封包讓基線穩定
-                            deviation = abs(ch_value - self._channel_baseline[i])
-                            change_rate = abs(ch_value - self._channel_last_values[i])
-                            activity = (deviation * 0.7 + change_rate * 0.3)
-                            # 累積平均噪音水平
-                            self._channel_noise_level[i] += activity
-                        
-                        self._channel_last_values[i] = ch_value
-                    
-                    # 顯示初始化進度（降低頻率）
-                    if self._packet_count % 100 == 0:
-                        progress = (self._packet_count / self._initialization_samples) * 100
-                        print(f"基線初始化中... {progress:.0f}%")
-                    
-                    # 所有通道顯示為灰色「校準中」
-                    for i in range(8):
-                        if i < len(self._channel_indicators):
-                            self._channel_indicators[i].setStyleSheet("color: gray; font-size: 24px;")
-                            self._channel_quality_labels[i].setText("校準中")
-                            self._channel_quality_labels[i].setStyleSheet("font-size: 9px; color: #888;")
-                            self._channel_strength_labels[i].setText("--")
-                    
-                    return  # 初始化期間不進行訊號品質判斷
-                else:
-                    # 初始化完成：計算每個通道的平均噪音水平
-                    self._baseline_initialized = True
-                    for i in range(config.EMG_CHANNELS):
-                        # 計算平均噪音（除以有效樣本數）
-                        self._channel_noise_level[i] = self._channel_noise_level[i] / (self._initialization_samples - 50)
-                    
-                    print("基線初始化完成！")
-                    print(f"各通道基線: {[f'{b:.0f}' for b in self._channel_baseline]}")
-                    print(f"各通道噪音水平: {[f'{n:.0f}' for n in self._channel_noise_level]}")
-                    self._last_baseline_reset = self._packet_count
-            
-            # 定期重新校準基線（每 30 秒，當所有通道都在待機狀態時）
-            if self._packet_count - self._last_baseline_reset > 6000:  # 30秒
-                all_idle = all(state == 0 for state in self._channel_current_state)
-                if all_idle:
-                    print("\n⟳ 基線自動重新校準...")
-                    self._baseline_initialized = False
-                    self._packet_count = 0
-                    return
-            
-            # 正常運作：計算每個通道的訊號活動度（變化量）
-            channel_activity = []
-            for i, ch_value in enumerate(sample.channels_uv):
-                # 計算當前偏離值
-                deviation = abs(ch_value - self._channel_baseline[i])
+                self._channel_last_values[:] = ch
                 
-                # 改進基線更新策略：使用自適應速率
-                if deviation < self._channel_noise_level[i] * 2:
-                    # 訊號接近基線，快速更新
-                    alpha = 0.02
-                elif deviation < self._channel_noise_level[i] * 5:
-                    # 中等訊號，慢速更新
-                    alpha = 0.002
-                else:
-                    # 強訊號，極慢更新（但不完全停止）
-                    alpha = 0.0001
+                # 顯示初始化進度（降低頻率）
+                if self._packet_count % 100 == 0:
+                    progress = (self._packet_count / self._initialization_samples) * 100
+                    logger.debug("基線初始化中... %.0f%%", progress)
                 
-                self._channel_baseline[i] = alpha * ch_value + (1 - alpha) * self._channel_baseline[i]
+                # 所有通道顯示為灰色「校準中」（只在進入校準時設定一次）
+                for i in range(len(self._channel_indicators)):
+                    if self._channel_display_state[i] != _CHANNEL_CALIBRATING:
+                        self._channel_display_state[i] = _CHANNEL_CALIBRATING
+                        _set_style_state(self._channel_indicators[i], "idle")
+                        self._channel_quality_labels[i].setText("校準中")
+                        _set_style_state(self._channel_quality_labels[i], "idle")
+                        self._set_strength_text(i, "--")
                 
-                # 活動度只看偏離值
-                activity = deviation
-                channel_activity.append(activity)
+                return False  # 初始化期間不進行訊號品質判斷
+            else:
+                # 初始化完成：計算每個通道的平均噪音水平
+                self._baseline_initialized = True
+                # 計算平均噪音（除以有效樣本數）
+                self._channel_noise_level /= self._initialization_samples - 50
+                self._noise_x2 = self._channel_noise_level * 2
+                self._noise_x5 = self._channel_noise_level * 5
+                # 至少以 100 μV 作為噪音基準，避免過於安靜的通道過度敏感
+                self._channel_state_inv_scale = 1 / np.maximum(self._channel_noise_level, 100)
                 
-                # 更新上次數值
-                self._channel_last_values[i] = ch_value
+                self._log("基線初始化完成！")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("各通道基線: %s", [f"{b:.0f}" for b in self._channel_baseline])
+                    logger.debug("各通道噪音水平: %s", [f"{n:.0f}" for n in self._channel_noise_level])
+                self._last_baseline_reset = self._packet_count
+        
+        # 定期重新校準基線（每 30 秒，當所有通道都在待機狀態時）
+        if self._packet_count - self._last_baseline_reset > 6000:  # 30秒
+            all_idle = not self._channel_current_state.any()
+            if all_idle:
+                self._log("⟳ 基線自動重新校準...")
+                self._baseline_initialized = False
+                self._packet_count = 0
+                return False
+        
+        # 正常運作：計算每個通道的訊號活動度（變化量），8 個通道一次向量運算
+        diff = np.subtract(channels_uv, self._channel_baseline, out=self._stats_diff)
+        # 計算當前偏離值
+        deviation = np.abs(diff, out=self._stats_deviation)
+        
+        # 改進基線更新策略：使用自適應速率
+        # 依偏離值落在噪音的 2 倍、5 倍以內或以上，選擇快速 / 慢速 / 極慢更新
+        level = (deviation >= self._noise_x2).view(np.uint8) + (
+            deviation >= self._noise_x5
+        ).view(np.uint8)
+        diff *= _BASELINE_ALPHAS[level]
+        self._channel_baseline += diff
+        
+        # 活動度只看偏離值
+        channel_activity = deviation
+        
+        # 更新上次數值
+        self._channel_last_values[:] = channels_uv
+        
+        # 即時監測：每 50 個封包輸出一次（約 250ms 間隔）
+        # 只在啟用 DEBUG 記錄時組字串（設定 EMG_DEBUG=1 啟動）
+        if self._packet_count % 50 == 0 and logger.isEnabledFor(logging.DEBUG):
+            # 顯示每個通道的活動度和狀態
+            status_map = {0: "待機", 1: "微弱", 2: "良好", 3: "強訊", 4: "最佳"}
+            ch_info = []
+            active_channels = []  # 記錄活躍的通道
             
-            # 批次更新通道指示器（每 5 個封包更新一次，減少 UI 刷新）
-            if self._packet_count % 5 == 0:
-                for i, activity in enumerate(channel_activity):
-                    self._update_channel_indicator(i, activity)
-            
-            # 即時監測：每 50 個封包輸出一次（約 250ms 間隔，進一步降低負載）
-            # 如果不需要終端機監測，可以註解掉以下整個 if 區塊
-            if self._packet_count % 50 == 0:
-                # 顯示每個通道的活動度和狀態
-                status_map = {0: "待機", 1: "微弱", 2: "良好", 3: "強訊", 4: "最佳"}
-                ch_info = []
-                active_channels = []  # 記錄活躍的通道
-                
-                for i in range(len(channel_activity)):
-                    state_text = status_map.get(self._channel_current_state[i], "?")
-                    # 標記活躍的通道（活動度 > 閾值）
-                    threshold = self._channel_noise_level[i] * 2.5
-                    if channel_activity[i] > threshold:
-                        ch_info.append(f"CH{i+1}:【{channel_activity[i]:.0f}】{state_text}")
-                        active_channels.append(i+1)
-                    else:
-                        ch_info.append(f"CH{i+1}:{channel_activity[i]:.0f}")
-                
-                # 顯示活躍通道數（用於診斷串擾）
-                active_count = len(active_channels)
-                if active_count > 1:
-                    isolation_warning = f" ⚠️ {active_count}個通道活躍:{active_channels}"
+            for i in range(len(channel_activity)):
+                state_text = status_map.get(self._channel_current_state[i], "?")
+                # 標記活躍的通道（活動度 > 閾值）
+                threshold = self._channel_noise_level[i] * 2.5
+                if channel_activity[i] > threshold:
+                    ch_info.append(f"CH{i+1}:【{channel_activity[i]:.0f}】{state_text}")
+                    active_channels.append(i+1)
                 else:
-                    isolation_warning = ""
-                
-                # 清除舊行並顯示新狀態（使用 \r 回到行首）
-                print(f"\r封包#{self._packet_count:5d} | " + " | ".join(ch_info) + isolation_warning, end="", flush=True)
+                    ch_info.append(f"CH{i+1}:{channel_activity[i]:.0f}")
             
-            # 計算整體訊號強度
-            self._signal_strength = np.mean(channel_activity)
-            
-            # 更新訊號接收指示器為綠色
-            self._signal_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+            # 顯示活躍通道數（用於診斷串擾）
+            active_count = len(active_channels)
+            if active_count > 1:
+                isolation_warning = f" ⚠️ {active_count}個通道活躍:{active_channels}"
+            else:
+                isolation_warning = ""
             
-        except ValueError as exc:
-            self._log(f"EMG buffer error: {exc}")
-    
-    def _update_channel_indicator(self, channel_idx: int, strength: float) -> None:
-        """更新單個通道的訊號指示器（帶遲滯機制避免跳動）"""
-        if channel_idx >= len(self._channel_indicators):
-            return
+            logger.debug("封包#%5d | %s%s", self._packet_count, " | ".join(ch_info), isolation_warning)
         
-        indicator = self._channel_indicators[channel_idx]
-        strength_label = self._channel_strength_labels[channel_idx]
-        quality_label = self._channel_quality_labels[channel_idx]
-        
-        # 更新強度數值（顯示活動度）
-        strength_label.setText(f"{strength:.0f}")
+        return True
+    
+    def _update_channel_indicators(self, activity: np.ndarray) -> None:
+        """依一批樣本最後的活動度更新所有通道指示器與整體訊號強度"""
+        # 通道狀態一次向量判斷，只有狀態改變時才更新樣式
+        self._update_channel_states(activity)
         
-        # 取得當前狀態
-        current_state = self._channel_current_state[channel_idx]
+        for i, value in enumerate(activity.tolist()):
+            self._set_strength_text(i, f"{value:.0f}")
         
+        # 計算整體訊號強度
+        self._signal_strength = float(activity.mean())
+    
+    def _set_strength_text(self, channel_idx: int, text: str) -> None:
+        """更新通道強度標籤（文字未變時略過）"""
+        if channel_idx >= len(self._channel_strength_labels):
+            return
+        if self._channel_strength_text[channel_idx] != text:
+            self._channel_strength_text[channel_idx] = text
+            self._channel_strength_labels[channel_idx].setText(text)
+
+    def _update_channel_states(self, activity: np.ndarray) -> None:
+        """更新 8 個通道的訊號狀態（帶遲滯機制避免跳動），只重繪狀態有變的通道"""
         # 根據該通道的噪音水平動態設定閾值（倍率法）
         # 新的 5 級系統：
         # 0: 待機（灰色）- 低於 2 倍噪音
@@ -764,147 +962,145 @@ class MainWindow(QtWidgets.QMainWindow):
         # 2: 良好（黃色）- 4-7 倍噪音
         # 3: 強訊（綠色）- 7-12 倍噪音
         # 4: 最佳（淡藍色）- 12 倍以上噪音
-        noise_baseline = max(self._channel_noise_level[channel_idx], 100)  # 至少100 μV
-        
-        # 使用遲滯閾值：上升閾值較高，下降閾值較低（避免反覆跳動）
-        # 定義閾值：[下降閾值, 上升閾值]
-        thresholds = {
-            0: (0, noise_baseline * 2.0),           # 待機 -> 微弱：需要 > 2倍噪音
-            1: (noise_baseline * 1.5, noise_baseline * 4.0),  # 微弱 <-> 良好
-            2: (noise_baseline * 3.5, noise_baseline * 7.0),  # 良好 <-> 強訊
-            3: (noise_baseline * 6.5, noise_baseline * 12.0), # 強訊 <-> 最佳
-            4: (noise_baseline * 11.0, 999999)      # 最佳
-        }
+        # 活動度換算成噪音倍數後查表：level = 已達到的倍率閾值個數
+        ratio = np.multiply(activity, self._channel_state_inv_scale, out=self._state_ratio)
+        level = np.searchsorted(_STATE_RISE_FACTORS, ratio, side="right")
         
-        # 決定新狀態（允許跨級下降）
-        new_state = current_state
-        
-        # 先判斷下降（可以跨級）
-        if strength < thresholds[0][1]:
-            # 低於微弱閾值，回到待機
-            new_state = 0
-        elif strength < thresholds[1][1]:
-            # 低於良好閾值，但高於微弱閾值
-            if current_state >= 2:
-                new_state = 1  # 從良好/強訊/最佳降到微弱
-        elif strength < thresholds[2][1]:
-            # 低於強訊閾值
-            if current_state >= 3:
-                new_state = 2  # 從強訊/最佳降到良好
-        elif strength < thresholds[3][1]:
-            # 低於最佳閾值
-            if current_state >= 4:
-                new_state = 3  # 從最佳降到強訊
-        
-        # 再判斷上升（需要遲滯）
-        if current_state == 0 and strength >= thresholds[0][1]:
-            new_state = 1
-        elif current_state == 1 and strength >= thresholds[1][1]:
-            new_state = 2
-        elif current_state == 2 and strength >= thresholds[2][1]:
-            new_state = 3
-        elif current_state == 3 and strength >= thresholds[3][1]:
-            new_state = 4
-        
-        # 更新狀態
-        self._channel_current_state[channel_idx] = new_state
-        
-        # 根據新狀態設定顯示
-        if new_state == 0:
-            # 待機：灰色（訊號最差）
-            indicator.setStyleSheet("color: gray; font-size: 24px;")
-            quality_label.setText("待機")
-            quality_label.setStyleSheet("font-size: 9px; color: #888;")
-        elif new_state == 1:
-            # 微弱：紅色（沒訊號微弱）
-            indicator.setStyleSheet("color: #FF3B30; font-size: 24px;")
-            quality_label.setText("微弱")
-            quality_label.setStyleSheet("font-size: 9px; color: #FF3B30;")
-        elif new_state == 2:
-            # 良好：黃色
-            indicator.setStyleSheet("color: #FFCC00; font-size: 24px;")
-            quality_label.setText("良好")
-            quality_label.setStyleSheet("font-size: 9px; color: #FFCC00; font-weight: bold;")
-        elif new_state == 3:
-            # 強訊：綠色
-            indicator.setStyleSheet("color: #4CD964; font-size: 24px;")
-            quality_label.setText("強訊")
-            quality_label.setStyleSheet("font-size: 9px; color: #4CD964; font-weight: bold;")
-        else:
-            # 最佳：淡藍色（訊號最好）
-            indicator.setStyleSheet("color: #5AC8FA; font-size: 24px;")
-            quality_label.setText("最佳")
-            quality_label.setStyleSheet("font-size: 9px; color: #5AC8FA; font-weight: bold;")
+        # 下降可以直接跨級，上升每次最多一級（遲滯）
+        new_state = np.minimum(level, self._channel_current_state + 1)
+        self._channel_current_state = new_state
+        
+        # 根據新狀態設定顯示（狀態未變時樣式相同，不必重新解析 QSS）
+        changed = np.flatnonzero(new_state != self._channel_display_state)
+        if changed.size == 0:
+            return
+        self._channel_display_state[changed] = new_state[changed]
+        for i in changed.tolist():
+            if i >= len(self._channel_indicators):
+                continue
+            state = int(new_state[i])
+            _set_style_state(self._channel_indicators[i], _CHANNEL_STATE_NAMES[state])
+            self._channel_quality_labels[i].setText(_QUALITY_TEXT[state])
+            _set_style_state(self._channel_quality_labels[i], _CHANNEL_STATE_NAMES[state])
 
     def _handle_imu_sample(self, sample: ImuSample) -> None:
-        gyro = ", ".join(f"{axis:.2f}" for axis in sample.gyro_rads)
-        accel = ", ".join(f"{axis:.2f}" for axis in sample.accel_mss)
-        self._status_label.setText(
-            f"Status: Connected | Gyro {gyro} rad/s | Accel {accel} m/s^2"
-        )
+        # 只保留最新樣本，由 _refresh_indicators 以 10 Hz 格式化顯示
+        self._pending_imu = sample
+        self._pending_status = None
 
     def _handle_status_update(self, message: str) -> None:
         self._log(message)
         prefix = "Status: Connected | " if self._connected else "Status: "
-        self._status_label.setText(f"{prefix}{message}")
+        self._pending_status = f"{prefix}{message}"
+        self._pending_imu = None
 
-    def _refresh_plot(self) -> None:
-        import time
+    def _refresh_indicators(self) -> None:
+        """指示器計時器觸發：套用累積的記錄、狀態列文字、通道指示器與訊號強度"""
+        self._flush_log()
+        if self._pending_imu is not None:
+            gx, gy, gz = self._pending_imu.gyro_rads.tolist()
+            ax, ay, az = self._pending_imu.accel_mss.tolist()
+            self._pending_imu = None
+            self._pending_status = (
+                f"Status: Connected | Gyro {gx:.2f}, {gy:.2f}, {gz:.2f} rad/s"
+                f" | Accel {ax:.2f}, {ay:.2f}, {az:.2f} m/s^2"
+            )
+        if self._pending_status is not None:
+            self._status_label.setText(self._pending_status)
+            self._pending_status = None
         
         # 只在連接時更新狀態（減少不必要的操作）
         if not self._connected:
             return
         
-        # 更新狀態指示器
-        current_time = time.time()
+        if self._activity_pending:
+            self._activity_pending = False
+            self._update_channel_indicators(self._stats_deviation)
         
         # 檢查訊號是否還在接收（超過1秒沒收到就顯示紅色）
-        if (current_time - self._last_packet_time) > 1.0:
-            self._signal_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
+        # 只在接收中 / 無訊號切換的那一次更新指示器
+        signal_ok = (monotonic() - self._last_packet_time) <= 1.0
+        if signal_ok != self._signal_ok:
+            self._signal_ok = signal_ok
+            _set_style_state(
+                self._signal_status_indicator, _STATUS_OK if signal_ok else _STATUS_ERROR
+            )
+        if not signal_ok:
+            key = None
+        else:
+            # 訊號強度等級：0=弱、1=中、2=強
+            strength = self._signal_strength
+            bucket = 2 if strength > 100 else 1 if strength > 30 else 0
+            key = (round(strength), bucket)
+        # 顯示的數值與等級都沒變時不重組字串、不呼叫 setText
+        if key == self._strength_key:
+            return
+        self._strength_key = key
+        if key is None:
             self._strength_label.setText("💪 訊號強度: 無訊號")
         else:
-            # 更新訊號強度顯示（簡化）
-            if self._signal_strength > 100:
-                strength_text = "強🟢"
-            elif self._signal_strength > 30:
-                strength_text = "中🟡"
-            else:
-                strength_text = "弱🟠"
-            self._strength_label.setText(f"💪 {self._signal_strength:.0f}μV {strength_text}")
+            strength_text = ("弱🟠", "中🟡", "強🟢")[key[1]]
+            self._strength_label.setText(f"💪 {key[0]}μV {strength_text}")
+
+    def _refresh_plot(self) -> None:
+        """繪圖計時器觸發：繪圖後依耗時調整下次間隔，避免繪圖在資料爆量時堆積"""
+        start = perf_counter()
+        self._draw_plot()
+        elapsed_ms = (perf_counter() - start) * 1000
+        interval = int(max(self._frame_interval_ms, elapsed_ms / _PLOT_DUTY_CYCLE))
+        # 沒有新資料時 _draw_plot 立即返回，間隔通常不變；不變就不重設計時器
+        if interval != self._plot_timer.interval():
+            self._plot_timer.setInterval(interval)
+
+    def _draw_plot(self) -> None:
+        # 只在連接時繪圖（減少不必要的操作）
+        if not self._connected:
+            return
+        current_time = monotonic()
         
-        # 繪圖（優化：減少數據處理）
-        data = self._buffer.snapshot()
+        # 繪圖（優化：減少數據處理；沒有新樣本就跳過重繪）
+        result = self._buffer.snapshot_if_new(self._last_plot_seq)
+        if result is None:
+            return
+        self._last_plot_seq, data = result
         if data.size == 0:
             return
         
         points = data.shape[1]
-        duration = points / config.SAMPLE_RATE_HZ
-        x = np.linspace(-duration, 0, points)
+        x = self._plot_x[-points:]
         
         # 始終更新全頻道合併視圖（主視圖，保持流暢）
-        for idx, curve in enumerate(self._curves):
-            channel_data = data[idx] + self._display_offsets[idx]
-            curve.setData(x, channel_data, skipFiniteCheck=True)  # 跳過有限性檢查以提升效能
-        
-        # 降低個別通道視圖的更新頻率（輪流更新，不是每次全更新）
+        # 一次把所有通道的偏移量加進工作區，再把每一列的視圖交給曲線
+        # data 是環形緩衝區的零複製視圖，這次加法就是每幀唯一的資料複製；
+        # 緩衝區只有 BUFFER_SECONDS * SAMPLE_RATE_HZ 點（目前 200），少於畫面寬度，
+        # 不需要自行降採樣，點數變多時由 pyqtgraph 的峰值降採樣處理
+        shifted = np.add(data, self._display_offsets, out=self._display_workspace[:, :points])
+        for set_data, row in zip(self._curve_set_data, shifted):
+            set_data(x, row)
+        
+        # 降低個別通道熱圖的更新頻率
         # 錄影時進一步降低更新頻率以減少 CPU 負擔
         is_recording = self._motion_recorder and self._motion_recorder.recording
-        update_interval = self._individual_plot_update_interval * 2 if is_recording else self._individual_plot_update_interval
-        
-        self._individual_plot_update_counter += 1
-        if self._individual_plot_update_counter >= update_interval:
-            self._individual_plot_update_counter = 0
-            # 輪流更新 2 個通道（而不是 8 個全部）
-            for i in range(self._channels_per_update):
-                ch_idx = (self._channel_update_index + i) % 8
-                if ch_idx < len(self._individual_curves):
-                    channel_data = data[ch_idx]  # 不需要偏移量，每個通道獨立顯示
-                    self._individual_curves[ch_idx].setData(
-                        x, channel_data,
-                        skipFiniteCheck=True  # 跳過檢查
-                    )
-            # 下次從下兩個通道開始
-            self._channel_update_index = (self._channel_update_index + self._channels_per_update) % 8
+        update_period = self._heatmap_period * 2 if is_recording else self._heatmap_period
+        
+        if current_time - self._last_heatmap_time >= update_period:
+            self._last_heatmap_time = current_time
+            # 8 個通道一次更新；減去基線後以固定色階顯示
+            self._heatmap.setImage(
+                np.subtract(
+                    data,
+                    self._channel_baseline[:, None],
+                    out=self._heatmap_workspace[:, :points],
+                ),
+                autoLevels=False,
+                levels=_HEATMAP_LEVELS,
+            )
+            if points != self._heatmap_points:
+                self._heatmap_points = points
+                duration = points / config.SAMPLE_RATE_HZ
+                self._heatmap.setRect(
+                    QtCore.QRectF(-duration, 0, duration, config.EMG_CHANNELS)
+                )
 
         # ---------------------------------------------------------- UI actions --
     @asyncSlot()
@@ -913,12 +1109,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._set_controls_enabled(scanning=True)
         self._log("🔍 掃描序列埠...")
         self._usb_info_label.setText("掃描中...")
-        self._usb_info_label.setStyleSheet("color: #FFCC00; font-style: italic;")
+        self._usb_info_label.setStyleSheet(_CSS_NOTE_BUSY)
         
         # USB 狀態設為檢測中（黃色）
-        self._usb_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+        _set_style_state(self._usb_status_indicator, _STATUS_BUSY)
         self._usb_status_text.setText("掃描中...")
-        self._usb_status_text.setStyleSheet("color: #FFCC00;")
+        self._usb_status_text.setStyleSheet(_CSS_TEXT_BUSY)
         
         # 清空列表
         self._usb_device_combo.clear()
@@ -929,59 +1125,60 @@ class MainWindow(QtWidgets.QMainWindow):
             
             if usb_serial_ports:
                 # 找到 USB 序列埠
-                self._usb_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+                _set_style_state(self._usb_status_indicator, _STATUS_OK)
                 self._usb_status_text.setText(f"找到 {len(usb_serial_ports)} 個")
-                self._usb_status_text.setStyleSheet("color: #4CD964; font-weight: bold;")
+                self._usb_status_text.setStyleSheet(_CSS_TEXT_OK)
                 
                 info = f"✓ 掃描完成：共找到 {len(usb_serial_ports)} 個 USB 序列埠\n"
                 info += "\n提示：選擇序列埠後，點擊 Connect 連接到藍牙接收器"
                 self._log(info)
                 
                 self._usb_info_label.setText(f"✓ 找到 {len(usb_serial_ports)} 個 USB 序列埠")
-                self._usb_info_label.setStyleSheet("color: #4CD964; font-weight: bold;")
+                self._usb_info_label.setStyleSheet(_CSS_TEXT_OK)
                 
                 # 將序列埠加入到設備下拉選單
-                self._device_combo.clear()
-                self._device_combo.addItem("Simulation", userData="SIM")
-                self._device_items = {0: DeviceEntry("Simulation", "SIM")}
-                
-                idx = 1
+                entries = [DeviceEntry("Simulation", "SIM")]
                 for port in usb_serial_ports:
                     # 標記可能是藍牙接收器的埠
                     if 'usbserial' in port or 'usbmodem' in port:
                         label = f"📡 {port} (USB Serial)"
                     else:
                         label = f"{port} (USB Serial)"
-                    
-                    self._device_combo.addItem(label, userData=port)
-                    self._device_items[idx] = DeviceEntry(label, port)
-                    self._usb_device_combo.addItem(label)
-                    idx += 1
+                    entries.append(DeviceEntry(label, port))
+                
+                self._device_combo.clear()
+                self._device_items = dict(enumerate(entries))
+                self._append_combo_items(
+                    self._device_combo, [(e.label, e.address) for e in entries]
+                )
+                self._append_combo_items(
+                    self._usb_device_combo, [(e.label, None) for e in entries[1:]]
+                )
                 
-                # 記錄詳細列表
-                self._log("\n掃描到的 USB 序列埠：")
-                for i, port in enumerate(usb_serial_ports, 1):
-                    self._log(f"  {i}. {port}")
+                # 記錄詳細列表（整份列表一次寫入）
+                lines = ["\n掃描到的 USB 序列埠："]
+                lines.extend(f"  {i}. {port}" for i, port in enumerate(usb_serial_ports, 1))
+                self._log_lines(lines)
                 
             else:
                 # 沒找到 USB 序列埠
-                self._usb_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+                _set_style_state(self._usb_status_indicator, _STATUS_BUSY)
                 self._usb_status_text.setText("無序列埠")
-                self._usb_status_text.setStyleSheet("color: #FFCC00; font-weight: bold;")
+                self._usb_status_text.setStyleSheet(_CSS_TEXT_WARN)
                 
                 self._usb_device_combo.addItem("未找到 USB 序列埠（請確認藍牙接收器已插入）")
                 self._usb_info_label.setText("未找到 USB 序列埠")
-                self._usb_info_label.setStyleSheet("color: #FFCC00; font-style: italic;")
+                self._usb_info_label.setStyleSheet(_CSS_NOTE_BUSY)
                 self._log("未找到 USB 序列埠")
                     
         except Exception as exc:
             self._log(f"序列埠掃描失敗: {exc}")
-            self._usb_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
+            _set_style_state(self._usb_status_indicator, _STATUS_ERROR)
             self._usb_status_text.setText("掃描失敗")
-            self._usb_status_text.setStyleSheet("color: #FF3B30;")
+            self._usb_status_text.setStyleSheet(_CSS_TEXT_ERROR)
             self._usb_device_combo.addItem("掃描失敗")
             self._usb_info_label.setText("✗ 掃描失敗")
-            self._usb_info_label.setStyleSheet("color: #FF3B30; font-style: italic;")
+            self._usb_info_label.setStyleSheet(_CSS_NOTE_ERROR)
         finally:
             self._set_controls_enabled(scanning=False)
 
@@ -991,7 +1188,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._log("Starting Bluetooth scan...")
         
         # 嘗試掃描時，藍牙接收器狀態設為黃色（檢測中）
-        self._bt_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+        _set_style_state(self._bt_status_indicator, _STATUS_BUSY)
         
         self._device_combo.clear()
         self._device_combo.addItem("Simulation", userData="SIM")
@@ -1001,7 +1198,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 timeout=config.DEFAULT_SCAN_TIMEOUT
             )
             # 掃描成功，藍牙接收器設為綠色
-            self._bt_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+            _set_style_state(self._bt_status_indicator, _STATUS_OK)
             
             # 檢查是否有 WL 裝置（表示 USB 接收器已連接）
             has_wl_device = any("WL" in (dev.name or "").upper() or 
@@ -1009,17 +1206,18 @@ class MainWindow(QtWidgets.QMainWindow):
                                for dev in devices)
             
             if has_wl_device:
-                self._usb_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+                _set_style_state(self._usb_status_indicator, _STATUS_OK)
                 self._usb_status_text.setText("已偵測到 WL 裝置")
-                self._usb_status_text.setStyleSheet("color: #4CD964; font-weight: bold;")
+                self._usb_status_text.setStyleSheet(_CSS_TEXT_OK)
             else:
-                self._usb_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+                _set_style_state(self._usb_status_indicator, _STATUS_BUSY)
                 self._usb_status_text.setText("未找到 WL 裝置")
-                self._usb_status_text.setStyleSheet("color: #FFCC00;")
+                self._usb_status_text.setStyleSheet(_CSS_TEXT_BUSY)
             
             # 按 RSSI 排序（訊號強度由強到弱）
             devices_sorted = sorted(devices, key=lambda d: d.rssi or -999, reverse=True)
             
+            entries = []
             for dev in devices_sorted:
                 # 顯示訊號強度
                 rssi_text = f"[{dev.rssi}dBm]" if dev.rssi else "[?]"
@@ -1030,18 +1228,21 @@ class MainWindow(QtWidgets.QMainWindow):
                     name = f"⭐ {name}"
                 
                 label = f"{name} {rssi_text} ({dev.address})"
-                index = self._device_combo.count()
-                self._device_combo.addItem(label, userData=dev.address)
-                self._device_items[index] = DeviceEntry(label, dev.address)
+                entries.append(DeviceEntry(label, dev.address))
+            # 所有裝置一次加入下拉選單
+            self._device_items.update(enumerate(entries, self._device_combo.count()))
+            self._append_combo_items(
+                self._device_combo, [(e.label, e.address) for e in entries]
+            )
             
             self._log(f"Found {len(devices)} device(s). 提示：拔掉 USB 再掃描一次，比較哪個裝置消失了")
         except Exception as exc:
             self._log(f"Scan failed: {exc}")
             # 掃描失敗，藍牙接收器設為紅色
-            self._bt_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
-            self._usb_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
+            _set_style_state(self._bt_status_indicator, _STATUS_ERROR)
+            _set_style_state(self._usb_status_indicator, _STATUS_ERROR)
             self._usb_status_text.setText("掃描失敗")
-            self._usb_status_text.setStyleSheet("color: #FF3B30;")
+            self._usb_status_text.setStyleSheet(_CSS_TEXT_ERROR)
         finally:
             self._set_controls_enabled(scanning=False)
 
@@ -1052,24 +1253,24 @@ class MainWindow(QtWidgets.QMainWindow):
             manager = self._sim_manager
             self._is_simulation = True
             # 模擬模式：藍牙為灰色（不使用），裝置為藍色（模擬）
-            self._bt_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
-            self._device_status_indicator.setStyleSheet("color: #007AFF; font-size: 20px;")
+            _set_style_state(self._bt_status_indicator, _STATUS_IDLE)
+            _set_style_state(self._device_status_indicator, _STATUS_SIM)
         elif entry.address.startswith('/dev/'):
             # 序列埠模式：透過 USB 藍牙接收器連接
             manager = self._serial_manager
             self._is_simulation = False
             # USB 接收器為綠色（已連接），藍牙為黃色（嘗試連接）
-            self._usb_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+            _set_style_state(self._usb_status_indicator, _STATUS_OK)
             self._usb_status_text.setText("已連接")
-            self._usb_status_text.setStyleSheet("color: #4CD964; font-weight: bold;")
-            self._bt_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
-            self._device_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+            self._usb_status_text.setStyleSheet(_CSS_TEXT_OK)
+            _set_style_state(self._bt_status_indicator, _STATUS_BUSY)
+            _set_style_state(self._device_status_indicator, _STATUS_BUSY)
         else:
             # 藍牙模式（原本的方式）
             manager = self._real_manager
             self._is_simulation = False
             # 真實模式：裝置連接中（黃色）
-            self._device_status_indicator.setStyleSheet("color: #FFCC00; font-size: 20px;")
+            _set_style_state(self._device_status_indicator, _STATUS_BUSY)
             
         await self._disconnect_active()
         self._active_manager = manager
@@ -1079,23 +1280,24 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log(f"Connection failed: {exc}")
             self._active_manager = None
             # 連接失敗：裝置為紅色
-            self._device_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
+            _set_style_state(self._device_status_indicator, _STATUS_ERROR)
             if entry.address.startswith('/dev/'):
-                self._usb_status_indicator.setStyleSheet("color: #FF3B30; font-size: 20px;")
+                _set_style_state(self._usb_status_indicator, _STATUS_ERROR)
                 self._usb_status_text.setText("連接失敗")
-                self._usb_status_text.setStyleSheet("color: #FF3B30;")
+                self._usb_status_text.setStyleSheet(_CSS_TEXT_ERROR)
             return
         self._connected = True
         self._buffer.clear()
+        self._pending_emg.clear()  # 丟棄重置前排入的樣本，不混入新的緩衝區與基線
         self._packet_count = 0
-        import time
-        self._last_packet_time = time.time()
+        self._last_packet_time = monotonic()
+        self._emg_flush_timer.start()
         self._set_controls_enabled()
         
         # 連接成功：裝置為綠色
-        self._device_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+        _set_style_state(self._device_status_indicator, _STATUS_OK)
         if entry.address.startswith('/dev/'):
-            self._bt_status_indicator.setStyleSheet("color: #4CD964; font-size: 20px;")
+            _set_style_state(self._bt_status_indicator, _STATUS_OK)
         self._log(f"Connected to {entry.label}")
 
     @asyncSlot()
@@ -1116,16 +1318,28 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log(f"Error while disconnecting: {exc}")
         self._active_manager = None
         self._connected = False
+        self._emg_flush_timer.stop()
+        self._pending_emg.clear()
         self._packet_count = 0
         self._signal_strength = 0.0
+        self._activity_pending = False
         self._set_controls_enabled()
-        self._status_label.setText("Status: Disconnected")
+        self._pending_imu = None
+        self._pending_status = "Status: Disconnected"
         
-        # 重置所有指示器為灰色
-        self._bt_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
-        self._device_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
-        self._signal_status_indicator.setStyleSheet("color: gray; font-size: 20px;")
-        self._strength_label.setText("💪 訊號強度: --")
+        # 重置所有指示器為灰色（暫停重繪，所有變更合併成一次更新）
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            _set_style_state(self._bt_status_indicator, _STATUS_IDLE)
+            _set_style_state(self._device_status_indicator, _STATUS_IDLE)
+            self._signal_ok = None
+            _set_style_state(self._signal_status_indicator, _STATUS_IDLE)
+            if self._strength_key != (-1, -1):
+                self._strength_key = (-1, -1)
+                self._strength_label.setText("💪 訊號強度: --")
+        finally:
+            central.setUpdatesEnabled(True)
 
     # --------------------------------------------------------- 動作記錄 --
     def _on_record_clicked(self) -> None:
@@ -1160,30 +1374,18 @@ class MainWindow(QtWidgets.QMainWindow):
         # 開始記錄
         if self._motion_recorder.start_recording(gesture):
             self._recording = True
-            import time
-            self._recording_start_time = time.time()
+            self._recording_start_time = monotonic()
             
             # 更新 UI
             self._record_button.setText("■ 停止記錄")
-            self._record_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CD964;
-                    color: white;
-                    font-weight: bold;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #5AC8FA;
-                }
-            """)
+            _set_style_state(self._record_button, "recording")
             self._recording_status_label.setText(f"記錄中: {gesture}")
-            self._recording_status_label.setStyleSheet("color: #FF3B30; font-weight: bold;")
+            self._recording_status_label.setStyleSheet(_CSS_TEXT_ALERT)
             
             # 禁用其他控制
             self._gesture_combo.setEnabled(False)
             self._custom_label_input.setEnabled(False)
-            self._disconnect_button.setEnabled(False)
+            self._set_controls_enabled()
             
             # 如果啟用攝影機，自動開啟預覽視窗
             if self._motion_recorder.enable_camera:
@@ -1192,6 +1394,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._camera_preview = CameraPreviewWindow()
                 self._camera_preview.show()
                 self._camera_preview_button.setChecked(True)
+                self._camera_timer.start()
                 self._log("✅ 攝影機預覽已自動開啟")
             
             self._log(f"開始記錄動作: {gesture}")
@@ -1204,8 +1407,6 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         
         # 生成檔案名稱
-        import time
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         gesture = self._gesture_combo.currentText()
         if gesture == "custom":
@@ -1215,17 +1416,18 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # 停止記錄並儲存
         if self._motion_recorder.stop_recording(filename):
-            duration = time.time() - self._recording_start_time
+            duration = monotonic() - self._recording_start_time
             self._log(f"記錄完成: {filename} (時長: {duration:.2f}秒)")
             self._recording_status_label.setText(f"✓ 已儲存 ({duration:.1f}秒)")
-            self._recording_status_label.setStyleSheet("color: #4CD964; font-weight: bold;")
+            self._recording_status_label.setStyleSheet(_CSS_TEXT_OK)
         else:
             self._log("記錄儲存失敗")
             self._recording_status_label.setText("✗ 儲存失敗")
-            self._recording_status_label.setStyleSheet("color: #FF3B30; font-weight: bold;")
+            self._recording_status_label.setStyleSheet(_CSS_TEXT_ALERT)
         
         self._recording = False
         self._recording_time_label.setText("")
+        self._camera_timer.stop()
         
         # 關閉攝影機預覽視窗
         if self._camera_preview is not None and self._camera_preview.isVisible():
@@ -1234,23 +1436,12 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # 恢復 UI
         self._record_button.setText("● 開始記錄")
-        self._record_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF3B30;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #FF2D55;
-            }
-        """)
+        _set_style_state(self._record_button, "idle")
         
         self._gesture_combo.setEnabled(True)
         if self._gesture_combo.currentText() == "custom":
             self._custom_label_input.setEnabled(True)
-        self._disconnect_button.setEnabled(True)
+        self._set_controls_enabled()
     
     def _on_camera_preview_clicked(self, checked: bool) -> None:
         """處理攝影機預覽按鈕"""
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import platform
 
@@ -20,8 +24,25 @@ import qasync
 from emg_monitor.ui.main_window import MainWindow
 
 
+def _configure_debug_logging() -> None:
+    """Print DEBUG logs when EMG_DEBUG is set.
+
+    Records are queued and written to the terminal by a background thread,
+    so a slow terminal never stalls the Qt event loop."""
+    if not os.environ.get("EMG_DEBUG"):
+        return
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    logging.basicConfig(
+        level=logging.DEBUG, handlers=[logging.handlers.QueueHandler(records)]
+    )
+
+
 def run() -> None:
     """Launch the Qt application."""
+    _configure_debug_logging()
     # 不要在這裡設定 antialias，已在 main_window.py 設定
     app = QtWidgets.QApplication(sys.argv)
     loop = qasync.QEventLoop(app)
@@ -9,9 +9,45 @@ import subprocess
 import time
 import json
 import os
-from datetime import datetime
+import re
+import statistics
+import sys
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import psutil
+
+try:
+    import orjson  # 選用：有安裝時以 C 實作序列化 JSON
+except ImportError:
+    orjson = None
+
+# powermetrics gpu_power 輸出中的使用率 / 頻率 / 功耗，一次掃描全部擷取
+_GPU_RE = re.compile(
+    r"GPU HW active residency:\s*([\d.]+)%"
+    r"|GPU HW active frequency:\s*(\d+)"
+    r"|GPU Power:\s*(\d+)"
+)
+# Linux 上直接讀 /proc/<pid>/statm 的 RSS（以頁為單位）
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _dump_json(obj, path, indent=False):
+    """寫出 JSON；有 orjson 時使用 orjson，否則退回標準 json 模組"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    elif indent:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, separators=(',', ':'))
+
 
 class PerformanceProfiler:
     def __init__(self):
@@ -21,6 +57,20 @@ class PerformanceProfiler:
             "phase3_camera": []
         }
         self.pid = None
+        self.proc = None  # 目標進程的 psutil 物件（直接讀取系統資訊，不再 fork ps）
+        # Linux：常開的 /proc/<pid>/statm、stat 檔案描述符，每次採樣只需一次 pread
+        self._statm_fd = None
+        self._stat_fd = None
+        self._current_interval = 2  # 目前的採樣間隔（數據穩定時逐步拉長）
+        self.system_cpu = {}  # 各階段的系統整體 CPU 使用率（%，由 cpu_times 差值計算）
+        # 樣本只記錄距階段開始的 monotonic 奈秒數，需要時才換算成時間
+        self._phase_start_ns = time.monotonic_ns()
+        self._phase_wall = datetime.now()  # 目前階段開始的時間
+        self._phase_walls = {}  # 各階段開始的時間，儲存時換算 ISO 時間戳
+        # 常駐的 powermetrics 進程與背景讀取線程解析出的最新 GPU 數據
+        self._pm_proc = None
+        self._last_gpu = {}
+        self._gpu_lock = threading.Lock()
         self.output_dir = Path("performance_logs")
         self.output_dir.mkdir(exist_ok=True)
         
@@ -33,105 +83,142 @@ class PerformanceProfiler:
                 text=True
             )
             if result.stdout.strip():
-                self.pid = int(result.stdout.strip().split()[0])
+                pid = int(result.stdout.strip().split()[0])
+                if pid != self.pid or self.proc is None or not self.proc.is_running():
+                    self.pid = pid
+                    self.proc = psutil.Process(pid)
+                    self.proc.cpu_percent(interval=None)  # 第一次呼叫只建立計算基準
+                    self._open_proc_files(pid)
                 return True
             return False
         except:
             return False
     
+    def _close_proc_files(self):
+        """關閉 /proc 檔案描述符"""
+        for fd in (self._statm_fd, self._stat_fd):
+            if fd is not None:
+                os.close(fd)
+        self._statm_fd = self._stat_fd = None
+    
+    def _open_proc_files(self, pid):
+        """Linux 上開啟目標進程的 /proc 檔案；其他平台（macOS）維持使用 psutil"""
+        self._close_proc_files()
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            self._statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+            self._stat_fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+        except OSError:
+            self._close_proc_files()
+    
     def get_cpu_usage(self):
-        """取得 CPU 使用率"""
-        if not self.pid:
+        """取得 CPU 使用率（自上次呼叫以來的平均）"""
+        if not self.proc:
             return None
         try:
-            result = subprocess.run(
-                ["ps", "-p", str(self.pid), "-o", "%cpu"],
-                capture_output=True,
-                text=True
-            )
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                return float(lines[1].strip())
-        except:
+            return self.proc.cpu_percent(interval=None)
+        except psutil.Error:
             return None
     
     def get_memory_usage(self):
         """取得記憶體使用 (MB)"""
-        if not self.pid:
+        if not self.proc:
             return None
+        if self._statm_fd is not None:
+            try:
+                # statm 第二欄為常駐頁數；maxsplit 只切出需要的欄位
+                rss_pages = int(os.pread(self._statm_fd, 128, 0).split(maxsplit=2)[1])
+                return rss_pages * _PAGE_SIZE / (1024 * 1024)
+            except (OSError, IndexError, ValueError):
+                pass
         try:
-            result = subprocess.run(
-                ["ps", "-p", str(self.pid), "-o", "rss"],
-                capture_output=True,
-                text=True
-            )
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                kb = int(lines[1].strip())
-                return kb / 1024  # 轉換為 MB
-        except:
+            return self.proc.memory_info().rss / (1024 * 1024)  # 轉換為 MB
+        except psutil.Error:
             return None
     
     def get_thread_count(self):
         """取得線程數量"""
-        if not self.pid:
+        if not self.proc:
             return None
+        if self._stat_fd is not None:
+            try:
+                # 第 20 欄為線程數；進程名稱可能含空白，從最後一個 ')' 之後開始數（第 3 欄起）
+                tail = os.pread(self._stat_fd, 1024, 0).rsplit(b")", 1)[1]
+                return int(tail.split(maxsplit=18)[17])
+            except (OSError, IndexError, ValueError):
+                pass
         try:
-            result = subprocess.run(
-                ["ps", "-M", "-p", str(self.pid)],
-                capture_output=True,
-                text=True
-            )
-            # 計算線程數（排除標題行）
-            lines = result.stdout.strip().split('\n')
-            return len(lines) - 1 if len(lines) > 1 else 0
-        except:
+            return self.proc.num_threads()
+        except psutil.Error:
             return None
     
+    def _start_gpu_stream(self):
+        """啟動常駐的 powermetrics（每 500ms 輸出一次），由背景線程持續解析
+
+        sudo -n 不會提示輸入密碼：沒有免密權限時直接失敗，不會卡住終端機
+        """
+        self._pm_proc = subprocess.Popen(
+            ["sudo", "-n", "powermetrics", "--samplers", "gpu_power", "-i", "500"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        threading.Thread(target=self._read_gpu_stream, daemon=True).start()
+    
+    def _read_gpu_stream(self):
+        """逐行讀取 powermetrics 輸出，更新最新的 GPU 數據"""
+        for line in self._pm_proc.stdout:
+            match = _GPU_RE.search(line)
+            if not match:
+                continue
+            usage, freq, power = match.groups()
+            with self._gpu_lock:
+                if usage:
+                    self._last_gpu['usage'] = float(usage)
+                elif freq:
+                    self._last_gpu['frequency'] = int(freq)
+                else:
+                    self._last_gpu['power_mw'] = int(power)
+    
     def get_gpu_usage(self):
-        """取得 GPU 使用率（需要 sudo）"""
-        try:
-            result = subprocess.run(
-                ["sudo", "powermetrics", "--samplers", "gpu_power", "-i", "500", "-n", "1"],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            output = result.stdout
-            
-            # 解析 GPU 資訊
-            gpu_data = {}
-            for line in output.split('\n'):
-                if "GPU HW active residency:" in line:
-                    # 提取使用率百分比
-                    parts = line.split(':')
-                    if len(parts) > 1:
-                        usage_str = parts[1].strip().split()[0]
-                        gpu_data['usage'] = float(usage_str.rstrip('%'))
-                elif "GPU HW active frequency:" in line:
-                    parts = line.split(':')
-                    if len(parts) > 1:
-                        freq_str = parts[1].strip().split()[0]
-                        gpu_data['frequency'] = int(freq_str)
-                elif "GPU Power:" in line:
-                    parts = line.split(':')
-                    if len(parts) > 1:
-                        power_str = parts[1].strip().split()[0]
-                        gpu_data['power_mw'] = int(power_str)
-            
-            return gpu_data if gpu_data else None
-        except:
+        """取得 GPU 使用率（需要 sudo）
+        
+        第一次呼叫時啟動 powermetrics，之後只回傳背景線程解析出的最新數據；
+        剛啟動、尚未輸出時回傳 None；powermetrics 只存在於 macOS，其他平台一律回傳 None。
+        """
+        if sys.platform != "darwin":
             return None
+        if self._pm_proc is None:
+            try:
+                self._start_gpu_stream()
+            except OSError:
+                return None
+        with self._gpu_lock:
+            return dict(self._last_gpu) if self._last_gpu else None
+    
+    def close(self):
+        """結束常駐的 powermetrics 進程並關閉 /proc 檔案"""
+        self._close_proc_files()
+        if self._pm_proc is not None and self._pm_proc.poll() is None:
+            self._pm_proc.terminate()
+            try:
+                self._pm_proc.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                self._pm_proc.kill()
     
     def collect_sample(self):
         """收集一次效能數據"""
-        sample = {
-            "timestamp": datetime.now().isoformat(),
-            "cpu_percent": self.get_cpu_usage(),
-            "memory_mb": self.get_memory_usage(),
-            "threads": self.get_thread_count(),
-            "gpu": self.get_gpu_usage()
-        }
+        # oneshot 讓 CPU / 記憶體 / 線程數共用同一次系統資訊讀取
+        with self.proc.oneshot() if self.proc else nullcontext():
+            sample = {
+                "ts_ns": time.monotonic_ns() - self._phase_start_ns,
+                "cpu_percent": self.get_cpu_usage(),
+                "memory_mb": self.get_memory_usage(),
+                "threads": self.get_thread_count(),
+            }
+        sample["gpu"] = self.get_gpu_usage()  # GPU 與進程無關，不在 oneshot 內
         return sample
     
     def print_sample(self, sample, phase_name):
@@ -141,34 +228,90 @@ class PerformanceProfiler:
         threads = sample['threads']
         gpu = sample['gpu']
         
-        print(f"\n{'='*60}")
-        print(f"📊 階段：{phase_name}")
-        print(f"⏰ 時間：{sample['timestamp'].split('T')[1].split('.')[0]}")
-        print(f"{'='*60}")
-        print(f"🔥 CPU:     {cpu:.1f}%" if cpu else "🔥 CPU:     N/A")
-        print(f"💾 記憶體:  {mem:.1f} MB" if mem else "💾 記憶體:  N/A")
-        print(f"🧵 線程數:  {threads}" if threads else "🧵 線程數:  N/A")
+        # 以 is not None 判斷：0% CPU / 0 線程是有效數值，不應顯示成 N/A
+        cpu_str = f"{cpu:.1f}%" if cpu is not None else "N/A"
+        mem_str = f"{mem:.1f} MB" if mem is not None else "N/A"
+        threads_str = f"{threads}" if threads is not None else "N/A"
+        
+        sep = '=' * 60
+        lines = [
+            f"\n{sep}",
+            f"📊 階段：{phase_name}",
+            f"⏰ 時間：{self._sample_time(self._phase_wall, sample).strftime('%H:%M:%S')}",
+            sep,
+            f"🔥 CPU:     {cpu_str}",
+            f"💾 記憶體:  {mem_str}",
+            f"🧵 線程數:  {threads_str}",
+        ]
         
         if gpu:
-            print(f"🎮 GPU:")
-            print(f"   使用率:  {gpu.get('usage', 'N/A')}%")
-            print(f"   頻率:    {gpu.get('frequency', 'N/A')} MHz")
-            print(f"   功耗:    {gpu.get('power_mw', 'N/A')} mW")
+            lines += [
+                "🎮 GPU:",
+                f"   使用率:  {gpu.get('usage', 'N/A')}%",
+                f"   頻率:    {gpu.get('frequency', 'N/A')} MHz",
+                f"   功耗:    {gpu.get('power_mw', 'N/A')} mW",
+            ]
         else:
-            print(f"🎮 GPU:     需要 sudo 權限")
+            lines.append("🎮 GPU:     需要 sudo 權限")
+        
+        # 整段一次寫出
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    @staticmethod
+    def _sample_time(phase_wall, sample):
+        """由階段開始時間與樣本的奈秒偏移換算出樣本時間"""
+        return phase_wall + timedelta(microseconds=sample['ts_ns'] // 1000)
     
-    def monitor_phase(self, phase_name, phase_key, duration=30, interval=2):
-        """監控一個階段"""
+    def _raw_results(self):
+        """原始數據改回以 ISO 時間戳標記（每個樣本在儲存時才格式化一次）"""
+        raw = {}
+        for phase_key, samples in self.results.items():
+            phase_wall = self._phase_walls.get(phase_key)
+            raw[phase_key] = [
+                {
+                    "timestamp": self._sample_time(phase_wall, s).isoformat(),
+                    **{k: v for k, v in s.items() if k != 'ts_ns'},
+                }
+                for s in samples
+            ]
+        return raw
+    
+    @staticmethod
+    def _is_stable(samples):
+        """最近幾個樣本的 CPU（標準差 < 2 個百分點）與記憶體（< 2%）是否都穩定"""
+        cpu = [s['cpu_percent'] for s in samples if s['cpu_percent'] is not None]
+        mem = [s['memory_mb'] for s in samples if s['memory_mb'] is not None]
+        if len(cpu) < len(samples) or len(mem) < len(samples):
+            return False
+        mem_avg = statistics.fmean(mem)
+        return (
+            statistics.pstdev(cpu) < 2.0
+            and mem_avg > 0
+            and statistics.pstdev(mem) / mem_avg < 0.02
+        )
+    
+    def monitor_phase(self, phase_name, phase_key, duration=30, interval=2, max_interval=10.0):
+        """監控一個階段
+        
+        最近 3 個樣本都穩定時採樣間隔每次拉長 1.5 倍（最多 max_interval 秒），
+        一有明顯變化就回到 interval，變化期間仍保有原本的解析度。
+        """
         print(f"\n{'='*60}")
         print(f"🎯 開始監控：{phase_name}")
-        print(f"⏱️  持續時間：{duration} 秒，採樣間隔：{interval} 秒")
+        print(f"⏱️  持續時間：{duration} 秒，採樣間隔：{interval}~{max_interval} 秒")
         print(f"{'='*60}")
         
-        start_time = time.time()
+        end_time = time.monotonic() + duration  # 單調時鐘，不受系統校時影響
         sample_count = 0
+        self._current_interval = interval
+        sys_cpu_before = psutil.cpu_times()
+        self._phase_start_ns = time.monotonic_ns()
+        self._phase_wall = self._phase_walls[phase_key] = datetime.now()
+        next_sample = time.monotonic()  # 下一次採樣的預定時間（扣除採樣本身的耗時）
         
-        while time.time() - start_time < duration:
-            if not self.find_process():
+        while time.monotonic() < end_time:
+            # 已找到的進程仍在執行就直接沿用，只在結束後才重新 pgrep
+            if (self.proc is None or not self.proc.is_running()) and not self.find_process():
                 print("\n⚠️  找不到程式！請確認程式正在運行。")
                 return False
             
@@ -177,54 +320,61 @@ class PerformanceProfiler:
             self.print_sample(sample, phase_name)
             sample_count += 1
             
-            time.sleep(interval)
+            recent = self.results[phase_key][-3:]
+            if len(recent) == 3 and self._is_stable(recent):
+                self._current_interval = min(self._current_interval * 1.5, max_interval)
+            else:
+                self._current_interval = interval
+            # 以預定時間排程，採樣耗時不會累積成間隔漂移；落後時從現在重新起算
+            now = time.monotonic()
+            next_sample = max(next_sample + self._current_interval, now)
+            time.sleep(max(0, min(next_sample, end_time) - now))
         
+        self.system_cpu[phase_key] = self._busy_percent(sys_cpu_before, psutil.cpu_times())
         print(f"\n✅ {phase_name} 監控完成！共收集 {sample_count} 個樣本")
         return True
     
+    @staticmethod
+    def _busy_percent(before, after):
+        """兩次 psutil.cpu_times() 之間系統整體（所有核心平均）的忙碌比例"""
+        total = sum(after) - sum(before)
+        if total <= 0:
+            return None
+        idle = (after.idle - before.idle) + (
+            getattr(after, 'iowait', 0) - getattr(before, 'iowait', 0)
+        )
+        return 100 * (1 - idle / total)
+    
+    @staticmethod
+    def _summarize(values):
+        """一次向量化計算 min / max / avg；沒有數值時回傳 None"""
+        arr = np.fromiter(values, dtype=np.float64)
+        if not arr.size:
+            return None
+        return {
+            'min': float(arr.min()),
+            'max': float(arr.max()),
+            'avg': float(arr.mean()),
+            'samples': int(arr.size)
+        }
+    
     def calculate_stats(self, samples):
         """計算統計數據"""
         if not samples:
             return None
         
-        cpu_values = [s['cpu_percent'] for s in samples if s['cpu_percent'] is not None]
-        mem_values = [s['memory_mb'] for s in samples if s['memory_mb'] is not None]
-        thread_values = [s['threads'] for s in samples if s['threads'] is not None]
-        gpu_values = [s['gpu']['usage'] for s in samples if s['gpu'] and 'usage' in s['gpu']]
+        metrics = {
+            'cpu': (s['cpu_percent'] for s in samples if s['cpu_percent'] is not None),
+            'memory': (s['memory_mb'] for s in samples if s['memory_mb'] is not None),
+            'threads': (s['threads'] for s in samples if s['threads'] is not None),
+            'gpu': (s['gpu']['usage'] for s in samples if s['gpu'] and 'usage' in s['gpu']),
+        }
         
         stats = {}
-        
-        if cpu_values:
-            stats['cpu'] = {
-                'min': min(cpu_values),
-                'max': max(cpu_values),
-                'avg': sum(cpu_values) / len(cpu_values),
-                'samples': len(cpu_values)
-            }
-        
-        if mem_values:
-            stats['memory'] = {
-                'min': min(mem_values),
-                'max': max(mem_values),
-                'avg': sum(mem_values) / len(mem_values),
-                'samples': len(mem_values)
-            }
-        
-        if thread_values:
-            stats['threads'] = {
-                'min': min(thread_values),
-                'max': max(thread_values),
-                'avg': sum(thread_values) / len(thread_values),
-                'samples': len(thread_values)
-            }
-        
-        if gpu_values:
-            stats['gpu'] = {
-                'min': min(gpu_values),
-                'max': max(gpu_values),
-                'avg': sum(gpu_values) / len(gpu_values),
-                'samples': len(gpu_values)
-            }
+        for name, values in metrics.items():
+            summary = self._summarize(values)
+            if summary:
+                stats[name] = summary
         
         return stats
     
@@ -232,10 +382,9 @@ class PerformanceProfiler:
         """儲存結果"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # 儲存原始數據
+        # 儲存原始數據（樣本數與時間成正比，以緊湊格式寫出；統計與報告仍保持易讀）
         raw_file = self.output_dir / f"performance_raw_{timestamp}.json"
-        with open(raw_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        _dump_json(self._raw_results(), raw_file)
         
         # 計算並儲存統計數據
         stats = {
@@ -243,10 +392,13 @@ class PerformanceProfiler:
             "phase2_connected": self.calculate_stats(self.results['phase2_connected']),
             "phase3_camera": self.calculate_stats(self.results['phase3_camera'])
         }
+        for phase_key, phase_stats in stats.items():
+            busy = self.system_cpu.get(phase_key)
+            if phase_stats is not None and busy is not None:
+                phase_stats['system_cpu'] = {'avg': busy}
         
         stats_file = self.output_dir / f"performance_stats_{timestamp}.json"
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        _dump_json(stats, stats_file, indent=True)
         
         # 生成報告
         report_file = self.output_dir / f"performance_report_{timestamp}.md"
@@ -261,88 +413,91 @@ class PerformanceProfiler:
     
     def generate_report(self, stats, output_file):
         """生成分析報告"""
-        report = []
-        report.append("# EMG Monitor 效能分析報告\n")
-        report.append(f"生成時間：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        report.append("---\n\n")
+        # 直接逐段寫入檔案，不先在記憶體中組出整份報告
+        with open(output_file, 'w', encoding='utf-8') as f:
+            write = f.write
+            write("# EMG Monitor 效能分析報告\n")
+            write(f"生成時間：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            write("---\n\n")
         
-        phases = [
-            ("phase1_idle", "階段一：未連接（僅 UI）"),
-            ("phase2_connected", "階段二：已連接（接收 EMG）"),
-            ("phase3_camera", "階段三：攝影機運作")
-        ]
+            phases = [
+                ("phase1_idle", "階段一：未連接（僅 UI）"),
+                ("phase2_connected", "階段二：已連接（接收 EMG）"),
+                ("phase3_camera", "階段三：攝影機運作")
+            ]
         
-        for phase_key, phase_name in phases:
-            report.append(f"## {phase_name}\n\n")
+            for phase_key, phase_name in phases:
+                write(f"## {phase_name}\n\n")
             
-            if stats[phase_key]:
-                s = stats[phase_key]
+                if stats[phase_key]:
+                    s = stats[phase_key]
                 
-                if 'cpu' in s:
-                    report.append(f"### 🔥 CPU 使用率\n")
-                    report.append(f"- 最小值：{s['cpu']['min']:.1f}%\n")
-                    report.append(f"- 最大值：{s['cpu']['max']:.1f}%\n")
-                    report.append(f"- 平均值：{s['cpu']['avg']:.1f}%\n\n")
+                    if 'cpu' in s:
+                        write(f"### 🔥 CPU 使用率\n")
+                        write(f"- 最小值：{s['cpu']['min']:.1f}%\n")
+                        write(f"- 最大值：{s['cpu']['max']:.1f}%\n")
+                        write(f"- 平均值：{s['cpu']['avg']:.1f}%\n\n")
                 
-                if 'memory' in s:
-                    report.append(f"### 💾 記憶體使用\n")
-                    report.append(f"- 最小值：{s['memory']['min']:.1f} MB\n")
-                    report.append(f"- 最大值：{s['memory']['max']:.1f} MB\n")
-                    report.append(f"- 平均值：{s['memory']['avg']:.1f} MB\n\n")
+                    if 'memory' in s:
+                        write(f"### 💾 記憶體使用\n")
+                        write(f"- 最小值：{s['memory']['min']:.1f} MB\n")
+                        write(f"- 最大值：{s['memory']['max']:.1f} MB\n")
+                        write(f"- 平均值：{s['memory']['avg']:.1f} MB\n\n")
                 
-                if 'threads' in s:
-                    report.append(f"### 🧵 線程數量\n")
-                    report.append(f"- 最小值：{int(s['threads']['min'])}\n")
-                    report.append(f"- 最大值：{int(s['threads']['max'])}\n")
-                    report.append(f"- 平均值：{s['threads']['avg']:.1f}\n\n")
+                    if 'threads' in s:
+                        write(f"### 🧵 線程數量\n")
+                        write(f"- 最小值：{int(s['threads']['min'])}\n")
+                        write(f"- 最大值：{int(s['threads']['max'])}\n")
+                        write(f"- 平均值：{s['threads']['avg']:.1f}\n\n")
                 
-                if 'gpu' in s:
-                    report.append(f"### 🎮 GPU 使用率\n")
-                    report.append(f"- 最小值：{s['gpu']['min']:.1f}%\n")
-                    report.append(f"- 最大值：{s['gpu']['max']:.1f}%\n")
-                    report.append(f"- 平均值：{s['gpu']['avg']:.1f}%\n\n")
-            else:
-                report.append("無數據\n\n")
+                    if 'gpu' in s:
+                        write(f"### 🎮 GPU 使用率\n")
+                        write(f"- 最小值：{s['gpu']['min']:.1f}%\n")
+                        write(f"- 最大值：{s['gpu']['max']:.1f}%\n")
+                        write(f"- 平均值：{s['gpu']['avg']:.1f}%\n\n")
+                    
+                    if 'system_cpu' in s:
+                        write(f"### 🖥️ 系統整體 CPU（所有核心平均）\n")
+                        write(f"- 平均值：{s['system_cpu']['avg']:.1f}%\n\n")
+                else:
+                    write("無數據\n\n")
             
-            report.append("---\n\n")
+                write("---\n\n")
         
-        # 比較分析
-        report.append("## 📈 階段比較\n\n")
+            # 比較分析
+            write("## 📈 階段比較\n\n")
         
-        if all(stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
-            report.append("| 指標 | 未連接 | 已連接 | 攝影機 | 增幅 |\n")
-            report.append("|------|--------|--------|--------|------|\n")
+            if all(stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
+                write("| 指標 | 未連接 | 已連接 | 攝影機 | 增幅 |\n")
+                write("|------|--------|--------|--------|------|\n")
             
-            # CPU
-            if all('cpu' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
-                idle_cpu = stats['phase1_idle']['cpu']['avg']
-                conn_cpu = stats['phase2_connected']['cpu']['avg']
-                cam_cpu = stats['phase3_camera']['cpu']['avg']
-                increase = ((cam_cpu - idle_cpu) / idle_cpu * 100) if idle_cpu > 0 else 0
-                report.append(f"| CPU (%) | {idle_cpu:.1f} | {conn_cpu:.1f} | {cam_cpu:.1f} | +{increase:.0f}% |\n")
+                # CPU
+                if all('cpu' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
+                    idle_cpu = stats['phase1_idle']['cpu']['avg']
+                    conn_cpu = stats['phase2_connected']['cpu']['avg']
+                    cam_cpu = stats['phase3_camera']['cpu']['avg']
+                    increase = ((cam_cpu - idle_cpu) / idle_cpu * 100) if idle_cpu > 0 else 0
+                    write(f"| CPU (%) | {idle_cpu:.1f} | {conn_cpu:.1f} | {cam_cpu:.1f} | +{increase:.0f}% |\n")
             
-            # 記憶體
-            if all('memory' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
-                idle_mem = stats['phase1_idle']['memory']['avg']
-                conn_mem = stats['phase2_connected']['memory']['avg']
-                cam_mem = stats['phase3_camera']['memory']['avg']
-                increase = ((cam_mem - idle_mem) / idle_mem * 100) if idle_mem > 0 else 0
-                report.append(f"| 記憶體 (MB) | {idle_mem:.0f} | {conn_mem:.0f} | {cam_mem:.0f} | +{increase:.0f}% |\n")
+                # 記憶體
+                if all('memory' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
+                    idle_mem = stats['phase1_idle']['memory']['avg']
+                    conn_mem = stats['phase2_connected']['memory']['avg']
+                    cam_mem = stats['phase3_camera']['memory']['avg']
+                    increase = ((cam_mem - idle_mem) / idle_mem * 100) if idle_mem > 0 else 0
+                    write(f"| 記憶體 (MB) | {idle_mem:.0f} | {conn_mem:.0f} | {cam_mem:.0f} | +{increase:.0f}% |\n")
             
-            # GPU
-            if all('gpu' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
-                idle_gpu = stats['phase1_idle']['gpu']['avg']
-                conn_gpu = stats['phase2_connected']['gpu']['avg']
-                cam_gpu = stats['phase3_camera']['gpu']['avg']
-                increase = cam_gpu - idle_gpu
-                report.append(f"| GPU (%) | {idle_gpu:.1f} | {conn_gpu:.1f} | {cam_gpu:.1f} | +{increase:.1f}% |\n")
+                # GPU
+                if all('gpu' in stats[p] for p in ['phase1_idle', 'phase2_connected', 'phase3_camera']):
+                    idle_gpu = stats['phase1_idle']['gpu']['avg']
+                    conn_gpu = stats['phase2_connected']['gpu']['avg']
+                    cam_gpu = stats['phase3_camera']['gpu']['avg']
+                    increase = cam_gpu - idle_gpu
+                    write(f"| GPU (%) | {idle_gpu:.1f} | {conn_gpu:.1f} | {cam_gpu:.1f} | +{increase:.1f}% |\n")
         
-        report.append("\n---\n\n")
-        report.append("## 🎯 優化建議\n\n")
-        report.append("根據以上數據分析，建議關注以下方面：\n\n")
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(''.join(report))
+            write("\n---\n\n")
+            write("## 🎯 優化建議\n\n")
+            write("根據以上數據分析，建議關注以下方面：\n\n")
 
 
 def main():
@@ -363,34 +518,37 @@ def main():
 ╚═══════════════════════════════════════════════════════════╝
 """)
     
-    input("\n請先啟動程式（python main.py），啟動後按 Enter 繼續...")
+    try:
+        input("\n請先啟動程式（python main.py），啟動後按 Enter 繼續...")
     
-    # 階段一：未連接
-    input("\n【階段一】程式應處於「未連接」狀態，按 Enter 開始監控（15秒）...")
-    if not profiler.monitor_phase("階段一：未連接", "phase1_idle", duration=15, interval=2):
-        print("❌ 監控失敗")
-        return
+        # 階段一：未連接
+        input("\n【階段一】程式應處於「未連接」狀態，按 Enter 開始監控（15秒）...")
+        if not profiler.monitor_phase("階段一：未連接", "phase1_idle", duration=15, interval=2):
+            print("❌ 監控失敗")
+            return
     
-    # 階段二：已連接
-    input("\n【階段二】請連接 EMG 裝置，等待資料穩定後按 Enter 開始監控（15秒）...")
-    if not profiler.monitor_phase("階段二：已連接", "phase2_connected", duration=15, interval=2):
-        print("❌ 監控失敗")
-        return
+        # 階段二：已連接
+        input("\n【階段二】請連接 EMG 裝置，等待資料穩定後按 Enter 開始監控（15秒）...")
+        if not profiler.monitor_phase("階段二：已連接", "phase2_connected", duration=15, interval=2):
+            print("❌ 監控失敗")
+            return
     
-    # 階段三：攝影機
-    input("\n【階段三】請開啟攝影機，等待預覽視窗出現後按 Enter 開始監控（15秒）...")
-    if not profiler.monitor_phase("階段三：攝影機", "phase3_camera", duration=15, interval=2):
-        print("❌ 監控失敗")
-        return
+        # 階段三：攝影機
+        input("\n【階段三】請開啟攝影機，等待預覽視窗出現後按 Enter 開始監控（15秒）...")
+        if not profiler.monitor_phase("階段三：攝影機", "phase3_camera", duration=15, interval=2):
+            print("❌ 監控失敗")
+            return
     
-    # 儲存結果
-    profiler.save_results()
+        # 儲存結果
+        profiler.save_results()
     
-    print("\n✅ 效能分析完成！")
-    print("\n下一步：")
-    print("1. 查看 performance_logs/ 目錄中的報告")
-    print("2. 根據數據找出效能瓶頸")
-    print("3. 針對性優化程式碼")
+        print("\n✅ 效能分析完成！")
+        print("\n下一步：")
+        print("1. 查看 performance_logs/ 目錄中的報告")
+        print("2. 根據數據找出效能瓶頸")
+        print("3. 針對性優化程式碼")
+    finally:
+        profiler.close()  # 結束常駐的 powermetrics
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ import serial
 import time
 import struct
 
+import numpy as np
+
 PORT = '/dev/cu.usbserial-0001'
 BAUDRATE = 9600
 
@@ -15,22 +17,21 @@ def read_and_display(duration=10):
     print("開始讀取資料...")
     print("假設：每個 byte 代表一個 EMG 樣本值")
     
-    start_time = time.time()
+    end_time = time.monotonic() + duration
     sample_count = 0
     
-    while time.time() - start_time < duration:
-        if ser.in_waiting > 0:
-            data = ser.read(ser.in_waiting)
+    while time.monotonic() < end_time:
+        # 阻塞等待至少 1 byte（最多 timeout 秒），再一次取走緩衝區中已有的資料
+        data = ser.read(max(1, ser.in_waiting))
+        if data:
+            # 整批 byte 直接視為有符號整數 (-128 to 127，二補數)
+            values = np.frombuffer(data, dtype=np.int8)
+            first = sample_count
+            sample_count += values.size
             
-            for byte in data:
-                # 將 byte 轉換為有符號整數 (-128 to 127)
-                signed_value = byte - 128 if byte > 127 else byte
-                sample_count += 1
-                
-                if sample_count % 100 == 0:
-                    print(f"樣本 {sample_count}: {signed_value} (原始: 0x{byte:02x})")
-        
-        time.sleep(0.01)
+            # 只顯示編號為 100 倍數的樣本
+            for idx in range((99 - first) % 100, values.size, 100):
+                print(f"樣本 {first + idx + 1}: {values[idx]} (原始: 0x{data[idx]:02x})")
     
     ser.close()
     print(f"\n共收到 {sample_count} 個樣本")
@@ -6,10 +6,17 @@ import time
 import sys
 
 PORT = '/dev/cu.usbserial-0001'
-BAUDRATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+# 依可能性排序：WL-EMG 接收器使用 921600，其次是最常見的 115200 / 9600
+BAUDRATES = [921600, 115200, 9600, 19200, 38400, 57600, 230400, 460800]
+# 收到超過這個位元組數就判定此鮑率有資料，不必等到探測時間結束
+PROBE_BYTES = 16
 
 def test_baudrate(port, baudrate, timeout=5):
-    """測試特定鮑率"""
+    """測試特定鮑率（收到足夠資料即提前結束）
+    
+    回傳 True / False 表示是否收到資料；序列埠無法開啟時回傳 None，
+    此時換其他鮑率也一樣打不開，呼叫端應直接停止掃描。
+    """
     print(f"\n測試鮑率: {baudrate}")
     try:
         ser = serial.Serial(
@@ -18,20 +25,26 @@ def test_baudrate(port, baudrate, timeout=5):
             bytesize=serial.EIGHTBITS,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
-            timeout=1.0
+            timeout=min(1.0, timeout)
         )
-        
+    except serial.SerialException as e:
+        print(f"✗ 無法開啟序列埠: {e}")
+        return None
+    
+    try:
         print(f"✓ 序列埠已開啟")
         
-        start_time = time.time()
+        end_time = time.monotonic() + timeout
         total_bytes = 0
         
-        while time.time() - start_time < timeout:
-            if ser.in_waiting > 0:
-                data = ser.read(ser.in_waiting)
+        while time.monotonic() < end_time:
+            # 阻塞等待至少 1 byte（最多 1 秒且不超過探測時間），再一次取走緩衝區中已有的資料
+            data = ser.read(max(1, ser.in_waiting))
+            if data:
                 total_bytes += len(data)
                 print(f"  收到 {len(data)} bytes: {data[:20].hex()}..." if len(data) > 20 else f"  收到 {len(data)} bytes: {data.hex()}")
-            time.sleep(0.1)
+                if total_bytes > PROBE_BYTES:
+                    break
         
         ser.close()
         
@@ -58,7 +71,11 @@ if __name__ == '__main__':
     input("按 Enter 開始測試...")
     
     for baudrate in BAUDRATES:
-        if test_baudrate(PORT, baudrate, timeout=3):
+        result = test_baudrate(PORT, baudrate, timeout=0.5)
+        if result is None:
+            print(f"\n✗ 無法開啟 {PORT}，請確認接收器已插入且序列埠名稱正確")
+            sys.exit(1)
+        if result:
             print(f"\n✓✓✓ 找到正確的鮑率: {baudrate} ✓✓✓")
             sys.exit(0)
     
@@ -0,0 +1,32 @@
+"""Tests for the EMG ring buffers.
+
+Run from the repository root with ``python -m unittest discover -s tests -t .``.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from emg_monitor.buffers import EmgRingBuffer
+
+
+class EmgRingBufferTest(unittest.TestCase):
+    def test_snapshot_orders_oldest_to_newest(self) -> None:
+        buffer = EmgRingBuffer(2, 4)
+        for k in range(6):
+            buffer.append(np.array([k, -k], dtype=np.float32))
+        np.testing.assert_array_equal(buffer.snapshot()[0], [2, 3, 4, 5])
+        self.assertEqual(buffer.write_seq, 6)
+        self.assertIsNone(buffer.snapshot_if_new(6))
+
+    def test_append_rejects_wrong_shape(self) -> None:
+        buffer = EmgRingBuffer(2, 4)
+        with self.assertRaises(ValueError):
+            buffer.append(np.zeros(3, dtype=np.float32))
+        self.assertEqual(buffer.write_seq, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for packet framing and block EMG decoding.
+
+Run from the repository root with ``python -m unittest discover -s tests -t .``.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from emg_monitor import data_parser, framing
+from emg_monitor.data_parser import HEADER, PAYLOAD_LENGTH
+
+
+def _emg_packet(sequence: int, channels: list[int]) -> bytes:
+    """Build one EMG packet carrying the given signed 24-bit channel values."""
+    body = b"".join((v & 0xFFFFFF).to_bytes(3, "big") for v in channels)
+    return HEADER + bytes([0xAA, sequence]) + body
+
+
+def _channels(sequence: int) -> list[int]:
+    return [sequence * 10 + ch for ch in range(data_parser.EMG_CHANNELS)]
+
+
+class DrainTest(unittest.TestCase):
+    def test_back_to_back_packets(self) -> None:
+        buf = bytearray(b"".join(_emg_packet(k, _channels(k)) for k in range(4)))
+        head, offsets = framing.drain(buf, 0, len(buf))
+        self.assertEqual(head, len(buf))
+        np.testing.assert_array_equal(offsets, np.arange(4) * PAYLOAD_LENGTH)
+
+    def test_resync_after_garbage(self) -> None:
+        first = _emg_packet(1, _channels(1))
+        second = _emg_packet(2, _channels(2))
+        # Garbage before the first packet and between the two, including a
+        # lone header byte that must not be taken for a packet start.
+        buf = bytearray(b"\x00\x17" + first + b"\xd2\x55\x01" + second)
+        head, offsets = framing.drain(buf, 0, len(buf))
+        self.assertEqual(head, len(buf))
+        np.testing.assert_array_equal(offsets, [2, 2 + PAYLOAD_LENGTH + 3])
+
+    def test_packet_split_across_tail(self) -> None:
+        first = _emg_packet(1, _channels(1))
+        second = _emg_packet(2, _channels(2))
+        buf = bytearray(first + second)
+        split = PAYLOAD_LENGTH + 10
+        head, offsets = framing.drain(buf, 0, split)
+        np.testing.assert_array_equal(offsets, [0])
+        # Framing resumes at the partial packet once the rest has arrived.
+        self.assertEqual(head, PAYLOAD_LENGTH)
+        head, offsets = framing.drain(buf, head, len(buf))
+        self.assertEqual(head, len(buf))
+        np.testing.assert_array_equal(offsets, [PAYLOAD_LENGTH])
+
+    def test_header_straddling_tail_is_kept(self) -> None:
+        packet = _emg_packet(1, _channels(1))
+        buf = bytearray(b"\x00" * 40 + packet)
+        # The read ends two bytes into the header.
+        head, offsets = framing.drain(buf, 0, 42)
+        self.assertEqual(offsets.size, 0)
+        self.assertLessEqual(head, 40)
+        head, offsets = framing.drain(buf, head, len(buf))
+        np.testing.assert_array_equal(offsets, [40])
+
+
+class DecodeEmgBlockTest(unittest.TestCase):
+    def test_negative_24_bit_values(self) -> None:
+        values = [-1, -(1 << 23), (1 << 23) - 1, 0, 1, -2, 123456, -123456]
+        packets = np.frombuffer(_emg_packet(0, values), dtype=np.uint8)
+        decoded = data_parser.decode_emg_block(packets.reshape(1, -1))
+        self.assertEqual(decoded.dtype, np.int32)
+        np.testing.assert_array_equal(decoded, [values])
+
+    def test_parse_packet_matches_block_decoding(self) -> None:
+        values = [-1, -(1 << 23), (1 << 23) - 1, 0, 1, -2, 123456, -123456]
+        sample = data_parser.parse_packet(memoryview(_emg_packet(7, values)))
+        self.assertEqual(sample.sequence, 7)
+        self.assertEqual(sample.channels_uv.dtype, np.float32)
+        np.testing.assert_array_equal(sample.channels_uv, values)
+
+    def test_contiguous_gather_is_a_view(self) -> None:
+        buf = bytearray(b"".join(_emg_packet(k, _channels(k)) for k in range(3)))
+        _, offsets = framing.drain(buf, 0, len(buf))
+        block = data_parser.gather_packets(buf, offsets)
+        self.assertFalse(block.flags.owndata)
+        np.testing.assert_array_equal(
+            data_parser.decode_emg_block(block), [_channels(k) for k in range(3)]
+        )
+
+    def test_non_contiguous_gather(self) -> None:
+        packets = [
+            _emg_packet(k, _channels(k) if k % 2 else [-k] * 8) for k in range(3)
+        ]
+        buf = bytearray(packets[0] + b"\x01\x02" + packets[1] + b"\x7f" + packets[2])
+        _, offsets = framing.drain(buf, 0, len(buf))
+        block = data_parser.gather_packets(buf, offsets)
+        self.assertEqual(block.shape, (3, PAYLOAD_LENGTH))
+        np.testing.assert_array_equal(block[:, 4], [0, 1, 2])
+        np.testing.assert_array_equal(
+            data_parser.decode_emg_block(block),
+            [[0] * 8, _channels(1), [-2] * 8],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()